@@ -1,20 +1,44 @@
 """Executor agent for executing planned steps."""
 
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import asyncio
+import random
+import re
+import time
 from pydantic import ValidationError
 from app.schemas.request_response import ExecutionStep
-from app.tools.base import tool_registry
+from app.tools.base import BaseTool, ToolOutput, tool_registry, validate_tool_input
 from app.memory.schemas import ExecutionStep as MemoryExecutionStep, ExecutionContext
+from app.core.config import settings
 from app.core.logging import logger
+from app.core.serialization import dumps
+
+_PLACEHOLDER_PATTERN = re.compile(r'\{([^}]+)\}')
+
+# HTTP methods that are safe to run out of order with neighbouring steps.
+_PARALLEL_HTTP_METHODS = frozenset({"GET", "HEAD"})
+
+# Transient failures worth backing off for: rate limits, upstream 5xx, timeouts, network blips.
+_RETRYABLE_ERROR_PATTERN = re.compile(
+    r"\b(?:429|5\d\d)\b|timed?[ -]?out|rate[ -]?limit|resource[ _]exhausted|"
+    r"temporarily unavailable|connection (?:reset|refused|error|aborted)",
+    re.IGNORECASE,
+)
+
+StepEventCallback = Optional[Callable[[Dict[str, Any]], None]]
 
 
 class ExecutorAgent:
     """
     Agent responsible for executing planned steps.
     
-    Takes a list of ExecutionStep objects and executes them sequentially,
+    Takes a list of ExecutionStep objects and executes them in order,
     managing tool invocations, error handling, and state tracking.
+    Consecutive independent HTTP fetches may run concurrently.
     """
+
+    # Upper bound on tool calls in flight within one parallel wave.
+    MAX_PARALLEL_STEPS = settings.TOOL_CONCURRENCY_LIMIT
     
     def __init__(self):
         self.tool_registry = tool_registry
@@ -25,10 +49,13 @@ class ExecutorAgent:
         steps: List[ExecutionStep],
         execution_context: ExecutionContext,
         max_retries: int = 3,
-        step_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        step_callback: StepEventCallback = None,
     ) -> ExecutionContext:
         """
         Execute a list of planned steps.
+
+        Plans with consecutive independent HTTP fetches are dispatched to
+        execute_async when no event loop is running in this thread.
         
         Args:
             steps: List of ExecutionStep objects to execute
@@ -38,180 +65,529 @@ class ExecutorAgent:
         Returns:
             Updated ExecutionContext with results
         """
-        logger.info(f"Starting execution of {len(steps)} steps")
+        if self.has_parallel_steps(steps) and not self._event_loop_running():
+            return asyncio.run(
+                self.execute_async(steps, execution_context, max_retries, step_callback)
+            )
+
+        logger.info("Starting execution of %d steps", len(steps))
         
         for step in steps:
-            self._emit_step_event(step_callback, {
-                "type": "step_started",
-                "step_number": step.step_number,
-                "description": step.description,
-                "tool_name": step.tool_name.lower(),
-            })
+            if not self._execute_step(step, execution_context, step_callback):
+                return execution_context  # Stop immediately on tool failure
+        
+        self._complete_execution(execution_context)
+        return execution_context
+
+    async def execute_async(
+        self,
+        steps: List[ExecutionStep],
+        execution_context: ExecutionContext,
+        max_retries: int = 3,
+        step_callback: StepEventCallback = None,
+    ) -> ExecutionContext:
+        """
+        Execute steps in dependency waves, running independent steps concurrently.
+
+        Steps that read from or write to shared state run alone; consecutive
+        independent steps are gathered together, at most MAX_PARALLEL_STEPS at
+        a time per run. Blocking tool calls run in the loop's default executor
+        and backoff waits on the loop, while execution context updates stay
+        on the event loop so the audit trail is recorded in plan order.
+        """
+        logger.info("Starting async execution of %d steps", len(steps))
+        semaphore = asyncio.Semaphore(self.MAX_PARALLEL_STEPS)
+
+        for wave in self.build_waves(steps):
+            should_continue = await self._execute_wave(
+                wave,
+                execution_context,
+                step_callback,
+                semaphore,
+            )
+            if not should_continue:
+                return execution_context  # Stop immediately on tool failure
+
+        self._complete_execution(execution_context)
+        return execution_context
+
+    def build_waves(self, steps: List[ExecutionStep]) -> List[List[ExecutionStep]]:
+        """Group consecutive independent steps; every other step is its own wave."""
+        waves: List[List[ExecutionStep]] = []
+        current: List[ExecutionStep] = []
+        for step in steps:
+            if self._is_independent_step(step):
+                current.append(step)
+                continue
+            if current:
+                waves.append(current)
+                current = []
+            waves.append([step])
+        if current:
+            waves.append(current)
+        return waves
+
+    def has_parallel_steps(self, steps: List[ExecutionStep]) -> bool:
+        """Return True when at least two steps can run concurrently."""
+        if self.MAX_PARALLEL_STEPS <= 1:
+            return False
+        return any(len(wave) > 1 for wave in self.build_waves(steps))
+
+    def _is_independent_step(self, step: ExecutionStep) -> bool:
+        """Return True for side-effect free steps that read no prior outputs.
+
+        Only HTTP GET/HEAD requests without placeholders qualify. Reasoning and
+        memory steps consume earlier outputs or shared state, so they act as
+        barriers between waves.
+        """
+        if step.tool_name.lower() != "http":
+            return False
+
+        input_data = step.input_data or {}
+        method = str(input_data.get("method") or "GET").upper()
+        if method not in _PARALLEL_HTTP_METHODS:
+            return False
+
+        for value in input_data.values():
+            if isinstance(value, str) and _PLACEHOLDER_PATTERN.search(value):
+                return False
+            if isinstance(value, dict) and any(
+                isinstance(nested, str) and _PLACEHOLDER_PATTERN.search(nested)
+                for nested in value.values()
+            ):
+                return False
+        return True
+
+    def _event_loop_running(self) -> bool:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return True
+
+    def _execute_step(
+        self,
+        step: ExecutionStep,
+        execution_context: ExecutionContext,
+        step_callback: StepEventCallback,
+    ) -> bool:
+        """Run one step with retries. Returns False when execution must stop."""
+        tool_name = step.tool_name.lower()
+        self._emit_step_started(step, tool_name, step_callback)
+
+        prepared = self._prepare_step(step, tool_name, execution_context)
+        if prepared is None:
+            return False
+        tool, max_attempts_for_tool, last_error = prepared
+
+        success = False
+        retry_count = 0
+        while not success and retry_count < max_attempts_for_tool:
+            result = None
+            try:
+                logger.debug("Executing step %s: %s", step.step_number, step.description)
+                resolved_input = self._resolve_step_input(step, tool_name, execution_context)
+
+                # Execute the tool
+                result = self._invoke_tool(tool, tool_name, resolved_input, execution_context)
+                success, last_error = self._record_attempt(
+                    step,
+                    tool_name,
+                    resolved_input,
+                    result,
+                    execution_context,
+                    step_callback,
+                    retry_count,
+                )
+            except Exception as e:
+                last_error = str(e)
+                logger.error("Step %s error: %s", step.step_number, last_error)
+
+            if not success:
+                retry_count += 1
+                if retry_count < max_attempts_for_tool:
+                    delay = self._retry_delay(retry_count, last_error, result)
+                    if delay:
+                        time.sleep(delay)
+
+        if success:
+            return True
+        return self._handle_step_failure(step, tool_name, last_error, execution_context, step_callback)
+
+    async def _execute_wave(
+        self,
+        wave: List[ExecutionStep],
+        execution_context: ExecutionContext,
+        step_callback: StepEventCallback,
+        semaphore: asyncio.Semaphore,
+    ) -> bool:
+        """Run a wave's steps concurrently, then record them in plan order."""
+        prepared_steps = []
+        for step in wave:
+            tool_name = step.tool_name.lower()
+            self._emit_step_started(step, tool_name, step_callback)
+            prepared = self._prepare_step(step, tool_name, execution_context)
+            if prepared is None:
+                return False
+            prepared_steps.append((step, tool_name, prepared))
+
+        outcomes = await asyncio.gather(*[
+            self._run_attempts_async(step, tool_name, tool, max_attempts, execution_context, semaphore)
+            for step, tool_name, (tool, max_attempts, _) in prepared_steps
+        ])
+
+        for (step, tool_name, (_, _, last_error)), attempts in zip(prepared_steps, outcomes):
             success = False
-            retry_count = 0
-            last_error = None
-            max_attempts_for_tool = self._get_max_attempts(step.tool_name)
-            
-            while not success and retry_count < max_attempts_for_tool:
-                try:
-                    logger.debug(f"Executing step {step.step_number}: {step.description}")
-                    
-                    # Get the tool (case-insensitive lookup)
-                    tool_name = step.tool_name.lower()
-                    tool = self.tool_registry.get(tool_name)
-                    if not tool:
-                        raise ValueError(f"Tool '{step.tool_name}' not found in registry")
-
-                    try:
-                        tool.input_schema.model_validate(step.input_data or {})
-                    except ValidationError as exc:
-                        error_msg = f"Invalid tool input for '{tool_name}': {exc}"
-                        logger.error(error_msg)
-                        execution_context.fail(error_msg)
-                        return execution_context
-                    
-                    # Resolve memory variables before tool execution
-                    resolved_input = self._resolve_memory_variables(
-                        step.input_data or {},
-                        execution_context,
+            for retry_count, resolved_input, outcome in attempts:
+                if isinstance(outcome, ToolOutput):
+                    success, last_error = self._record_attempt(
+                        step,
                         tool_name,
+                        resolved_input,
+                        outcome,
+                        execution_context,
+                        step_callback,
+                        retry_count,
                     )
-                    
-                    # GROUNDING: If this is a reasoning step, enrich context with previous tool outputs
-                    if tool_name == "reasoning":
-                        resolved_input = self._enrich_reasoning_context(
-                            resolved_input,
-                            execution_context,
-                            step.step_number
+                else:
+                    last_error = outcome
+
+            if not success and not self._handle_step_failure(
+                step, tool_name, last_error, execution_context, step_callback
+            ):
+                return False
+
+        return True
+
+    async def _run_attempts_async(
+        self,
+        step: ExecutionStep,
+        tool_name: str,
+        tool: BaseTool,
+        max_attempts: int,
+        execution_context: ExecutionContext,
+        semaphore: asyncio.Semaphore,
+    ) -> List[Tuple[int, Optional[Dict[str, Any]], Any]]:
+        """Run a step's attempts off the event loop without touching context state.
+
+        Only the tool call holds the semaphore; backoff sleeps release it.
+        Returns (attempt, resolved_input, ToolOutput or error string) tuples.
+        """
+        attempts: List[Tuple[int, Optional[Dict[str, Any]], Any]] = []
+        for attempt in range(max_attempts):
+            try:
+                resolved_input = self._resolve_step_input(step, tool_name, execution_context)
+                async with semaphore:
+                    if isinstance(tool, BaseTool) and tool.has_native_async:
+                        result = await self._ainvoke_tool(
+                            tool, tool_name, resolved_input, execution_context
                         )
-                    
-                    logger.debug(f"Resolved input for {tool_name}: {resolved_input}")
-                    
-                    # Execute the tool
-                    result = tool.execute(**resolved_input)
-                    
-                    # Record the step execution
-                    memory_step = MemoryExecutionStep(
-                        step_number=step.step_number,
-                        description=step.description,
-                        tool_name=tool_name,
-                        input_data=resolved_input,  # Use resolved input for audit trail
-                        output=result.result,
-                        success=result.success,
-                        error=result.error,
-                    )
-                    execution_context.add_step(memory_step)
-                    
-                    # Store intermediate output
-                    execution_context.set_output(
-                        step.step_number,
-                        result.result,
-                        key=tool_name
-                    )
-                    
-                    if result.success:
-                        logger.info(f"Step {step.step_number} succeeded")
-                        self._emit_step_event(step_callback, {
-                            "type": "step_completed",
-                            "step_number": step.step_number,
-                            "description": step.description,
-                            "tool_name": tool_name,
-                            "success": True,
-                        })
-                        success = True
                     else:
-                        last_error = result.error or "Tool returned no error details"
-                        logger.warning(f"Step {step.step_number} failed: {result.error}")
-                        self._emit_step_event(step_callback, {
-                            "type": "step_retry",
-                            "step_number": step.step_number,
-                            "description": step.description,
-                            "tool_name": tool_name,
-                            "retry_count": retry_count + 1,
-                            "error": last_error,
-                        })
-                        retry_count += 1
-                
-                except Exception as e:
-                    last_error = str(e)
-                    logger.error(f"Step {step.step_number} error: {last_error}")
-                    retry_count += 1
-            
-            if not success:
-                error_details = last_error or "No error details were provided"
-                error_msg = f"Step {step.step_number} ({step.tool_name}): {error_details}"
-
-                # Graceful degradation: if a reasoning step fails but we already have
-                # successful non-reasoning outputs, continue and let runner resolve
-                # final output from grounded tool data.
-                if step.tool_name.lower() == "reasoning":
-                    has_grounded_output = any(
-                        prev.success and prev.tool_name != "reasoning"
-                        for prev in execution_context.executed_steps
-                    )
-                    if has_grounded_output:
-                        logger.warning(
-                            "Reasoning step failed after grounded tool outputs; continuing with partial result: %s",
-                            error_details,
+                        result = await asyncio.to_thread(
+                            self._invoke_tool,
+                            tool,
+                            tool_name,
+                            resolved_input,
+                            execution_context,
                         )
-                        self._emit_step_event(step_callback, {
-                            "type": "step_completed",
-                            "step_number": step.step_number,
-                            "description": step.description,
-                            "tool_name": step.tool_name.lower(),
-                            "success": False,
-                            "error": error_details,
-                        })
-                        continue
-
-                logger.error(error_msg)
-                memory_step = MemoryExecutionStep(
-                    step_number=step.step_number,
-                    description=step.description,
-                    tool_name=step.tool_name,
-                    input_data=step.input_data,
-                    output=None,
-                    success=False,
-                    error=error_details,
+            except Exception as e:
+                logger.error("Step %s error: %s", step.step_number, e)
+                attempts.append((attempt, None, str(e)))
+                error, result = str(e), None
+            else:
+                attempts.append((attempt, resolved_input, result))
+                if result.success:
+                    break
+                error = result.error
+
+            if attempt + 1 < max_attempts:
+                delay = self._retry_delay(attempt + 1, error, result)
+                if delay:
+                    await asyncio.sleep(delay)
+        return attempts
+
+    def _invoke_tool(
+        self,
+        tool: BaseTool,
+        tool_name: str,
+        resolved_input: Dict[str, Any],
+        execution_context: ExecutionContext,
+    ) -> ToolOutput:
+        """Execute a tool, reusing this run's earlier result for an identical step."""
+        signature = self._reuse_signature(tool, tool_name, resolved_input)
+        if signature is not None:
+            cached = execution_context.get_tool_result(signature)
+            if cached is not None:
+                logger.info("Reusing %s result from an identical earlier step", tool_name)
+                return cached
+
+        result = tool.execute(**resolved_input)
+        if signature is not None and result.success:
+            execution_context.store_tool_result(signature, result)
+        return result
+
+    async def _ainvoke_tool(
+        self,
+        tool: BaseTool,
+        tool_name: str,
+        resolved_input: Dict[str, Any],
+        execution_context: ExecutionContext,
+    ) -> ToolOutput:
+        """Async _invoke_tool for tools with a native aexecute."""
+        signature = self._reuse_signature(tool, tool_name, resolved_input)
+        if signature is not None:
+            cached = execution_context.get_tool_result(signature)
+            if cached is not None:
+                logger.info("Reusing %s result from an identical earlier step", tool_name)
+                return cached
+
+        result = await tool.aexecute(**resolved_input)
+        if signature is not None and result.success:
+            execution_context.store_tool_result(signature, result)
+        return result
+
+    def _reuse_signature(
+        self,
+        tool: BaseTool,
+        tool_name: str,
+        resolved_input: Dict[str, Any],
+    ) -> Optional[Tuple[str, str]]:
+        """Return the per-run result key for reusable calls, else None."""
+        if not isinstance(tool, BaseTool) or not tool.can_reuse_result(resolved_input):
+            return None
+        return (tool_name, dumps(resolved_input, sort_keys=True))
+
+    def _retry_delay(
+        self,
+        failed_attempts: int,
+        error: Optional[str],
+        result: Optional[ToolOutput] = None,
+    ) -> float:
+        """Return a full-jitter backoff delay for transient errors, else 0.
+
+        Delay is uniform in [0, min(max, base * 2 ** (failed_attempts - 1))].
+        """
+        if not self._is_retryable_error(error, result):
+            return 0.0
+
+        cap = min(
+            settings.RETRY_BACKOFF_MAX_SECONDS,
+            settings.RETRY_BACKOFF_BASE_SECONDS * (2 ** (failed_attempts - 1)),
+        )
+        delay = random.uniform(0, cap)
+        logger.warning("Retry %d after %.2fs: %s", failed_attempts, delay, error)
+        return delay
+
+    def _is_retryable_error(self, error: Optional[str], result: Optional[ToolOutput]) -> bool:
+        """Return True for rate limits, upstream 5xx responses, and timeouts."""
+        if result is not None and isinstance(result.result, dict):
+            status_code = result.result.get("status_code")
+            if isinstance(status_code, int) and (status_code == 429 or status_code >= 500):
+                return True
+        return bool(error and _RETRYABLE_ERROR_PATTERN.search(error))
+
+    def _prepare_step(
+        self,
+        step: ExecutionStep,
+        tool_name: str,
+        execution_context: ExecutionContext,
+    ) -> Optional[Tuple[Optional[BaseTool], int, Optional[str]]]:
+        """Resolve and validate a step's tool once; retries only cover tool failures.
+
+        Returns (tool, max_attempts, last_error), or None after failing the
+        execution context on invalid input.
+        """
+        tool = self.tool_registry.get(tool_name)
+        if not tool:
+            last_error = f"Tool '{step.tool_name}' not found in registry"
+            logger.error("Step %s error: %s", step.step_number, last_error)
+            return None, 0, last_error
+
+        try:
+            validate_tool_input(tool, step.input_data or {})
+        except ValidationError as exc:
+            error_msg = f"Invalid tool input for '{tool_name}': {exc}"
+            logger.error(error_msg)
+            execution_context.fail(error_msg)
+            return None
+
+        return tool, self._get_max_attempts(tool_name), None
+
+    def _resolve_step_input(
+        self,
+        step: ExecutionStep,
+        tool_name: str,
+        execution_context: ExecutionContext,
+    ) -> Dict[str, Any]:
+        """Resolve placeholders and grounding context for a step attempt."""
+        # Resolve memory variables before tool execution
+        resolved_input = self._resolve_memory_variables(
+            step.input_data or {},
+            execution_context,
+            tool_name,
+        )
+        
+        # GROUNDING: If this is a reasoning step, enrich context with previous tool outputs
+        if tool_name == "reasoning":
+            resolved_input = self._enrich_reasoning_context(
+                resolved_input,
+                execution_context,
+                step.step_number
+            )
+        
+        logger.debug("Resolved input for %s: %s", tool_name, resolved_input)
+        return resolved_input
+
+    def _record_attempt(
+        self,
+        step: ExecutionStep,
+        tool_name: str,
+        resolved_input: Dict[str, Any],
+        result: ToolOutput,
+        execution_context: ExecutionContext,
+        step_callback: StepEventCallback,
+        retry_count: int,
+    ) -> Tuple[bool, Optional[str]]:
+        """Record an attempt in the execution context. Returns (success, error)."""
+        memory_step = MemoryExecutionStep.model_construct(
+            step_number=step.step_number,
+            description=step.description,
+            tool_name=tool_name,
+            input_data=resolved_input,  # Use resolved input for audit trail
+            output=result.result,
+            success=result.success,
+            error=result.error,
+        )
+        execution_context.add_step(memory_step)
+        
+        # Store intermediate output
+        execution_context.set_output(
+            step.step_number,
+            result.result,
+            key=tool_name
+        )
+        
+        if result.success:
+            logger.info("Step %s succeeded", step.step_number)
+            self._emit_step_event(step_callback, {
+                "type": "step_completed",
+                "step_number": step.step_number,
+                "description": step.description,
+                "tool_name": tool_name,
+                "success": True,
+            })
+            return True, None
+
+        last_error = result.error or "Tool returned no error details"
+        logger.warning("Step %s failed: %s", step.step_number, result.error)
+        self._emit_step_event(step_callback, {
+            "type": "step_retry",
+            "step_number": step.step_number,
+            "description": step.description,
+            "tool_name": tool_name,
+            "retry_count": retry_count + 1,
+            "error": last_error,
+        })
+        return False, last_error
+
+    def _handle_step_failure(
+        self,
+        step: ExecutionStep,
+        tool_name: str,
+        last_error: Optional[str],
+        execution_context: ExecutionContext,
+        step_callback: StepEventCallback,
+    ) -> bool:
+        """Record a step that exhausted its attempts. Returns True to continue."""
+        error_details = last_error or "No error details were provided"
+        error_msg = f"Step {step.step_number} ({step.tool_name}): {error_details}"
+
+        # Graceful degradation: if a reasoning step fails but we already have
+        # successful non-reasoning outputs, continue and let runner resolve
+        # final output from grounded tool data.
+        if tool_name == "reasoning":
+            has_grounded_output = any(
+                prev.success and prev.tool_name != "reasoning"
+                for prev in execution_context.executed_steps
+            )
+            if has_grounded_output:
+                logger.warning(
+                    "Reasoning step failed after grounded tool outputs; continuing with partial result: %s",
+                    error_details,
                 )
-                execution_context.add_step(memory_step)
-                execution_context.fail(f"Tool execution failed: {error_msg}")
                 self._emit_step_event(step_callback, {
                     "type": "step_completed",
                     "step_number": step.step_number,
                     "description": step.description,
-                    "tool_name": step.tool_name.lower(),
+                    "tool_name": tool_name,
                     "success": False,
                     "error": error_details,
                 })
-                return execution_context  # Stop immediately on tool failure
-        
+                return True
+
+        logger.error(error_msg)
+        memory_step = MemoryExecutionStep.model_construct(
+            step_number=step.step_number,
+            description=step.description,
+            tool_name=step.tool_name,
+            input_data=step.input_data,
+            output=None,
+            success=False,
+            error=error_details,
+        )
+        execution_context.add_step(memory_step)
+        execution_context.fail(f"Tool execution failed: {error_msg}")
+        self._emit_step_event(step_callback, {
+            "type": "step_completed",
+            "step_number": step.step_number,
+            "description": step.description,
+            "tool_name": tool_name,
+            "success": False,
+            "error": error_details,
+        })
+        return False
+
+    def _complete_execution(self, execution_context: ExecutionContext) -> None:
+        """Mark the execution complete with the final recorded step's result."""
         # All steps completed successfully
         logger.info("All steps executed successfully")
         
-        # Extract final result from last step
+        # The last recorded attempt already carries the final output; outputs
+        # are keyed by tool name, so there is no step_N entry to look up.
         last_step = execution_context.executed_steps[-1] if execution_context.executed_steps else None
-        if last_step and last_step.tool_name == "reasoning" and last_step.success:
+        if last_step is None or not last_step.success:
+            execution_context.complete(None)
+            return
+
+        last_result = last_step.output
+        if last_step.tool_name == "reasoning":
             answer_content = None
-            if isinstance(last_step.output, dict):
-                answer_content = last_step.output.get("answer")
-            final_result = {
-                "content": answer_content or last_step.output,
+            if isinstance(last_result, dict):
+                answer_content = last_result.get("answer")
+            execution_context.complete({
+                "content": answer_content or last_result,
                 "source": "reasoning-only",
                 "note": "No external tools used",
-            }
-            execution_context.complete(final_result)
+            })
         else:
-            last_output = execution_context.intermediate_outputs.get(
-                f"step_{steps[-1].step_number}", None
-            )
-            execution_context.complete(last_output)
-        
-        return execution_context
+            execution_context.complete(last_result)
+
+    def _emit_step_started(
+        self,
+        step: ExecutionStep,
+        tool_name: str,
+        step_callback: StepEventCallback,
+    ) -> None:
+        self._emit_step_event(step_callback, {
+            "type": "step_started",
+            "step_number": step.step_number,
+            "description": step.description,
+            "tool_name": tool_name,
+        })
 
     def _emit_step_event(
         self,
-        step_callback: Optional[Callable[[Dict[str, Any]], None]],
+        step_callback: StepEventCallback,
         event: Dict[str, Any],
     ) -> None:
         """Emit step-level event to callback if provided."""
@@ -244,10 +620,7 @@ class ExecutorAgent:
         - Full placeholder: value = "{api_key}"
         - Embedded placeholder: value = "{endpoint}/path/to/resource"
         """
-        import re
-        
         resolved = dict(input_data or {})
-        placeholder_pattern = re.compile(r'\{([^}]+)\}')
         
         def resolve_string(text: str) -> str:
             """Replace all {placeholder} patterns in a string."""
@@ -258,13 +631,13 @@ class ExecutorAgent:
                 key = match.group(1)
                 value = execution_context.intermediate_outputs.get(key)
                 if value is not None:
-                    logger.debug(f"Resolved placeholder '{{{key}}}' to '{value}'")
+                    logger.debug("Resolved placeholder '{%s}' to '%s'", key, value)
                     return str(value)
                 else:
-                    logger.warning(f"Memory key '{key}' not found; keeping placeholder")
+                    logger.warning("Memory key '%s' not found; keeping placeholder", key)
                     return match.group(0)  # Keep original placeholder
             
-            return placeholder_pattern.sub(replacer, text)
+            return _PLACEHOLDER_PATTERN.sub(replacer, text)
         
         # Resolve placeholders in all string values
         for key, value in resolved.items():
@@ -285,7 +658,7 @@ class ExecutorAgent:
                     raise ValueError(f"URL contains unresolved placeholder: {url}")
                 if not url.startswith(("http://", "https://")):
                     raise ValueError(f"Invalid URL after resolution: {url} - must start with http:// or https://")
-                logger.debug(f"Validated HTTP URL: {url[:80]}...")
+                logger.debug("Validated HTTP URL: %.80s...", url)
         
         return resolved
     
@@ -326,7 +699,7 @@ class ExecutorAgent:
         if not last_tool_step or not last_tool_step.output:
             return reasoning_input
         
-        logger.info(f"Grounding reasoning step with data from {last_tool_step.tool_name} output")
+        logger.info("Grounding reasoning step with data from %s output", last_tool_step.tool_name)
         
         # Extract structured context from previous tool output
         structured_context = self._extract_structured_context(last_tool_step.output, last_tool_step.tool_name)
@@ -334,7 +707,7 @@ class ExecutorAgent:
         if structured_context:
             # Replace or enrich the context field
             reasoning_input["context"] = structured_context
-            logger.debug(f"Enriched reasoning context: {str(structured_context)[:200]}...")
+            logger.debug("Enriched reasoning context: %.200s...", structured_context)
         
         return reasoning_input
     
@@ -0,0 +1,501 @@
+"""Cache of validated plan templates reused for equivalent or similar goals."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock, Timer
+from typing import Any, Dict, List, Optional, Set, Tuple
+import atexit
+import copy
+import os
+import re
+import tempfile
+import zlib
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from app.core import serialization
+from app.core.logging import logger
+from app.schemas.request_response import ExecutionStep
+
+# Filler words ignored when matching goals against cached plan templates.
+_TEMPLATE_STOPWORDS = frozenset({
+    "a", "an", "the", "please", "me", "my", "us", "our", "can", "could", "you",
+    "and", "then", "of", "is", "are",
+})
+
+_KEYWORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Keywords plus the signs and separators keyword matching ignores ("-5", "BRK.A",
+# "10:30"). Sentence punctuation and ".,:;" followed by a space are not tokens.
+_GOAL_TOKEN_PATTERN = re.compile(r"[a-z0-9]+|[.,:;](?=[^\s.,:;])|[^\sa-z0-9.,:;?!]")
+
+# Keyword sets are feature-hashed into fixed-width binary rows so similarity
+# against every cached goal is one matrix-vector product.
+_VECTOR_DIM = 1024
+# Highest-scoring rows re-checked exactly per fuzzy lookup.
+_MAX_CANDIDATES = 8
+
+ContextItems = Tuple[Tuple[str, str], ...]
+
+
+def _extract_keywords(text: str) -> Tuple[str, ...]:
+    """Return goal keywords in order, without punctuation or filler words."""
+    return tuple(
+        token for token in _KEYWORD_PATTERN.findall(text.lower())
+        if token not in _TEMPLATE_STOPWORDS
+    )
+
+
+def _goal_tokens(text: str) -> Tuple[str, ...]:
+    """Return keywords and significant symbols in order, without filler words."""
+    return tuple(
+        token for token in _GOAL_TOKEN_PATTERN.findall(text.lower())
+        if token not in _TEMPLATE_STOPWORDS
+    )
+
+
+def _keyword_slots(keywords: Any) -> List[int]:
+    """Return the distinct vector columns for a keyword set (stable across runs)."""
+    return sorted({zlib.crc32(keyword.encode("utf-8")) % _VECTOR_DIM for keyword in keywords})
+
+
+def _jaccard(left: frozenset, right: frozenset) -> float:
+    return len(left & right) / len(left | right)
+
+
+def _changed_keywords(cached: Tuple[str, ...], query: Tuple[str, ...]) -> frozenset:
+    """Return cached-goal keywords that the query drops or moves to another position."""
+    cached_set, query_set = set(cached), set(query)
+    shared_cached = [keyword for keyword in dict.fromkeys(cached) if keyword in query_set]
+    shared_query = [keyword for keyword in dict.fromkeys(query) if keyword in cached_set]
+    moved = {left for left, right in zip(shared_cached, shared_query) if left != right}
+    return frozenset((cached_set - query_set) | moved)
+
+
+def _group_id(intent: str, context_items: Any) -> int:
+    """Hash an intent and its context so matrix rows can be masked by group."""
+    return hash((intent, tuple(tuple(item) for item in context_items)))
+
+
+def _context_items(context: Optional[Dict[str, Any]]) -> ContextItems:
+    """Return user-visible context as a sorted, hashable tuple."""
+    return tuple(sorted(
+        (str(key), str(value))
+        for key, value in (context or {}).items()
+        if not str(key).startswith("_")
+    ))
+
+
+class PlanCache:
+    """
+    LRU store of validated plans, matched by intent, context, and goal keywords.
+
+    Goals with the same keywords in the same order are found by key.
+    Otherwise the closest entry with the same intent and context is reused
+    when the Jaccard similarity of the keyword sets reaches
+    ``similarity_threshold``. Either way, a template is only reused when none
+    of the keywords or symbols that the new goal dropped or reordered appear
+    in its tool inputs (a changed city, swapped currencies, or a flipped sign
+    means the plan itself has to change). The goal text is rebound into
+    copied step inputs, so no LLM call is needed to adapt a hit.
+
+    With NumPy available, fuzzy lookups score all entries at once against a
+    preallocated float32 matrix of hashed keyword rows and only the top
+    candidates are verified exactly.
+
+    When a path is set, changes are written back at most once per
+    ``persist_delay`` seconds from a background timer (and on exit), so
+    store() and invalidate() never write the file on the request path.
+    Each write first merges templates other processes saved to the same file.
+    Use get_plan_cache() to share one instance per path within a process.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        similarity_threshold: float = 0.8,
+        path: Optional[str] = None,
+        enabled: bool = True,
+        persist_delay: float = 1.0,
+    ) -> None:
+        self.max_entries = max(1, max_entries)
+        self.similarity_threshold = similarity_threshold
+        self.path = Path(path) if path else None
+        self.enabled = enabled
+        self.persist_delay = persist_delay
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = Lock()
+        self._write_lock = Lock()
+        self._persist_timer: Optional[Timer] = None
+        # Removals since the last write, so merging the file does not resurrect them.
+        self._removed_keys: Set[str] = set()
+        self._cleared = False
+        self._reset_index()
+        if self.enabled and self.path is not None:
+            self._load()
+            atexit.register(self._flush_pending)
+
+    def lookup(
+        self,
+        goal: str,
+        intent: str,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> Optional[List[ExecutionStep]]:
+        """Return a cached plan rebound to goal, or None."""
+        if not self.enabled:
+            return None
+
+        keywords = _extract_keywords(goal)
+        context_items = _context_items(context)
+        key = self._make_key(intent, context_items, keywords)
+        with self._lock:
+            entry = self._entries.get(key)
+            # Keys ignore signs and separators, so exact hits are checked too.
+            if entry is not None and not self._is_rebindable(entry, self._changed_tokens(entry, goal, keywords)):
+                entry = None
+            if entry is None:
+                entry = self._closest_entry(intent, context_items, goal, keywords)
+                if entry is None:
+                    return None
+                key = self._make_key(intent, context_items, tuple(entry["keywords"]))
+            self._entries.move_to_end(key)
+
+        return self._rehydrate(entry, goal)
+
+    def store(
+        self,
+        goal: str,
+        intent: str,
+        context: Optional[Dict[str, Any]],
+        steps: List[ExecutionStep],
+    ) -> None:
+        """Remember a validated plan so equivalent goals can skip the LLM."""
+        if not self.enabled:
+            return
+
+        keywords = _extract_keywords(goal)
+        context_items = _context_items(context)
+        entry = {
+            "intent": intent,
+            "context": [list(item) for item in context_items],
+            "keywords": list(keywords),
+            "goal": goal,
+            "steps": [step.model_dump(mode="json") for step in steps],
+        }
+        key = self._make_key(intent, context_items, keywords)
+        with self._lock:
+            self._insert(key, entry)
+            self._removed_keys.discard(key)
+        self._schedule_persist()
+
+    def invalidate(
+        self,
+        goal: str,
+        intent: str,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """Drop the template that would serve goal. Returns True if one was removed."""
+        if not self.enabled:
+            return False
+
+        keywords = _extract_keywords(goal)
+        context_items = _context_items(context)
+        key = self._make_key(intent, context_items, keywords)
+        with self._lock:
+            if key not in self._entries:
+                entry = self._closest_entry(intent, context_items, goal, keywords)
+                if entry is None:
+                    return False
+                key = self._make_key(intent, context_items, tuple(entry["keywords"]))
+            del self._entries[key]
+            self._unindex(key)
+            self._removed_keys.add(key)
+        logger.info("Invalidated cached plan template for goal: %s", goal)
+        self._schedule_persist()
+        return True
+
+    def flush(self) -> None:
+        """Write pending changes to disk now."""
+        if self.path is None:
+            return
+        # The write lock orders writers, so a snapshot never overwrites a newer one.
+        with self._write_lock:
+            disk_entries = [] if self._cleared else self._read_entries()
+            with self._lock:
+                if self._persist_timer is not None:
+                    self._persist_timer.cancel()
+                    self._persist_timer = None
+                # Other processes sharing the file keep their templates.
+                self._merge_disk_entries(disk_entries)
+                self._removed_keys.clear()
+                self._cleared = False
+                payload = serialization.dumps(list(self._entries.values()))
+            self._write(payload)
+
+    def _flush_pending(self) -> None:
+        """Write back changes still waiting on the persist timer."""
+        if self._persist_timer is not None:
+            self.flush()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._reset_index()
+            self._removed_keys.clear()
+            self._cleared = True
+        self._schedule_persist()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _make_key(self, intent: str, context_items: ContextItems, keywords: Tuple[str, ...]) -> str:
+        # Keyword order is part of the key: "usd to eur" and "eur to usd" differ.
+        return serialization.dumps([intent, context_items, list(keywords)])
+
+    def _closest_entry(
+        self,
+        intent: str,
+        context_items: ContextItems,
+        goal: str,
+        ordered_keywords: Tuple[str, ...],
+    ) -> Optional[Dict[str, Any]]:
+        """Return the most similar reusable entry. Caller holds the lock."""
+        keywords = frozenset(ordered_keywords)
+        if self.similarity_threshold >= 1.0 or not keywords:
+            return None
+
+        if self._matrix is not None:
+            candidates = self._vector_candidates(_group_id(intent, context_items), keywords)
+        else:
+            candidates = list(self._entries.values())
+
+        context_list = [list(item) for item in context_items]
+        best_entry = None
+        best_score = self.similarity_threshold
+        for entry in candidates:
+            if entry["intent"] != intent or entry["context"] != context_list:
+                continue
+            cached_keywords = frozenset(entry["keywords"])
+            score = _jaccard(keywords, cached_keywords)
+            if score < best_score:
+                continue
+            if self._is_rebindable(entry, self._changed_tokens(entry, goal, ordered_keywords)):
+                best_entry, best_score = entry, score
+        return best_entry
+
+    def _vector_candidates(self, group: int, keywords: frozenset) -> List[Dict[str, Any]]:
+        """Return entries in the same intent/context group whose keyword rows score highest."""
+        query = np.zeros(_VECTOR_DIM, dtype=np.float32)
+        slots = _keyword_slots(keywords)
+        query[slots] = 1.0
+
+        # Jaccard from dot products: |A & B| / (|A| + |B| - |A & B|).
+        overlap = self._matrix @ query
+        union = self._row_sizes + len(slots) - overlap
+        scores = np.divide(overlap, union, out=np.zeros_like(overlap), where=union > 0)
+        # Mask other groups before the top-k cut, or they could crowd out every match.
+        scores[self._row_groups != group] = -1.0
+
+        k = min(_MAX_CANDIDATES, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [
+            self._entries[self._row_keys[row]]
+            for row in top
+            if scores[row] >= self.similarity_threshold and self._row_keys[row] is not None
+        ]
+
+    def _insert(self, key: str, entry: Dict[str, Any]) -> None:
+        """Add or refresh an entry, evicting the least recently used. Caller holds the lock."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            evicted_key, _ = self._entries.popitem(last=False)
+            self._unindex(evicted_key)
+        self._index(key, entry)
+
+    def _reset_index(self) -> None:
+        if np is None:
+            self._matrix = None
+            return
+        self._matrix = np.zeros((self.max_entries, _VECTOR_DIM), dtype=np.float32)
+        self._row_sizes = np.zeros(self.max_entries, dtype=np.float32)
+        self._row_groups = np.full(self.max_entries, -1, dtype=np.int64)
+        self._row_keys: List[Optional[str]] = [None] * self.max_entries
+        self._key_rows: Dict[str, int] = {}
+        self._free_rows = list(range(self.max_entries - 1, -1, -1))
+
+    def _index(self, key: str, entry: Dict[str, Any]) -> None:
+        if self._matrix is None:
+            return
+        row = self._key_rows.get(key)
+        if row is None:
+            row = self._free_rows.pop()
+            self._key_rows[key] = row
+            self._row_keys[row] = key
+        slots = _keyword_slots(entry["keywords"])
+        self._matrix[row] = 0.0
+        self._matrix[row, slots] = 1.0
+        self._row_sizes[row] = len(slots)
+        self._row_groups[row] = _group_id(entry["intent"], entry["context"])
+
+    def _unindex(self, key: str) -> None:
+        if self._matrix is None:
+            return
+        row = self._key_rows.pop(key, None)
+        if row is None:
+            return
+        self._matrix[row] = 0.0
+        self._row_sizes[row] = 0.0
+        self._row_groups[row] = -1
+        self._row_keys[row] = None
+        self._free_rows.append(row)
+
+    def _changed_tokens(self, entry: Dict[str, Any], goal: str, keywords: Tuple[str, ...]) -> frozenset:
+        """Return keywords and symbols of the cached goal that goal drops or reorders."""
+        if entry["goal"] == goal:
+            return frozenset()
+        return (
+            _changed_keywords(tuple(entry["keywords"]), keywords)
+            | _changed_keywords(_goal_tokens(entry["goal"]), _goal_tokens(goal))
+        )
+
+    def _is_rebindable(self, entry: Dict[str, Any], changed_tokens: frozenset) -> bool:
+        """Reject templates whose inputs depend on a token the new goal lacks or moves."""
+        if not changed_tokens:
+            return True
+        source_goal = entry["goal"]
+        for step in entry["steps"]:
+            for value in (step.get("input_data") or {}).values():
+                text = value if isinstance(value, str) else serialization.dumps(value)
+                text = text.replace(source_goal, "")
+                if changed_tokens & set(_GOAL_TOKEN_PATTERN.findall(text.lower())):
+                    return False
+        return True
+
+    def _rehydrate(self, entry: Dict[str, Any], goal: str) -> List[ExecutionStep]:
+        source_goal = entry["goal"]
+        steps: List[ExecutionStep] = []
+        for step_data in copy.deepcopy(entry["steps"]):
+            input_data = step_data.get("input_data") or {}
+            step_data["input_data"] = {
+                key: value.replace(source_goal, goal) if isinstance(value, str) else value
+                for key, value in input_data.items()
+            }
+            steps.append(ExecutionStep(**step_data))
+        return steps
+
+    def _load(self) -> None:
+        for key, entry in self._read_entries()[-self.max_entries:]:
+            self._insert(key, entry)
+
+    def _read_entries(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """Return well-formed (key, entry) pairs from the cache file, oldest first."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                entries = serialization.loads(f.read())
+        except FileNotFoundError:
+            return []
+        except (OSError, serialization.JSONDecodeError) as e:
+            logger.warning("Ignoring unreadable plan cache %s: %s", self.path, e)
+            return []
+
+        if not isinstance(entries, list):
+            logger.warning("Ignoring plan cache %s: expected a list of templates", self.path)
+            return []
+
+        pairs = []
+        for entry in entries:
+            try:
+                key = self._make_key(
+                    entry["intent"],
+                    tuple((str(name), str(value)) for name, value in entry["context"]),
+                    tuple(entry["keywords"]),
+                )
+                if not isinstance(entry["goal"], str) or not isinstance(entry["steps"], list):
+                    raise TypeError("goal must be a string and steps a list")
+            except (KeyError, TypeError, ValueError) as e:
+                logger.warning("Skipping malformed plan cache entry in %s: %s", self.path, e)
+                continue
+            pairs.append((key, entry))
+        return pairs
+
+    def _merge_disk_entries(self, disk_entries: List[Tuple[str, Dict[str, Any]]]) -> None:
+        """Adopt templates other writers saved, into free slots only. Caller holds the lock."""
+        for key, entry in reversed(disk_entries):
+            if len(self._entries) >= self.max_entries:
+                break
+            if key in self._entries or key in self._removed_keys:
+                continue
+            self._insert(key, entry)
+            # Entries this instance has not used rank as least recently used.
+            self._entries.move_to_end(key, last=False)
+
+    def _schedule_persist(self) -> None:
+        """Write changes back after persist_delay, coalescing changes made meanwhile."""
+        if self.path is None:
+            return
+        if self.persist_delay <= 0:
+            self.flush()
+            return
+        with self._lock:
+            if self._persist_timer is not None:
+                return
+            timer = Timer(self.persist_delay, self.flush)
+            timer.daemon = True
+            self._persist_timer = timer
+        timer.start()
+
+    def _write(self, payload: str) -> None:
+        """Atomically replace the cache file. Caller holds the write lock."""
+        tmp_name = None
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # A unique temp file per write, so concurrent processes never share one.
+            with tempfile.NamedTemporaryFile(
+                "w",
+                encoding="utf-8",
+                dir=self.path.parent,
+                prefix=f"{self.path.name}.",
+                suffix=".tmp",
+                delete=False,
+            ) as f:
+                tmp_name = f.name
+                f.write(payload)
+            os.replace(tmp_name, self.path)
+        except OSError as e:
+            logger.warning("Failed to persist plan cache %s: %s", self.path, e)
+            if tmp_name is not None:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+
+
+_shared_caches: Dict[Path, PlanCache] = {}
+_shared_caches_lock = Lock()
+
+
+def get_plan_cache(
+    path: Optional[str],
+    similarity_threshold: float = 0.8,
+    enabled: bool = True,
+) -> PlanCache:
+    """Return the process-wide cache for path, or a private in-memory cache without one."""
+    if not path or not enabled:
+        return PlanCache(similarity_threshold=similarity_threshold, path=path, enabled=enabled)
+
+    key = Path(path).resolve()
+    cache = _shared_caches.get(key)
+    if cache is None:
+        with _shared_caches_lock:
+            cache = _shared_caches.get(key)
+            if cache is None:
+                cache = PlanCache(similarity_threshold=similarity_threshold, path=path)
+                _shared_caches[key] = cache
+    return cache
@@ -1,164 +1,124 @@
 """Planner agent for breaking goals into executable steps."""
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import quote_plus
+import asyncio
 import re
 
+from app.core import serialization
 from app.llm.client import get_llm_client, BaseLLMClient
+from app.llm.cache import LLMCache, llm_cache
 from app.tools.base import tool_registry
 from app.schemas.request_response import ExecutionStep
+from app.agents.plan_cache import PlanCache, get_plan_cache
 from app.agents.validator import ToolInputValidator
 from app.core.config import settings
 from app.core.logging import logger
 
+# Runs of non-alphanumeric characters (Unicode-aware, like str.isalnum).
+_NON_ALNUM_PATTERN = re.compile(r"[\W_]+")
 
-class PlannerAgent:
-    """
-    Agent responsible for planning execution.
-    
-    Takes a high-level goal and breaks it into concrete,
-    ordered steps that can be executed by the Executor Agent.
-    """
-    
-    def __init__(self, llm_client: Optional[BaseLLMClient] = None):
-        self.llm_client = llm_client or get_llm_client()
-        self.available_tools = tool_registry.list_tools()
-        self.validator = ToolInputValidator(self.llm_client)
-        logger.info(f"Planner initialized with LLM client")
-    
-    def plan(self, goal: str, context: Optional[Dict[str, Any]] = None) -> List[ExecutionStep]:
-        """
-        Generate an execution plan for the given goal.
-        
-        Args:
-            goal: High-level goal statement
-            context: Optional context/parameters for planning
-        
-        Returns:
-            List of ExecutionStep objects in order
-            
-        Raises:
-            ValueError: If plan violates intent requirements
-        """
-        context = context or {}
-        
-        # Determine intent classification
-        intent = self.classify_intent(goal, context)
-        logger.debug(f"Classified intent: {intent}")
-
-        # Fast deterministic planning for common live-data goals.
-        # This avoids LLM-plan failures when provider quotas are temporarily exhausted.
-        heuristic_steps = self._build_heuristic_live_data_steps(goal, context)
-        if heuristic_steps and intent in {"tool_required", "mixed"}:
-            logger.info("Using heuristic live-data plan (LLM planning bypass)")
-            heuristic_steps = self._validate_and_repair_steps(goal, context, heuristic_steps, intent)
-            heuristic_steps = self._ensure_user_facing_final_step(goal, intent, heuristic_steps)
-            self._enforce_intent_requirements(heuristic_steps, intent, goal)
-            return heuristic_steps
-        
-        # Build prompt for the planner
-        prompt = self._build_planning_prompt(goal, context)
-        
-        # Call LLM to generate plan
-        messages = [
-            {
-                "role": "system",
-                "content": "You are an AI planning agent. Break complex goals into concrete, ordered steps."
-            },
-            {
-                "role": "user",
-                "content": prompt
-            }
-        ]
-        
-        logger.debug(f"Planning goal: {goal}")
-        response = self.llm_client.call(
-            messages,
-            temperature=0.3,
-            max_tokens=settings.LLM_PLANNER_MAX_TOKENS,
-        )  # Lower temp for consistency
-        plan_text = response.content
-        
-        # Parse LLM response into ExecutionStep objects
-        steps = self._parse_plan(plan_text)
-        steps = self._validate_and_repair_steps(goal, context, steps, intent)
-        steps = self._ensure_user_facing_final_step(goal, intent, steps)
-        
-        # CRITICAL: Enforce intent requirements
-        self._enforce_intent_requirements(steps, intent, goal)
-        
-        logger.info(f"Generated plan with {len(steps)} steps for goal: {goal}")
-        return steps
-
-    def classify_intent(self, goal: str, context: Optional[Dict[str, Any]] = None) -> str:
-        """Classify goal intent as reasoning_only, tool_required, or mixed."""
-        context = context or {}
-        goal_text = goal.lower()
-        if "weather" in goal_text:
-            invalid_weather_markers = ["xyznowhereplace", "nowhere", "invalid", "fake", "madeup"]
-            if any(token in goal_text for token in invalid_weather_markers):
-                return "reasoning_only"
-
-            if not self._extract_location(goal, context):
-                return "reasoning_only"
 
-        reasoning_keywords = [
-            "explain",
-            "define",
-            "what is",
-            "why",
-            "how",
-            "summarize",
-            "compare",
-            "list",
-        ]
-        tool_keywords = [
-            "current",
-            "latest",
-            "today",
-            "price",
-            "stock",
-            "weather",
-            "news",
-            "real-time",
-            "rate",
-            "fetch",
-            "lookup",
-            "api",
-            "http",
-            "url",
-            "history",
-            "execution",
-            "records",
-            "page",
-        ]
+def _keyword_pattern(*keywords: str) -> "re.Pattern[str]":
+    """
+    Compile a matcher for keywords that start a word.
 
-        has_reasoning = any(keyword in goal_text for keyword in reasoning_keywords)
-        has_tool = any(keyword in goal_text for keyword in tool_keywords)
+    Inflected forms match as well ("fetching", "explained", "saved"); a
+    trailing silent "e" may be replaced by "-ing" ("storing"). Anchoring at
+    word starts keeps e.g. "generate" from matching "rate".
+    """
+    alternatives = []
+    for keyword in sorted(keywords, key=len, reverse=True):
+        if keyword.isalpha() and keyword.endswith("e"):
+            alternatives.append(f"{re.escape(keyword[:-1])}(?:e|ing)")
+        else:
+            alternatives.append(re.escape(keyword))
+    return re.compile(rf"\b(?:{'|'.join(alternatives)})\w*")
+
+
+# Intent keywords, matched at word starts in the lowercased goal.
+_REASONING_PATTERN = _keyword_pattern(
+    "explain", "define", "what is", "why", "how", "summarize", "compare", "list",
+)
+_TOOL_PATTERN = _keyword_pattern(
+    "current", "latest", "today", "price", "stock", "weather", "news", "real-time",
+    "rate", "fetch", "lookup", "api", "http", "url", "history", "execution",
+    "records", "page",
+)
+_CONTEXT_TOOL_PATTERN = _keyword_pattern("http", "api", "key")
+# Goals mentioning shared state still go through the LLM planner so memory steps are planned.
+_STATEFUL_PATTERN = _keyword_pattern("store", "save", "remember", "memory", "retrieve", "recall")
+_INVALID_WEATHER_MARKERS = ("xyznowhereplace", "nowhere", "invalid", "fake", "madeup")
+# Explicit URLs in a goal; trailing sentence punctuation is stripped after matching.
+_GOAL_URL_PATTERN = re.compile(r"https?://[^\s<>\"'`]+", re.IGNORECASE)
+# Goals that send or change data need the LLM to plan the request body.
+_WRITE_PATTERN = _keyword_pattern(
+    "post", "put", "patch", "delete", "send", "submit", "upload", "create", "update",
+)
+
+
+class _PlanStreamScanner:
+    """Incrementally extract step objects from a streamed JSON plan.
+
+    Tracks bracket depth (ignoring brackets inside strings) and returns the
+    raw text of each object that is a direct child of the first JSON array.
+    """
 
-        context_text = " ".join(str(value).lower() for value in context.values())
-        if "http" in context_text or "api" in context_text or "key" in context_text:
-            has_tool = True
+    def __init__(self) -> None:
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escape = False
+        self._plan_depth: Optional[int] = None
+        self._current: Optional[List[str]] = None
+
+    def feed(self, chunk: str) -> List[str]:
+        completed: List[str] = []
+        for char in chunk:
+            if self._current is not None:
+                self._current.append(char)
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                continue
 
-        if has_tool and has_reasoning:
-            return "mixed"
-        if has_tool:
-            return "tool_required"
-        return "reasoning_only"
-    
-    def _build_planning_prompt(self, goal: str, context: Dict[str, Any]) -> str:
-        """Build the prompt for the planner."""
-        
-        context_str = ""
-        if context:
-            context_str = f"\n\nAdditional Context:\n"
-            for key, value in context.items():
-                context_str += f"- {key}: {value}\n"
-        
-        # Build detailed tool descriptions with schemas
-        tools_description = self._build_tools_description()
-        
-        prompt = f"""You are an AI planning agent. Your task is to break down a user goal into concrete, executable steps.
+            if not self._stack and char not in "[{":
+                continue  # Prose or code fences before the JSON body
+
+            if char == '"':
+                self._in_string = True
+            elif char in "[{":
+                if char == "[" and self._plan_depth is None:
+                    self._plan_depth = len(self._stack) + 1
+                elif (
+                    char == "{"
+                    and self._current is None
+                    and self._plan_depth is not None
+                    and len(self._stack) == self._plan_depth
+                ):
+                    self._current = [char]
+                self._stack.append(char)
+            elif char in "]}":
+                if self._stack:
+                    self._stack.pop()
+                if (
+                    char == "}"
+                    and self._current is not None
+                    and len(self._stack) == self._plan_depth
+                ):
+                    completed.append("".join(self._current))
+                    self._current = None
+        return completed
+
+
+# Static planner instructions, sent as the system message. Everything here is
+# identical across plan() calls (until the tool registry changes), so callers
+# build it once and providers with prefix caching can reuse it.
+_PLANNING_PROMPT_PREFIX = """You are an AI planning agent. Your task is to break down a user goal into concrete, executable steps.
 
 Available tools and their input schemas:
 {tools_description}
@@ -212,35 +172,32 @@ Examples:
   ✓ "Fetch Bitcoin price via CoinGecko API: to get current market data"
   ✓ "Internal reasoning: Explain the concept of REST APIs with examples"
   ✓ "Internal reasoning: Analyze the fetched data and summarize key insights"
-  ✗ "Get Bitcoin price" (too vague, doesn't explain tool choice)
+  ✗ "Get Bitcoin price" (too vague, doesn't explain tool choice)"""
 
-Goal: {goal}
-{context_str}
-
-Analyze the goal and create a plan. Return your response as a JSON array with this structure:
+_PLANNING_PROMPT_SUFFIX = """Analyze the goal and create a plan. Return your response as a JSON array with this structure:
 [
-  {{
+  {
     "step_number": 1,
     "description": "Short, human-readable step name (e.g., Fetch Financial Data)",
     "tool_name": "lowercase name of tool to use (must be from available tools)",
-    "input_data": {{"key": "value"}},
+    "input_data": {"key": "value"},
     "reasoning": "Why this step is necessary"
-  }},
+  },
   ...
 ]
 
 CRITICAL: For input_data, use the EXACT field names and types:
 - For 'reasoning' tool: Include 'question' (the question to answer), and optionally 'context'
-    Example: {{"question": "Explain the concept of an API"}}
+    Example: {"question": "Explain the concept of an API"}
     IMPORTANT: Use 'reasoning' only when no external data or actions are needed.
   
 - For 'memory' tool: Include 'action' (either "store" or "retrieve"), 'key', and optionally 'value'
-  Example: {{"action": "store", "key": "my_key", "value": "my_value"}}
+  Example: {"action": "store", "key": "my_key", "value": "my_value"}
   
 - For 'http' tool: Include 'method' (GET, POST, DELETE, etc), 'url', headers (optional dict), body (optional dict), timeout (optional int)
-  Example GET: {{"method": "GET", "url": "https://example.com"}}
-  Example GET with query params: {{"method": "GET", "url": "https://api.github.com/search/repositories?q=machine-learning&sort=stars"}}
-  Example POST: {{"method": "POST", "url": "https://example.com", "body": {{"key": "value"}}}}
+  Example GET: {"method": "GET", "url": "https://example.com"}
+  Example GET with query params: {"method": "GET", "url": "https://api.github.com/search/repositories?q=machine-learning&sort=stars"}
+  Example POST: {"method": "POST", "url": "https://example.com", "body": {"key": "value"}}
   IMPORTANT: 
   - Never use empty strings for body - omit it or use null. Never use strings for timeout - use numbers.
   - For search/query APIs, include ALL required query parameters directly in the URL (e.g., GitHub search requires ?q=...)
@@ -256,21 +213,349 @@ Important:
 7. NEVER include empty strings "" for optional fields - omit them entirely or use null
 
 Generate the plan now:"""
+
+
+class PlannerAgent:
+    """
+    Agent responsible for planning execution.
+    
+    Takes a high-level goal and breaks it into concrete,
+    ordered steps that can be executed by the Executor Agent.
+    """
+
+    def __init__(
+        self,
+        llm_client: Optional[BaseLLMClient] = None,
+        cache: Optional[LLMCache] = None,
+        plan_cache: Optional[PlanCache] = None,
+    ):
+        self.llm_client = llm_client or get_llm_client()
+        self.llm_cache = cache if cache is not None else llm_cache
+        if plan_cache is None:
+            plan_cache = get_plan_cache(
+                settings.PLAN_CACHE_PATH,
+                similarity_threshold=settings.PLAN_CACHE_SIMILARITY,
+                enabled=self.llm_cache.enabled,
+            )
+        self.plan_cache = plan_cache
+        self.available_tools = tool_registry.list_tools()
+        self._tools_description = self._build_tools_description()
+        self._tools_description_version = tool_registry.version
+        self._prompt_prefix = _PLANNING_PROMPT_PREFIX.format(tools_description=self._tools_description)
+        self._prompt_prefix_version = self._tools_description_version
+        self.validator = ToolInputValidator(self.llm_client, cache=self.llm_cache)
+        logger.info("Planner initialized with LLM client")
+    
+    def plan(
+        self,
+        goal: str,
+        context: Optional[Dict[str, Any]] = None,
+        intent: Optional[str] = None,
+    ) -> List[ExecutionStep]:
+        """
+        Generate an execution plan for the given goal.
+        
+        Args:
+            goal: High-level goal statement
+            context: Optional context/parameters for planning
+            intent: Intent already returned by classify_intent, if the caller has it
+        
+        Returns:
+            List of ExecutionStep objects in order
+            
+        Raises:
+            ValueError: If plan violates intent requirements
+        """
+        context = context or {}
+        intent = intent or self.classify_intent(goal, context)
+        logger.debug("Classified intent: %s", intent)
+
+        steps = self._plan_without_llm(goal, context, intent)
+        if steps is not None:
+            return steps
+
+        messages, temperature, cache_key = self._build_planning_request(goal, context)
+        plan_text = self.llm_cache.get(cache_key)
+        cache_hit = plan_text is not None
+
+        if cache_hit:
+            logger.info("Planner LLM cache hit")
+        elif settings.LLM_PLANNER_STREAMING:
+            plan_text = self._stream_plan_text(messages, temperature)
+        else:
+            response = self.llm_client.call(
+                messages,
+                temperature=temperature,
+                max_tokens=settings.LLM_PLANNER_MAX_TOKENS,
+            )
+            plan_text = response.content
+
+        return self._finish_plan(goal, context, intent, plan_text, cache_key, cache_hit)
+
+    async def aplan(
+        self,
+        goal: str,
+        context: Optional[Dict[str, Any]] = None,
+        intent: Optional[str] = None,
+    ) -> List[ExecutionStep]:
+        """
+        Async variant of plan() that awaits the planner LLM call.
+
+        Heuristic and cached plans, streaming, and the post-processing (all of
+        which may issue validator repair calls) run in a worker thread so they
+        do not block the event loop.
+        """
+        context = context or {}
+        intent = intent or self.classify_intent(goal, context)
+        logger.debug("Classified intent: %s", intent)
+
+        steps = await asyncio.to_thread(self._plan_without_llm, goal, context, intent)
+        if steps is not None:
+            return steps
+
+        messages, temperature, cache_key = self._build_planning_request(goal, context)
+        plan_text = self.llm_cache.get(cache_key)
+        cache_hit = plan_text is not None
+
+        if cache_hit:
+            logger.info("Planner LLM cache hit")
+        elif settings.LLM_PLANNER_STREAMING:
+            plan_text = await asyncio.to_thread(self._stream_plan_text, messages, temperature)
+        else:
+            acall = self.llm_client.acall_batched if settings.LLM_BATCHING_ENABLED else self.llm_client.acall
+            response = await acall(
+                messages,
+                temperature=temperature,
+                max_tokens=settings.LLM_PLANNER_MAX_TOKENS,
+            )
+            plan_text = response.content
+
+        return await asyncio.to_thread(
+            self._finish_plan, goal, context, intent, plan_text, cache_key, cache_hit
+        )
+
+    def _plan_without_llm(
+        self,
+        goal: str,
+        context: Dict[str, Any],
+        intent: str,
+    ) -> Optional[List[ExecutionStep]]:
+        """Return a plan from heuristics or the plan cache, or None if the LLM is needed."""
+        # Fast deterministic planning for common live-data goals.
+        # This avoids LLM-plan failures when provider quotas are temporarily exhausted.
+        heuristic_steps = self._build_heuristic_live_data_steps(goal, context)
+        if heuristic_steps and intent in {"tool_required", "mixed"}:
+            logger.info("Using heuristic live-data plan (LLM planning bypass)")
+            heuristic_steps = self._validate_and_repair_steps(goal, context, heuristic_steps, intent)
+            heuristic_steps = self._ensure_user_facing_final_step(goal, intent, heuristic_steps)
+            self._enforce_intent_requirements(heuristic_steps, intent, goal)
+            return heuristic_steps
+
+        # Reasoning-only goals compile to a single reasoning step; no LLM planning needed.
+        if intent == "reasoning_only":
+            # Heuristic reasoning plans (e.g. invalid weather locations) keep their
+            # no-guessing instructions; live-data heuristics do not apply here.
+            if heuristic_steps and all(step.tool_name == "reasoning" for step in heuristic_steps):
+                logger.info("Using heuristic reasoning plan (LLM planning bypass)")
+                return self._validate_and_repair_steps(goal, context, heuristic_steps, intent)
+            if not _STATEFUL_PATTERN.search(goal.lower()):
+                logger.info("Using direct reasoning plan (LLM planning bypass)")
+                return [self._build_direct_reasoning_step(goal, context)]
+        
+        # Reuse a previously validated plan for an equivalent goal.
+        template_steps = self.plan_cache.lookup(goal, intent, context)
+        if template_steps is not None:
+            logger.info("Using cached plan template (LLM planning bypass)")
+            template_steps = self._validate_and_repair_steps(goal, context, template_steps, intent)
+            template_steps = self._ensure_user_facing_final_step(goal, intent, template_steps)
+            self._enforce_intent_requirements(template_steps, intent, goal)
+            return template_steps
+        return None
+
+    def _build_planning_request(
+        self,
+        goal: str,
+        context: Dict[str, Any],
+    ) -> Tuple[List[Dict[str, str]], float, Optional[str]]:
+        """Return (messages, temperature, cache_key) for the planner LLM call."""
+        # Build prompt for the planner
+        prompt = self._build_planning_prompt(goal, context)
+        
+        messages = [
+            {
+                "role": "system",
+                "content": self._get_prompt_prefix(),
+            },
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ]
+        
+        logger.debug("Planning goal: %s", goal)
+        temperature = 0.3  # Lower temp for consistency
+        model = getattr(self.llm_client, "model", type(self.llm_client).__name__)
+        cache_key = self.llm_cache.make_key(
+            model, messages, temperature, settings.LLM_PLANNER_MAX_TOKENS
+        )
+        return messages, temperature, cache_key
+
+    def _finish_plan(
+        self,
+        goal: str,
+        context: Dict[str, Any],
+        intent: str,
+        plan_text: str,
+        cache_key: Optional[str],
+        cache_hit: bool,
+    ) -> List[ExecutionStep]:
+        """Parse, repair, and check an LLM plan, caching it once it is valid."""
+        # Parse LLM response into ExecutionStep objects
+        steps = self._parse_plan(plan_text)
+        steps = self._validate_and_repair_steps(goal, context, steps, intent)
+        steps = self._ensure_user_facing_final_step(goal, intent, steps)
+        
+        # CRITICAL: Enforce intent requirements
+        self._enforce_intent_requirements(steps, intent, goal)
+
+        # Only cache responses that produced a valid plan.
+        if not cache_hit:
+            self.llm_cache.set(cache_key, plan_text)
+        self.plan_cache.store(goal, intent, context, steps)
+        
+        logger.info("Generated plan with %d steps for goal: %s", len(steps), goal)
+        return steps
+
+    def _stream_plan_text(self, messages: List[Dict[str, str]], temperature: float) -> str:
+        """Stream the plan from the LLM, aborting as soon as a step is unusable.
+
+        Completed step objects are checked while later steps are still being
+        generated; a step naming an unknown tool stops the stream early
+        instead of waiting for a plan that would fail at execution.
+        """
+        chunks: List[str] = []
+        scanner = _PlanStreamScanner()
+        stream = self.llm_client.stream(
+            messages,
+            temperature=temperature,
+            max_tokens=settings.LLM_PLANNER_MAX_TOKENS,
+        )
+        try:
+            for chunk in stream:
+                chunks.append(chunk)
+                for step_text in scanner.feed(chunk):
+                    self._check_streamed_step(step_text)
+        finally:
+            close = getattr(stream, "close", None)
+            if close is not None:
+                close()
+
+        return "".join(chunks)
+
+    def _check_streamed_step(self, step_text: str) -> None:
+        """Reject a streamed plan step whose tool is not registered."""
+        try:
+            step_dict = serialization.loads(step_text)
+        except serialization.JSONDecodeError:
+            return  # Leave malformed JSON to the tolerant full-plan parser
+
+        if not isinstance(step_dict, dict):
+            return
+
+        tool_name = self._normalize_tool_name(step_dict)
+        if tool_name not in tool_registry:
+            raise ValueError(
+                f"Could not parse execution plan from LLM response: "
+                f"step uses unknown tool '{tool_name}'"
+            )
+
+    def _build_direct_reasoning_step(self, goal: str, context: Dict[str, Any]) -> ExecutionStep:
+        """Build the single-step plan used for reasoning-only goals."""
+        input_data: Dict[str, Any] = {"question": goal}
+        user_context = {
+            key: value for key, value in context.items()
+            if not str(key).startswith("_")
+        }
+        if user_context:
+            input_data["context"] = user_context
+
+        return ExecutionStep(
+            step_number=1,
+            description="Internal reasoning: Answer the question directly",
+            tool_name="reasoning",
+            input_data=input_data,
+            reasoning="Reasoning-only goal; no external tools used",
+        )
+
+    def forget_plan(self, goal: str, context: Optional[Dict[str, Any]] = None, intent: Optional[str] = None) -> None:
+        """
+        Drop the cached plan for goal, e.g. after its tools failed.
+
+        Both the plan template and the planner's LLM response are removed;
+        otherwise the next run would re-store the same plan from the LLM cache.
+        """
+        context = context or {}
+        self.plan_cache.invalidate(goal, intent or self.classify_intent(goal, context), context)
+        _, _, cache_key = self._build_planning_request(goal, context)
+        self.llm_cache.delete(cache_key)
+
+    def classify_intent(self, goal: str, context: Optional[Dict[str, Any]] = None) -> str:
+        """Classify goal intent as reasoning_only, tool_required, or mixed."""
+        context = context or {}
+        goal_text = goal.lower()
+        if "weather" in goal_text:
+            if any(token in goal_text for token in _INVALID_WEATHER_MARKERS):
+                return "reasoning_only"
+
+            if not self._extract_location(goal, context):
+                return "reasoning_only"
+
+        has_reasoning = _REASONING_PATTERN.search(goal_text) is not None
+        has_tool = _TOOL_PATTERN.search(goal_text) is not None
+
+        if not has_tool and context:
+            context_text = " ".join(str(value).lower() for value in context.values())
+            if _CONTEXT_TOOL_PATTERN.search(context_text):
+                has_tool = True
+
+        if has_tool and has_reasoning:
+            return "mixed"
+        if has_tool:
+            return "tool_required"
+        return "reasoning_only"
+    
+    def _build_planning_prompt(self, goal: str, context: Dict[str, Any]) -> str:
+        """Build the per-call part of the planner prompt (goal, context, output format)."""
         
-        return prompt
+        context_str = ""
+        if context:
+            context_str = f"\n\nAdditional Context:\n"
+            for key, value in context.items():
+                context_str += f"- {key}: {value}\n"
+        
+        return f"Goal: {goal}\n{context_str}\n\n{_PLANNING_PROMPT_SUFFIX}"
+
+    def _get_prompt_prefix(self) -> str:
+        """Return the static planner instructions, rebuilt only when tools change."""
+        tools_description = self._get_tools_description()
+        if self._prompt_prefix_version != self._tools_description_version:
+            self._prompt_prefix = _PLANNING_PROMPT_PREFIX.format(tools_description=tools_description)
+            self._prompt_prefix_version = self._tools_description_version
+        return self._prompt_prefix
     
+    def _get_tools_description(self) -> str:
+        """Return cached tool descriptions, rebuilding if the registry changed."""
+        if self._tools_description_version != tool_registry.version:
+            self._tools_description = self._build_tools_description()
+            self._tools_description_version = tool_registry.version
+        return self._tools_description
+
     def _build_tools_description(self) -> str:
         """Build detailed tool descriptions including their input schemas."""
         descriptions = []
         
-        from app.tools.base import tool_registry as registry
-        
         # Get all registered tools
-        for tool_name in registry._tools.keys():
-            tool = registry.get(tool_name)
-            if not tool:
-                continue
-            
+        for tool_name, tool in tool_registry.snapshot:
             descriptions.append(f"\n{tool_name}: {tool.description}")
             if tool.required_fields:
                 descriptions.append(f"  Required fields: {', '.join(tool.required_fields)}")
@@ -287,7 +572,7 @@ Generate the plan now:"""
                         required_label = "required" if required else "optional"
                         descriptions.append(f"    - {field_name} ({required_label}): {desc}")
             except Exception as e:
-                logger.debug(f"Could not extract schema for {tool_name}: {e}")
+                logger.debug("Could not extract schema for %s: %s", tool_name, e)
         
         return "\n".join(descriptions)
     
@@ -319,11 +604,11 @@ Generate the plan now:"""
                 )
                 steps.append(step)
             
-            logger.debug(f"Parsed {len(steps)} steps from plan")
+            logger.debug("Parsed %d steps from plan", len(steps))
             return steps
         
         except Exception as e:
-            logger.error(f"Failed to parse plan: {str(e)}")
+            logger.error("Failed to parse plan: %s", e)
             raise ValueError(f"Could not parse execution plan from LLM response: {str(e)}")
 
     def _normalize_tool_name(self, step_dict: Dict[str, Any]) -> str:
@@ -398,16 +683,27 @@ Generate the plan now:"""
                 )
                 steps = heuristic_steps
 
+        # First pass: cheap local repair, collecting steps that still fail validation.
+        known_steps: List[ExecutionStep] = []
+        needs_repair: List[ExecutionStep] = []
         for step in steps:
             tool_name = step.tool_name.lower()
             tool = tool_registry.get(tool_name)
             if not tool:
-                logger.warning(f"Unknown tool '{step.tool_name}' in plan")
+                logger.warning("Unknown tool '%s' in plan", step.tool_name)
                 continue
 
             input_data = step.input_data or {}
-            repaired_data = self._repair_tool_input(goal, tool_name, input_data)
-            step.input_data = repaired_data
+            step.input_data = self._repair_tool_input(goal, tool_name, input_data)
+            known_steps.append(step)
+            if tool_name != "http" and self.validator.collect_step_errors(step):
+                needs_repair.append(step)
+
+        # Repair several broken steps with one LLM call instead of one call each.
+        if len(needs_repair) > 1:
+            self.validator.batch_repair(needs_repair, goal, context)
+
+        for step in known_steps:
             step.input_data = self.validator.validate_and_repair(
                 step=step,
                 goal=goal,
@@ -540,22 +836,8 @@ Generate the plan now:"""
                 )
             ]
 
+        # Repository metadata goals with an owner/repo were handled above.
         if "github" in goal_text and ("repo" in goal_text or "repository" in goal_text):
-            owner, repo = self._extract_github_repo(goal, context)
-            if owner and repo:
-                return [
-                    ExecutionStep(
-                        step_number=1,
-                        description=f"Fetch GitHub repository metadata for {owner}/{repo}",
-                        tool_name="http",
-                        input_data={
-                            "method": "GET",
-                            "url": f"https://api.github.com/repos/{owner}/{repo}",
-                        },
-                        reasoning="Use the GitHub API to retrieve live repository metadata.",
-                    )
-                ]
-
             if "search" in goal_text:
                 query = self._extract_github_search_query(goal, context)
                 if query:
@@ -572,6 +854,21 @@ Generate the plan now:"""
                         )
                     ]
 
+        # A goal naming exactly one URL to read compiles to a single GET.
+        urls = _GOAL_URL_PATTERN.findall(goal)
+        changes_state = _WRITE_PATTERN.search(goal_text) or _STATEFUL_PATTERN.search(goal_text)
+        if len(urls) == 1 and not changes_state:
+            url = urls[0].rstrip(".,;:!?)")
+            return [
+                ExecutionStep(
+                    step_number=1,
+                    description=f"Fetch {url}",
+                    tool_name="http",
+                    input_data={"method": "GET", "url": url},
+                    reasoning="The goal names the URL to read directly.",
+                )
+            ]
+
         return []
 
     def _extract_currencies(self, goal_text: str) -> List[str]:
@@ -668,9 +965,7 @@ Generate the plan now:"""
 
     def _infer_memory_key(self, goal: str) -> str:
         """Infer a stable memory key from the goal text."""
-        cleaned = "".join(char.lower() if char.isalnum() else "_" for char in goal)
-        cleaned = "_".join(filter(None, cleaned.split("_")))
-        return cleaned[:40] or "result"
+        return _NON_ALNUM_PATTERN.sub("_", goal.lower()).strip("_")[:40] or "result"
 
     def _enforce_intent_requirements(self, steps: List[ExecutionStep], intent: str, goal: str) -> None:
         """
@@ -698,7 +993,7 @@ Generate the plan now:"""
                     f"Plan: {[s.tool_name for s in steps]}. "
                     f"This goal requires external tools (HTTP, memory, etc.) or should not be classified as 'tool_required'."
                 )
-            logger.info(f"Intent 'tool_required' enforced: plan includes {non_reasoning_tools}")
+            logger.info("Intent 'tool_required' enforced: plan includes %s", non_reasoning_tools)
         
         elif intent == "reasoning_only":
             # Reasoning-only goals should not use external tools
@@ -706,9 +1001,10 @@ Generate the plan now:"""
             external_tools = [t for t in tool_names if t not in ("reasoning", "memory")]
             if external_tools:
                 logger.warning(
-                    f"Intent mismatch: goal classified as 'reasoning_only' "
-                    f"but plan includes external tools: {external_tools}. "
-                    f"This may indicate misclassification. Continuing anyway."
+                    "Intent mismatch: goal classified as 'reasoning_only' "
+                    "but plan includes external tools: %s. "
+                    "This may indicate misclassification. Continuing anyway.",
+                    external_tools,
                 )
 
     def _ensure_user_facing_final_step(
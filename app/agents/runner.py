@@ -1,19 +1,29 @@
 """Agent runner - orchestrates planning and execution."""
 
-from typing import Any, Callable, Dict, Optional
-import json
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional
+import asyncio
+import atexit
 import re
 import time
 from app.agents.planner import PlannerAgent
 from app.agents.executor import ExecutorAgent
 from app.memory.vector_store import memory_store
 from app.memory.schemas import ExecutionContext
-from app.schemas.request_response import FinalResult
-from app.storage.execution_history import get_history_store
+from app.schemas.request_response import ExecutionStep, FinalResult
+from app.storage.execution_history import HistoryStore, get_history_store
 from app.schemas.history import ExecutionHistoryRecord, ExecutionHistoryStep
+from app.core import serialization
 from app.core.config import settings
 from app.core.logging import logger
 
+# Goals whose reasoning answers are deterministic (math, code, definitions).
+_DETERMINISTIC_GOAL_PATTERN = re.compile(
+    r"\b(?:calculate|sum|add|subtract|multiply|divide|math|code|explain|define)\b",
+    re.IGNORECASE,
+)
+
 
 class AgentRunner:
     """
@@ -30,6 +40,16 @@ class AgentRunner:
         self.executor = ExecutorAgent()
         self.memory_store = memory_store
         logger.info("AgentRunner initialized")
+
+    async def warmup(self) -> None:
+        """Issue a one-token LLM call so the first request does not pay connection setup."""
+        try:
+            await self.planner.llm_client.acall(
+                [{"role": "user", "content": "ping"}], temperature=0.0, max_tokens=1
+            )
+            logger.info("LLM client warmed up")
+        except Exception as e:
+            logger.warning("LLM warmup call failed: %s", e)
     
     def run(
         self,
@@ -47,97 +67,177 @@ class AgentRunner:
         Returns:
             ExecutionContext with complete execution record
         """
-        logger.info(f"Starting agent run for goal: {goal}")
-        
         start_time = time.monotonic()
+        execution_context = self._start_run(goal, context)
 
-        # Create execution context
-        execution_context = self.memory_store.create_execution_context(
-            goal=goal,
-            user_context=context or {}
-        )
-        logger.debug(f"Created execution context: {execution_context.execution_id}")
+        try:
+            # Phase 1: Planning
+            self._emit_planning_started(event_callback, goal)
+            steps = self.planner.plan(goal, context, execution_context.intent)
+            self._emit_plan_created(event_callback, steps)
+            
+            # Phase 2: Execution
+            logger.info("Phase 2: Execution")
+            execution_context = self.executor.execute(
+                steps=steps,
+                execution_context=execution_context,
+                max_retries=settings.MAX_RETRIES,
+                step_callback=event_callback,
+            )
+            return self._finish_run(execution_context, goal, context, start_time, event_callback)
+        
+        except Exception as e:
+            return self._fail_run(execution_context, e, start_time, event_callback)
 
-        # Intent classification (metadata only)
-        execution_context.intent = self.planner.classify_intent(goal, context)
-        execution_context.decision_rationale = self._get_decision_rationale(
-            execution_context.intent, goal
-        )
+    async def run_async(
+        self,
+        goal: str,
+        context: Optional[Dict[str, Any]] = None,
+        event_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> ExecutionContext:
+        """
+        Async variant of run() for event-loop callers.
 
+        The planner LLM call is awaited and steps run through the executor's
+        wave scheduler; remaining blocking work (history writes, repairs)
+        happens in worker threads.
+        """
+        start_time = time.monotonic()
+        execution_context = self._start_run(goal, context)
 
         try:
             # Phase 1: Planning
-            self._emit_event(event_callback, {
-                "type": "planning_started",
-                "goal": goal,
-            })
-            logger.info("Phase 1: Planning")
-            steps = self.planner.plan(goal, context)
-            logger.info(f"Generated {len(steps)} execution steps")
-            self._emit_event(event_callback, {
-                "type": "plan_created",
-                "step_count": len(steps),
-                "steps": [
-                    {
-                        "step_number": step.step_number,
-                        "description": step.description,
-                        "tool_name": step.tool_name,
-                    }
-                    for step in steps
-                ],
-            })
-            
+            self._emit_planning_started(event_callback, goal)
+            steps = await self.planner.aplan(goal, context, execution_context.intent)
+            self._emit_plan_created(event_callback, steps)
+
             # Phase 2: Execution
             logger.info("Phase 2: Execution")
-            execution_context = self.executor.execute(
+            execution_context = await self.executor.execute_async(
                 steps=steps,
                 execution_context=execution_context,
                 max_retries=settings.MAX_RETRIES,
                 step_callback=event_callback,
             )
-            
-            duration_ms = int((time.monotonic() - start_time) * 1000)
-            execution_context.execution_summary = self._build_execution_summary(
-                execution_context,
-                duration_ms,
+            return await asyncio.to_thread(
+                self._finish_run, execution_context, goal, context, start_time, event_callback
             )
-            self._resolve_final_output(execution_context)
 
-            # Save to memory
-            self.memory_store.save_context(execution_context)
-            
-            # Save to execution history
-            self._save_execution_to_history(execution_context, duration_ms)
-            logger.info(f"Execution completed with status: {execution_context.status}")
-            self._emit_event(event_callback, {
-                "type": "execution_completed",
-                "execution_id": execution_context.execution_id,
-                "status": execution_context.status,
-            })
-            
-            return execution_context
-        
         except Exception as e:
-            error_msg = f"Agent run failed: {str(e)}"
-            logger.error(error_msg)
-            execution_context.fail(error_msg)
-            duration_ms = int((time.monotonic() - start_time) * 1000)
-            execution_context.execution_summary = self._build_execution_summary(
-                execution_context,
-                duration_ms,
+            return await asyncio.to_thread(
+                self._fail_run, execution_context, e, start_time, event_callback
             )
-            self._resolve_final_output(execution_context)
-            self.memory_store.save_context(execution_context)
-            
-            # Save to execution history even on failure
-            self._save_execution_to_history(execution_context, duration_ms)
-            self._emit_event(event_callback, {
-                "type": "execution_failed",
-                "execution_id": execution_context.execution_id,
-                "status": execution_context.status,
-                "error": execution_context.error,
-            })
-            return execution_context
+
+    def _start_run(self, goal: str, context: Optional[Dict[str, Any]]) -> ExecutionContext:
+        """Create the execution context and record intent metadata."""
+        logger.info("Starting agent run for goal: %s", goal)
+
+        # Create execution context
+        execution_context = self.memory_store.create_execution_context(
+            goal=goal,
+            user_context=context or {}
+        )
+        logger.debug("Created execution context: %s", execution_context.execution_id)
+
+        # Intent classification (metadata only)
+        execution_context.intent = self.planner.classify_intent(goal, context)
+        execution_context.decision_rationale = self._get_decision_rationale(
+            execution_context.intent, goal
+        )
+        return execution_context
+
+    def _emit_planning_started(
+        self,
+        event_callback: Optional[Callable[[Dict[str, Any]], None]],
+        goal: str,
+    ) -> None:
+        self._emit_event(event_callback, {
+            "type": "planning_started",
+            "goal": goal,
+        })
+        logger.info("Phase 1: Planning")
+
+    def _emit_plan_created(
+        self,
+        event_callback: Optional[Callable[[Dict[str, Any]], None]],
+        steps: List[ExecutionStep],
+    ) -> None:
+        logger.info("Generated %d execution steps", len(steps))
+        self._log_llm_cache_stats()
+        self._emit_event(event_callback, {
+            "type": "plan_created",
+            "step_count": len(steps),
+            "steps": [
+                {
+                    "step_number": step.step_number,
+                    "description": step.description,
+                    "tool_name": step.tool_name,
+                }
+                for step in steps
+            ],
+        })
+
+    def _finish_run(
+        self,
+        execution_context: ExecutionContext,
+        goal: str,
+        context: Optional[Dict[str, Any]],
+        start_time: float,
+        event_callback: Optional[Callable[[Dict[str, Any]], None]],
+    ) -> ExecutionContext:
+        """Summarize, resolve, and persist an execution that ran to the end."""
+        duration_ms = int((time.monotonic() - start_time) * 1000)
+        execution_context.execution_summary = self._build_execution_summary(
+            execution_context,
+            duration_ms,
+        )
+        if self._has_failed_step(execution_context):
+            # Don't keep serving a plan whose tools just failed.
+            self.planner.forget_plan(goal, context, execution_context.intent)
+        self._resolve_final_output(execution_context)
+
+        # Save to memory
+        self.memory_store.save_context(execution_context)
+        
+        # Save to execution history
+        self._save_execution_to_history(execution_context, duration_ms)
+        logger.info("Execution completed with status: %s", execution_context.status)
+        self._emit_event(event_callback, {
+            "type": "execution_completed",
+            "execution_id": execution_context.execution_id,
+            "status": execution_context.status,
+        })
+        
+        return execution_context
+
+    def _fail_run(
+        self,
+        execution_context: ExecutionContext,
+        error: Exception,
+        start_time: float,
+        event_callback: Optional[Callable[[Dict[str, Any]], None]],
+    ) -> ExecutionContext:
+        """Record an execution that raised before completing."""
+        error_msg = f"Agent run failed: {str(error)}"
+        logger.error(error_msg)
+        execution_context.fail(error_msg)
+        duration_ms = int((time.monotonic() - start_time) * 1000)
+        execution_context.execution_summary = self._build_execution_summary(
+            execution_context,
+            duration_ms,
+        )
+        self._resolve_final_output(execution_context)
+        self.memory_store.save_context(execution_context)
+        
+        # Save to execution history even on failure
+        self._save_execution_to_history(execution_context, duration_ms)
+        self._emit_event(event_callback, {
+            "type": "execution_failed",
+            "execution_id": execution_context.execution_id,
+            "status": execution_context.status,
+            "error": execution_context.error,
+        })
+        return execution_context
 
 
 
@@ -152,26 +252,48 @@ class AgentRunner:
         else:
             return "Unknown intent classification."
 
+    def _log_llm_cache_stats(self) -> None:
+        """Log planner LLM cache hit/miss counters."""
+        cache = getattr(self.planner, "llm_cache", None)
+        if cache is None:
+            return
+        logger.info(
+            "Planner LLM cache stats: hits=%s misses=%s",
+            cache.hits,
+            cache.misses,
+        )
+
+    def _has_failed_step(self, execution_context: ExecutionContext) -> bool:
+        """True when the run failed or a step ran out of retries.
+
+        Failed attempts that a retry recovered from do not count.
+        """
+        if execution_context.status == "failed":
+            return True
+        succeeded: Dict[int, bool] = {}
+        for step in execution_context.executed_steps:
+            succeeded[step.step_number] = succeeded.get(step.step_number, False) or step.success
+        return not all(succeeded.values())
+
     def _build_execution_summary(
         self,
         execution_context: ExecutionContext,
         duration_ms: int,
     ) -> Dict[str, Any]:
         """Build execution summary metadata."""
-        tools_used: list[str] = []
+        tools_used: Dict[str, None] = {}  # insertion-ordered set
         tool_failures = 0
         reasoning_steps = 0
 
         for step in execution_context.executed_steps:
-            if step.tool_name not in tools_used:
-                tools_used.append(step.tool_name)
+            tools_used[step.tool_name] = None
             if not step.success:
                 tool_failures += 1
             if step.tool_name == "reasoning":
                 reasoning_steps += 1
 
         return {
-            "tools_used": tools_used,
+            "tools_used": list(tools_used),
             "tool_failures": tool_failures,
             "reasoning_steps": reasoning_steps,
             "duration_ms": duration_ms,
@@ -193,7 +315,7 @@ class AgentRunner:
         # HARD FAILURE: Execution status is "failed"
         if execution_context.status == "failed":
             error_msg = execution_context.error or (last_step.error if last_step else "Unknown error")
-            logger.warning(f"AGENTIC HARD FAILURE: {error_msg}")
+            logger.warning("AGENTIC HARD FAILURE: %s", error_msg)
             execution_context.final_result = FinalResult(
                 success=False,
                 content=None,  # NO TEXT GENERATION
@@ -207,7 +329,7 @@ class AgentRunner:
         # HARD FAILURE: No steps executed
         if not steps:
             error_msg = "No execution steps were generated or executed"
-            logger.warning(f"AGENTIC HARD FAILURE: {error_msg}")
+            logger.warning("AGENTIC HARD FAILURE: %s", error_msg)
             execution_context.final_result = FinalResult(
                 success=False,
                 content=None,  # NO TEXT GENERATION
@@ -263,24 +385,30 @@ class AgentRunner:
             return "No output available."
 
         output = last_step.output
-        if output is None or output == "":
+        # Strings pass through untouched; structured payloads are rendered
+        # once here since FinalResult.content is the display string.
+        if isinstance(output, str):
+            return output or "Tool completed but returned no data."
+        if output is None:
             return "Tool completed but returned no data."
         if isinstance(output, dict):
-            if "answer" in output and output["answer"]:
-                return str(output["answer"])
-            if "message" in output and output["message"] and not self._is_memory_ack(output):
-                return str(output["message"])
+            answer = output.get("answer")
+            if answer:
+                return answer if isinstance(answer, str) else str(answer)
+            message = output.get("message")
+            if message and not self._is_memory_ack(output):
+                return message if isinstance(message, str) else str(message)
             if "body" in output:
-                body = output.get("body")
-                if body is None or body == "":
+                body = output["body"]
+                if isinstance(body, str):
+                    return body or "Tool completed but returned no data."
+                if body is None:
                     return "Tool completed but returned no data."
                 if isinstance(body, (dict, list)):
-                    return json.dumps(body, indent=2)
+                    return serialization.dumps(body, indent=2)
                 return str(body)
-            return json.dumps(output, indent=2)
-        if isinstance(output, str):
-            return output
-        return json.dumps(output, indent=2)
+            return serialization.dumps(output, indent=2)
+        return serialization.dumps(output, indent=2)
 
     def _extract_fallback_content(self, steps: list[Any], primary_step: Any) -> str:
         """Find the most grounded alternative content when the preferred output is bad."""
@@ -341,19 +469,7 @@ class AgentRunner:
             return 0.5
         if source == "reasoning":
             # Higher confidence for deterministic queries
-            deterministic_keywords = [
-                "calculate",
-                "sum",
-                "add",
-                "subtract",
-                "multiply",
-                "divide",
-                "math",
-                "code",
-                "explain",
-                "define",
-            ]
-            if any(keyword in goal.lower() for keyword in deterministic_keywords):
+            if _DETERMINISTIC_GOAL_PATTERN.search(goal):
                 return 0.9
             return 0.75
         if source == "reasoning-only":
@@ -429,11 +545,25 @@ class AgentRunner:
             
             # Save to history store
             history_store = get_history_store()
-            history_store.save_execution(history_record)
-            logger.info(f"Saved execution to history: {execution_context.execution_id}")
+            if settings.HISTORY_ASYNC_WRITES:
+                _get_history_writer().submit(self._write_history_record, history_store, history_record)
+            else:
+                self._write_history_record(history_store, history_record)
         except Exception as e:
             # Don't fail the execution if history save fails
-            logger.error(f"Failed to save execution to history: {str(e)}")
+            logger.error("Failed to save execution to history: %s", e)
+
+    def _write_history_record(
+        self,
+        history_store: HistoryStore,
+        history_record: ExecutionHistoryRecord,
+    ) -> None:
+        """Persist a history record, logging instead of raising on failure."""
+        try:
+            history_store.save_execution(history_record)
+            logger.info("Saved execution to history: %s", history_record.execution_id)
+        except Exception as e:
+            logger.error("Failed to save execution to history: %s", e)
 
     def _emit_event(
         self,
@@ -447,3 +577,34 @@ class AgentRunner:
             event_callback(event)
         except Exception as exc:
             logger.debug("Event callback error: %s", str(exc))
+
+
+# Single background writer keeps history appends ordered when async writes are enabled.
+_history_writer: Optional[ThreadPoolExecutor] = None
+_history_writer_lock = Lock()
+
+
+def _get_history_writer() -> ThreadPoolExecutor:
+    """Return the background history writer, flushed on interpreter exit."""
+    global _history_writer
+    if _history_writer is None:
+        with _history_writer_lock:
+            if _history_writer is None:
+                _history_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="history-writer")
+                atexit.register(_history_writer.shutdown, wait=True)
+    return _history_writer
+
+
+# Shared runner so planner/validator caches stay warm across requests.
+_default_runner: Optional[AgentRunner] = None
+_default_runner_lock = Lock()
+
+
+def get_agent_runner() -> AgentRunner:
+    """Return the process-wide AgentRunner, creating it on first use."""
+    global _default_runner
+    if _default_runner is None:
+        with _default_runner_lock:
+            if _default_runner is None:
+                _default_runner = AgentRunner()
+    return _default_runner
@@ -2,25 +2,118 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 from pydantic import ValidationError
 
 from app.core.config import settings
 from app.core.logging import logger
-from app.llm.client import BaseLLMClient, get_llm_client
-from app.tools.base import tool_registry, BaseTool
+from app.llm.cache import LLMCache, llm_cache
+from app.llm.client import BaseLLMClient, LLMResponse, get_llm_client
+from app.tools.base import tool_registry, BaseTool, validate_tool_input
 from app.schemas.request_response import ExecutionStep
 
 
+# Repair prompts are fixed templates; only the per-call values are interpolated.
+_REPAIR_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": (
+        "You are a tool input validator. Generate only a JSON object for tool inputs. "
+        "Do not include any extra keys or surrounding text."
+    ),
+}
+
+_REPAIR_PROMPT_TEMPLATE = (
+    "Regenerate tool input so it matches the tool schema and required fields. "
+    "Do not include empty strings; omit optional fields if unknown.\n\n"
+    "Tool: {name}\n"
+    "Description: {description}\n"
+    "Required fields: {required_fields}\n"
+    "Schema fields:\n{schema_fields}\n\n"
+    "Goal: {goal}\n"
+    "Context: {context}\n"
+    "Current input: {current_input}\n"
+    "Validation errors: {errors}\n\n"
+    "Return JSON object only."
+)
+
+_BATCH_REPAIR_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": (
+        "You are a tool input validator. Generate only a JSON object mapping step numbers "
+        "to tool inputs. Do not include any extra keys or surrounding text."
+    ),
+}
+
+_BATCH_REPAIR_PROMPT_TEMPLATE = (
+    "Regenerate the tool input for each step below so it matches the tool schema and "
+    "required fields. Do not include empty strings; omit optional fields if unknown.\n\n"
+    "Goal: {goal}\n"
+    "Context: {context}\n\n"
+    "{step_blocks}"
+    "\n\nReturn a JSON object such as {{\"1\": {{...}}, \"3\": {{...}}}} keyed by step number."
+)
+
+_BATCH_STEP_TEMPLATE = (
+    "Step {step_number}:\n"
+    "Tool: {name}\n"
+    "Description: {description}\n"
+    "Required fields: {required_fields}\n"
+    "Schema fields:\n{schema_fields}\n"
+    "Current input: {current_input}\n"
+    "Validation errors: {errors}"
+)
+
+
+# Tool metadata is fixed once a tool is registered, so it is derived once per
+# tool instance rather than on every validation or repair prompt.
+@lru_cache(maxsize=None)
+def _required_fields(tool: BaseTool) -> Tuple[str, ...]:
+    """Return a tool's required input fields."""
+    return tuple(tool.required_fields)
+
+
+@lru_cache(maxsize=None)
+def _schema_field_lines(tool: BaseTool) -> str:
+    """Format a tool's schema fields for repair prompts."""
+    schema = tool.input_schema
+    if not hasattr(schema, "model_fields"):
+        return "- (no schema fields)"
+
+    required_fields = _required_fields(tool)
+    lines: List[str] = []
+    for field_name, field_info in schema.model_fields.items():
+        desc = field_info.description or ""
+        field_type = _format_type(field_info.annotation)
+        required_label = "required" if field_name in required_fields else "optional"
+        lines.append(f"- {field_name} ({field_type}, {required_label}): {desc}")
+
+    return "\n".join(lines)
+
+
+def _format_type(annotation: Any) -> str:
+    """Format type annotation for prompt readability."""
+    if annotation is None:
+        return "unknown"
+    if hasattr(annotation, "__name__"):
+        return annotation.__name__
+    return str(annotation)
+
+
 class ToolInputValidator:
     """Validate and repair tool inputs before execution."""
 
+    # Low temperature keeps repairs repeatable, which also makes them cacheable.
+    REPAIR_TEMPERATURE = 0.2
+
     def __init__(
         self,
         llm_client: Optional[BaseLLMClient] = None,
+        cache: Optional[LLMCache] = None,
     ) -> None:
         self.llm_client = llm_client or get_llm_client()
+        self.llm_cache = cache if cache is not None else llm_cache
 
     def validate_and_repair(
         self,
@@ -84,19 +177,87 @@ class ToolInputValidator:
             f"Unable to repair tool input for '{tool_name}'. Validation errors: {errors}"
         )
 
+    def collect_step_errors(self, step: ExecutionStep) -> List[str]:
+        """Return validation errors for a step's current input (no repair)."""
+        tool = tool_registry.get(step.tool_name.lower())
+        if not tool:
+            return [f"Tool '{step.tool_name}' not found in registry"]
+        return self._collect_errors(tool, dict(step.input_data or {}))
+
+    def batch_repair(
+        self,
+        steps: List[ExecutionStep],
+        goal: str,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Repair several failing steps with a single LLM call.
+
+        Repaired inputs are written back to each step's input_data. Steps the
+        LLM does not return a usable object for are left unchanged, so the
+        per-step validate_and_repair pass can still handle them.
+        """
+        if not steps:
+            return
+
+        context = context or {}
+        step_blocks: List[str] = []
+        for step in steps:
+            tool = tool_registry.get(step.tool_name.lower())
+            if not tool:
+                continue
+            input_data = dict(step.input_data or {})
+            step_blocks.append(_BATCH_STEP_TEMPLATE.format_map({
+                "step_number": step.step_number,
+                "name": tool.name,
+                "description": tool.description,
+                "required_fields": list(_required_fields(tool)),
+                "schema_fields": _schema_field_lines(tool),
+                "current_input": input_data,
+                "errors": self._collect_errors(tool, input_data),
+            }))
+
+        if not step_blocks:
+            return
+
+        user_prompt = _BATCH_REPAIR_PROMPT_TEMPLATE.format_map({
+            "goal": goal,
+            "context": context,
+            "step_blocks": "\n\n".join(step_blocks),
+        })
+        messages = [_BATCH_REPAIR_SYSTEM_MESSAGE, {"role": "user", "content": user_prompt}]
+
+        cache_key = self._cache_key(messages)
+        try:
+            response = self._call_llm(messages, cache_key)
+            parsed = self.llm_client.parse_json(response.content)
+        except Exception as exc:
+            logger.warning("Batch tool input repair failed: %s", exc)
+            return
+
+        if not isinstance(parsed, dict):
+            logger.warning("Batch repaired tool input was not a JSON object")
+            return
+        if not response.cached:
+            self.llm_cache.set(cache_key, response.content)
+
+        for step in steps:
+            repaired = parsed.get(str(step.step_number))
+            if isinstance(repaired, dict):
+                step.input_data = repaired
+
     def _collect_errors(self, tool: BaseTool, input_data: Dict[str, Any]) -> List[str]:
         """Collect missing field and schema validation errors."""
         errors: List[str] = []
         missing = [
             field
-            for field in tool.required_fields
+            for field in _required_fields(tool)
             if not self._has_value(input_data.get(field))
         ]
         if missing:
             errors.append(f"missing required fields: {missing}")
 
         try:
-            tool.input_schema.model_validate(input_data)
+            validate_tool_input(tool, input_data)
         except ValidationError as exc:
             errors.append(f"schema validation error: {exc}")
 
@@ -112,38 +273,20 @@ class ToolInputValidator:
         errors: List[str],
     ) -> Optional[Dict[str, Any]]:
         """Ask the LLM to regenerate valid tool inputs."""
-        schema_fields = self._format_schema_fields(tool)
-        required_fields = tool.required_fields
-
-        system_message = (
-            "You are a tool input validator. Generate only a JSON object for tool inputs. "
-            "Do not include any extra keys or surrounding text."
-        )
-
-        user_prompt = (
-            "Regenerate tool input so it matches the tool schema and required fields. "
-            "Do not include empty strings; omit optional fields if unknown.\n\n"
-            f"Tool: {tool.name}\n"
-            f"Description: {tool.description}\n"
-            f"Required fields: {required_fields}\n"
-            f"Schema fields:\n{schema_fields}\n\n"
-            f"Goal: {goal}\n"
-            f"Context: {context}\n"
-            f"Current input: {current_input}\n"
-            f"Validation errors: {errors}\n\n"
-            "Return JSON object only."
-        )
-
-        messages = [
-            {"role": "system", "content": system_message},
-            {"role": "user", "content": user_prompt},
-        ]
+        user_prompt = _REPAIR_PROMPT_TEMPLATE.format_map({
+            "name": tool.name,
+            "description": tool.description,
+            "required_fields": list(_required_fields(tool)),
+            "schema_fields": _schema_field_lines(tool),
+            "goal": goal,
+            "context": context,
+            "current_input": current_input,
+            "errors": errors,
+        })
+        messages = [_REPAIR_SYSTEM_MESSAGE, {"role": "user", "content": user_prompt}]
 
-        response = self.llm_client.call(
-            messages,
-            temperature=0.2,
-            max_tokens=settings.LLM_VALIDATOR_MAX_TOKENS,
-        )
+        cache_key = self._cache_key(messages)
+        response = self._call_llm(messages, cache_key)
         try:
             parsed = self.llm_client.parse_json(response.content)
         except Exception as exc:
@@ -151,34 +294,35 @@ class ToolInputValidator:
             return None
 
         if isinstance(parsed, dict):
+            # Only responses that yielded a usable object are worth replaying.
+            if not response.cached:
+                self.llm_cache.set(cache_key, response.content)
             return parsed
 
         logger.warning("Repaired tool input was not a JSON object")
         return None
 
-    def _format_schema_fields(self, tool: BaseTool) -> str:
-        """Format schema fields for prompting."""
-        schema = tool.input_schema
-        if not hasattr(schema, "model_fields"):
-            return "- (no schema fields)"
-
-        lines: List[str] = []
-        for field_name, field_info in schema.model_fields.items():
-            required = field_name in tool.required_fields
-            desc = field_info.description or ""
-            field_type = self._format_type(field_info.annotation)
-            required_label = "required" if required else "optional"
-            lines.append(f"- {field_name} ({field_type}, {required_label}): {desc}")
-
-        return "\n".join(lines)
-
-    def _format_type(self, annotation: Any) -> str:
-        """Format type annotation for prompt readability."""
-        if annotation is None:
-            return "unknown"
-        if hasattr(annotation, "__name__"):
-            return annotation.__name__
-        return str(annotation)
+    def _cache_key(self, messages: List[Dict[str, str]]) -> Optional[str]:
+        model = getattr(self.llm_client, "model", type(self.llm_client).__name__)
+        return self.llm_cache.make_key(
+            model, messages, self.REPAIR_TEMPERATURE, settings.LLM_VALIDATOR_MAX_TOKENS
+        )
+
+    def _call_llm(self, messages: List[Dict[str, str]], cache_key: Optional[str]) -> LLMResponse:
+        """Return a cached repair response for identical prompts, else call the LLM."""
+        content = self.llm_cache.get(cache_key)
+        if content is not None:
+            logger.info("Validator LLM cache hit")
+            return LLMResponse(
+                content=content,
+                usage={"input_tokens": 0, "output_tokens": 0},
+                cached=True,
+            )
+        return self.llm_client.call(
+            messages,
+            temperature=self.REPAIR_TEMPERATURE,
+            max_tokens=settings.LLM_VALIDATOR_MAX_TOKENS,
+        )
 
     def _has_value(self, value: Any) -> bool:
         """Return True when a value is non-empty and usable."""
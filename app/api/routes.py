@@ -5,12 +5,13 @@ import json
 from queue import Empty, Queue
 from threading import Event, Thread
 from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, ORJSONResponse
 from typing import Optional
 from sse_starlette.sse import EventSourceResponse
-from app.schemas.request_response import ExecuteRequest, ExecuteResponse, StepResult
+from app.schemas.request_response import ExecuteRequest, ExecuteResponse, build_step_result
 from app.schemas.history import HistoryListResponse, HistoryDetailResponse, HistoryStatsResponse
 from app.schemas.workflows import GitHubRepoInsightsRequest, GitHubRepoInsightsResponse, SupportTicketTriageRequest, SupportTicketTriageResponse
-from app.agents.runner import AgentRunner
+from app.agents.runner import AgentRunner, get_agent_runner
 from app.memory.schemas import ExecutionContext
 from app.storage.execution_history import get_history_store
 from app.workflows.github_repo_insights import run_github_repo_insights
@@ -18,11 +19,15 @@ from app.workflows.support_ticket_triage import run_support_ticket_triage
 from app.core.config import settings
 from app.core.logging import logger
 
-router = APIRouter(prefix="/api", tags=["agents"])
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-# Lazy initialization of runner
-_runner: AgentRunner | None = None
+# Execute responses are rendered with orjson when it is installed.
+FastJSONResponse = ORJSONResponse if orjson is not None else JSONResponse
 
+router = APIRouter(prefix="/api", tags=["agents"])
 
 @router.get("/model-info")
 def get_model_info() -> dict:
@@ -36,23 +41,20 @@ def get_model_info() -> dict:
 
 
 def get_runner() -> AgentRunner:
-    """Get or create the agent runner (lazy initialization)."""
-    global _runner
-    if _runner is None:
-        try:
-            _runner = AgentRunner()
-        except ValueError as e:
-            if "API_KEY" in str(e):
-                raise ValueError(
-                    f"{str(e)}. "
-                    "Please set your LLM API key as an environment variable."
-                ) from e
-            raise
-    return _runner
+    """Get the shared agent runner (lazy initialization)."""
+    try:
+        return get_agent_runner()
+    except ValueError as e:
+        if "API_KEY" in str(e):
+            raise ValueError(
+                f"{str(e)}. "
+                "Please set your LLM API key as an environment variable."
+            ) from e
+        raise
 
 
 @router.post("/execute", response_model=ExecuteResponse)
-def execute_goal(request: ExecuteRequest, http_request: Request) -> ExecuteResponse:
+async def execute_goal(request: ExecuteRequest, http_request: Request) -> ExecuteResponse:
     """
     Execute a high-level goal end-to-end.
     
@@ -62,22 +64,24 @@ def execute_goal(request: ExecuteRequest, http_request: Request) -> ExecuteRespo
     3. Return complete execution record
     """
     try:
-        logger.info(f"Received execution request for goal: {request.goal}")
+        logger.info("Received execution request for goal: %s", request.goal)
         
         # Get runner (lazy initialization)
         runner = get_runner()
         run_context = _merge_request_context(request.context, http_request)
         
-        # Run the agentic system
-        execution_context = runner.run(
+        # Run the agentic system without holding a threadpool worker per request
+        execution_context = await runner.run_async(
             goal=request.goal,
             context=run_context,
         )
         
         response = _build_execute_response(execution_context)
 
-        logger.info(f"Execution completed: {execution_context.execution_id}")
-        return response
+        logger.info("Execution completed: %s", execution_context.execution_id)
+        # The response is built from trusted run data, so it is dumped once and
+        # returned directly instead of being revalidated against response_model.
+        return FastJSONResponse(content=response.model_dump(mode="json", warnings=False))
     
     except ValueError as e:
         error_msg = f"Configuration error: {str(e)}"
@@ -161,21 +165,15 @@ async def execute_goal_stream(request: ExecuteRequest, http_request: Request):
 
 
 def _build_execute_response(execution_context: ExecutionContext) -> ExecuteResponse:
-    """Convert ExecutionContext to API response model."""
-    steps_result = [
-        StepResult(
-            step_number=step.step_number,
-            description=step.description,
-            tool_name=step.tool_name,
-            success=step.success,
-            input=step.input_data,
-            output=step.output,
-            error=step.error,
-        )
-        for step in execution_context.executed_steps
-    ]
+    """
+    Convert ExecutionContext to API response model.
+
+    Every field comes from the run record the server just produced, so the
+    response and its step results are built without revalidation.
+    """
+    steps_result = [build_step_result(step) for step in execution_context.executed_steps]
 
-    return ExecuteResponse(
+    return ExecuteResponse.model_construct(
         execution_id=execution_context.execution_id,
         goal=execution_context.goal,
         status=execution_context.status,
@@ -212,7 +210,7 @@ def list_execution_history(
     - status: Filter by execution status
     """
     try:
-        logger.info(f"Listing execution history: limit={limit}, offset={offset}")
+        logger.info("Listing execution history: limit=%s, offset=%s", limit, offset)
         
         history_store = get_history_store()
         executions = history_store.list_executions(
@@ -274,7 +272,7 @@ def get_execution_detail(execution_id: str) -> HistoryDetailResponse:
     Includes all steps, tool outputs, final result, and metadata.
     """
     try:
-        logger.info(f"Retrieving execution detail: {execution_id}")
+        logger.info("Retrieving execution detail: %s", execution_id)
         
         history_store = get_history_store()
         execution = history_store.get_execution(execution_id)
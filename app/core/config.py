@@ -1,6 +1,7 @@
 """Configuration module for loading environment variables and settings."""
 
 import os
+from dataclasses import dataclass
 from typing import Optional
 from pathlib import Path
 
@@ -14,8 +15,14 @@ except ImportError:
     pass  # python-dotenv not installed, skip
 
 
+@dataclass(frozen=True, slots=True)
 class Settings:
-    """Application settings loaded from environment variables."""
+    """
+    Application settings loaded from environment variables.
+
+    Values are read once at import. The instance is frozen and slotted, so
+    settings cannot drift at runtime and attribute reads skip the instance dict.
+    """
 
     # LLM Configuration
     LLM_PROVIDER: str = os.getenv("LLM_PROVIDER", "gemini")
@@ -26,16 +33,44 @@ class Settings:
     # Agent Configuration
     MAX_REASONING_STEPS: int = int(os.getenv("MAX_REASONING_STEPS", "10"))
     MAX_RETRIES: int = int(os.getenv("MAX_RETRIES", "3"))
+    # Full-jitter exponential backoff between retries of transient tool failures
+    RETRY_BACKOFF_BASE_SECONDS: float = float(os.getenv("RETRY_BACKOFF_BASE_SECONDS", "0.5"))
+    RETRY_BACKOFF_MAX_SECONDS: float = float(os.getenv("RETRY_BACKOFF_MAX_SECONDS", "30"))
     LLM_PLANNER_MAX_TOKENS: int = int(os.getenv("LLM_PLANNER_MAX_TOKENS", "800"))
     LLM_REASONING_MAX_TOKENS: int = int(os.getenv("LLM_REASONING_MAX_TOKENS", "800"))
     LLM_VALIDATOR_MAX_TOKENS: int = int(os.getenv("LLM_VALIDATOR_MAX_TOKENS", "600"))
+    # Stream planner responses and abort early on unusable steps (disabled by default)
+    LLM_PLANNER_STREAMING: bool = os.getenv("LLM_PLANNER_STREAMING", "false").lower() == "true"
+    # Coalesce concurrent async planner calls within a short window (disabled by default)
+    LLM_BATCHING_ENABLED: bool = os.getenv("LLM_BATCHING_ENABLED", "false").lower() == "true"
+    LLM_BATCH_WINDOW_MS: int = int(os.getenv("LLM_BATCH_WINDOW_MS", "10"))
+    LLM_BATCH_MAX: int = int(os.getenv("LLM_BATCH_MAX", "8"))
+    # Send a one-token LLM call at server startup to open the connection (disabled by default)
+    LLM_WARMUP_ENABLED: bool = os.getenv("LLM_WARMUP_ENABLED", "false").lower() == "true"
     HTTP_REQUEST_TIMEOUT_SECONDS: int = int(os.getenv("HTTP_REQUEST_TIMEOUT_SECONDS", "10"))
-    
+    # Max tool calls in flight for independent steps (1 runs every step sequentially)
+    TOOL_CONCURRENCY_LIMIT: int = int(os.getenv("TOOL_CONCURRENCY_LIMIT", "8"))
+
+    # LLM response cache (only low-temperature calls are cached)
+    LLM_CACHE_ENABLED: bool = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+    LLM_CACHE_MAX_ENTRIES: int = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "512"))
+    LLM_CACHE_TTL_SECONDS: int = int(os.getenv("LLM_CACHE_TTL_SECONDS", "3600"))
+    LLM_CACHE_REDIS_URL: Optional[str] = os.getenv("LLM_CACHE_REDIS_URL")
+    # Plan templates reused for similar goals (keyword Jaccard similarity; 1.0 = same keywords only)
+    PLAN_CACHE_SIMILARITY: float = float(os.getenv("PLAN_CACHE_SIMILARITY", "0.8"))
+    PLAN_CACHE_PATH: Optional[str] = os.getenv("PLAN_CACHE_PATH")
+
     # Memory Configuration
     MEMORY_TYPE: str = os.getenv("MEMORY_TYPE", "in_memory")  # in_memory or file
+    # Oldest in-memory execution contexts are dropped beyond this count
+    MEMORY_MAX_CONTEXTS: int = int(os.getenv("MEMORY_MAX_CONTEXTS", "10000"))
+    # Least recently stored memory tool keys are dropped beyond this count
+    MEMORY_TOOL_MAX_KEYS: int = int(os.getenv("MEMORY_TOOL_MAX_KEYS", "16384"))
 
     # Logging
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
+    # "text" (default) or "json" for one JSON object per log line
+    LOG_FORMAT: str = os.getenv("LOG_FORMAT", "text").lower()
 
     # API Security (optional; disabled by default to preserve current behavior)
     API_AUTH_ENABLED: bool = os.getenv("API_AUTH_ENABLED", "false").lower() == "true"
@@ -53,20 +88,23 @@ class Settings:
     HISTORY_BACKEND: str = os.getenv("HISTORY_BACKEND", "jsonl")  # jsonl | sqlite
     HISTORY_STORAGE_DIR: str = os.getenv("HISTORY_STORAGE_DIR", "./.execution_history")
     HISTORY_SQLITE_PATH: str = os.getenv("HISTORY_SQLITE_PATH", "./.execution_history/executions.db")
+    # Write history records on a background thread (disabled by default)
+    HISTORY_ASYNC_WRITES: bool = os.getenv("HISTORY_ASYNC_WRITES", "false").lower() == "true"
 
-    @classmethod
-    def validate(cls) -> None:
+    def validate(self) -> None:
         """Validate that required settings are configured."""
-        if cls.LLM_PROVIDER != "gemini":
+        if self.LLM_PROVIDER != "gemini":
             raise ValueError("Gemini-only mode enabled: set LLM_PROVIDER=gemini")
-        if cls.LLM_PROVIDER == "gemini" and not cls.GEMINI_API_KEY:
+        if self.LLM_PROVIDER == "gemini" and not self.GEMINI_API_KEY:
             raise ValueError("GEMINI_API_KEY is required when LLM_PROVIDER=gemini")
-        if cls.API_AUTH_ENABLED and not cls.API_AUTH_TOKEN:
+        if self.API_AUTH_ENABLED and not self.API_AUTH_TOKEN:
             raise ValueError("API_AUTH_TOKEN is required when API_AUTH_ENABLED=true")
-        if cls.HISTORY_BACKEND not in {"jsonl", "sqlite"}:
+        if self.HISTORY_BACKEND not in {"jsonl", "sqlite"}:
             raise ValueError("HISTORY_BACKEND must be either 'jsonl' or 'sqlite'")
-        if cls.HTTP_REQUEST_TIMEOUT_SECONDS <= 0:
+        if self.HTTP_REQUEST_TIMEOUT_SECONDS <= 0:
             raise ValueError("HTTP_REQUEST_TIMEOUT_SECONDS must be greater than 0")
+        if self.TOOL_CONCURRENCY_LIMIT <= 0:
+            raise ValueError("TOOL_CONCURRENCY_LIMIT must be greater than 0")
 
 
 settings = Settings()
@@ -0,0 +1,27 @@
+"""Terminal output helpers shared by the demo and example scripts."""
+
+from typing import Any
+import sys
+
+from app.core import serialization
+
+_RULE = "=" * 70
+
+
+def print_header(title: str) -> None:
+    """Write a section header in a single call."""
+    sys.stdout.write(f"\n{_RULE}\n{title}\n{_RULE}\n")
+
+
+def print_banner(*lines: str) -> None:
+    """Write the boxed title banner in a single call."""
+    border = " " * 68
+    rows = ["", "", "╔" + "=" * 68 + "╗", "║" + border + "║"]
+    rows += ["║" + line.center(68) + "║" for line in lines]
+    rows += ["║" + border + "║", "╚" + "=" * 68 + "╝"]
+    sys.stdout.write("\n".join(rows) + "\n")
+
+
+def format_json(obj: Any) -> str:
+    """Pretty-print JSON on a terminal; emit compact JSON when piped."""
+    return serialization.dumps(obj, indent=2 if sys.stdout.isatty() else None)
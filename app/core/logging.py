@@ -1,9 +1,25 @@
 """Logging configuration module."""
 
 import logging
+from app.core import serialization
 from app.core.config import settings
 
 
+class JSONFormatter(logging.Formatter):
+    """Render each record as a single-line JSON object."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "time": self.formatTime(record, self.datefmt),
+            "logger": record.name,
+            "level": record.levelname,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return serialization.dumps(payload)
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a configured logger instance."""
     logger = logging.getLogger(name)
@@ -11,10 +27,13 @@ def get_logger(name: str) -> logging.Logger:
     # Only configure if not already configured
     if not logger.handlers:
         handler = logging.StreamHandler()
-        formatter = logging.Formatter(
-            fmt="[%(asctime)s] %(name)s - %(levelname)s - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S"
-        )
+        if settings.LOG_FORMAT == "json":
+            formatter = JSONFormatter(datefmt="%Y-%m-%dT%H:%M:%S")
+        else:
+            formatter = logging.Formatter(
+                fmt="[%(asctime)s] %(name)s - %(levelname)s - %(message)s",
+                datefmt="%Y-%m-%d %H:%M:%S"
+            )
         handler.setFormatter(formatter)
         logger.addHandler(handler)
         logger.setLevel(settings.LOG_LEVEL)
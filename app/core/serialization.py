@@ -0,0 +1,69 @@
+"""JSON serialization helpers backed by orjson when available."""
+
+from datetime import date, datetime
+from typing import Any, Callable, Optional, Union
+import json
+import re
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from pydantic import BaseModel
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except clause covers both.
+JSONDecodeError = json.JSONDecodeError
+
+# orjson decodes integers beyond 64 bits as floats. Any run of 19+ digits may be
+# one, so such documents go to the stdlib parser, which keeps them exact.
+_LONG_DIGITS_PATTERN = re.compile(r"\d{19}")
+_LONG_DIGITS_BYTES_PATTERN = re.compile(rb"\d{19}")
+
+
+def _default(obj: Any) -> Any:
+    """Serialize types that neither encoder handles natively."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def loads(data: Union[str, bytes, bytearray]) -> Any:
+    """Parse a JSON document, keeping integers of any size exact."""
+    if orjson is not None:
+        pattern = _LONG_DIGITS_PATTERN if isinstance(data, str) else _LONG_DIGITS_BYTES_PATTERN
+        if pattern.search(data) is None:
+            return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(
+    obj: Any,
+    indent: Optional[int] = None,
+    sort_keys: bool = False,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> str:
+    """
+    Serialize obj to a JSON string.
+
+    Uses orjson for compact or two-space indented output and falls back to
+    the stdlib encoder for other indents or values orjson rejects (such as
+    non-string keys or integers beyond 64 bits).
+    """
+    default = default or _default
+    if orjson is not None and indent in (None, 2):
+        option = 0
+        if indent == 2:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, default=default, option=option).decode("utf-8")
+        except TypeError:
+            pass
+
+    return json.dumps(obj, indent=indent, sort_keys=sort_keys, default=default)
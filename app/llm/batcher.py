@@ -0,0 +1,89 @@
+"""Coalesce LLM calls that arrive within a short window."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
+import asyncio
+
+from app.core import serialization
+from app.core.logging import logger
+
+if TYPE_CHECKING:
+    from app.llm.client import BaseLLMClient, LLMResponse
+
+_PendingCall = Tuple[List[Dict[str, str]], float, Optional[int], "asyncio.Future[LLMResponse]"]
+
+
+class MicroBatcher:
+    """
+    Collect acall requests for a few milliseconds and dispatch them together.
+
+    A batch is flushed when the window elapses or it reaches max_batch.
+    Gemini has no multi-prompt endpoint, so a flush dispatches one
+    concurrent acall per distinct request. Identical requests in the same
+    window (same messages, temperature, and max_tokens) share a single call.
+    A batcher is bound to the event loop it was first used on.
+    """
+
+    def __init__(self, client: "BaseLLMClient", window_ms: int = 10, max_batch: int = 8) -> None:
+        self.client = client
+        self.window_seconds = max(window_ms, 0) / 1000
+        self.max_batch = max(1, max_batch)
+        self._pending: List[_PendingCall] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # The loop only keeps weak references to tasks, so in-flight dispatches are held here.
+        self._dispatch_tasks: Set["asyncio.Task[None]"] = set()
+
+    async def submit(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+    ) -> "LLMResponse":
+        """Queue a call and wait for its batch to complete."""
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[LLMResponse]" = loop.create_future()
+        self._pending.append((messages, temperature, max_tokens, future))
+
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window_seconds, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._dispatch(batch))
+            self._dispatch_tasks.add(task)
+            task.add_done_callback(self._dispatch_tasks.discard)
+
+    async def _dispatch(self, batch: List[_PendingCall]) -> None:
+        groups: Dict[str, List[_PendingCall]] = {}
+        for call in batch:
+            messages, temperature, max_tokens, _ = call
+            key = serialization.dumps([messages, temperature, max_tokens], sort_keys=True)
+            groups.setdefault(key, []).append(call)
+
+        if len(groups) < len(batch):
+            logger.debug("Coalesced %d LLM calls into %d", len(batch), len(groups))
+
+        calls = list(groups.values())
+        results = await asyncio.gather(
+            *[
+                self.client.acall(messages, temperature=temperature, max_tokens=max_tokens)
+                for (messages, temperature, max_tokens, _), *_ in calls
+            ],
+            return_exceptions=True,
+        )
+        for group, result in zip(calls, results):
+            for *_, future in group:
+                if future.done():
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
@@ -0,0 +1,210 @@
+"""Response cache for deterministic LLM calls."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, List, Optional, Protocol, Tuple
+import hashlib
+import time
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+from app.core import serialization
+from app.core.config import settings
+from app.core.logging import logger
+
+# Calls sampled above this temperature are not expected to be repeatable.
+MAX_CACHEABLE_TEMPERATURE = 0.5
+
+
+class CacheBackend(Protocol):
+    """Storage interface for cached LLM responses."""
+
+    def get(self, key: str) -> Optional[str]:
+        ...
+
+    def set(self, key: str, value: str, ttl: Optional[int] = None) -> None:
+        ...
+
+    def delete(self, key: str) -> None:
+        ...
+
+    def clear(self) -> None:
+        ...
+
+
+class InMemoryLRUBackend:
+    """Thread-safe LRU backend with per-entry expiry."""
+
+    def __init__(self, max_entries: int = 512) -> None:
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[str, Tuple[str, Optional[float]]]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str, ttl: Optional[int] = None) -> None:
+        expires_at = time.monotonic() + ttl if ttl else None
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RedisBackend:
+    """Redis-backed cache shared across worker processes."""
+
+    def __init__(self, url: str, prefix: str = "agentic:llm:") -> None:
+        if redis is None:
+            raise ImportError("redis package not installed. Install with: pip install redis")
+
+        self.prefix = prefix
+        self._client = redis.Redis.from_url(url, decode_responses=True)
+
+    def get(self, key: str) -> Optional[str]:
+        return self._client.get(self.prefix + key)
+
+    def set(self, key: str, value: str, ttl: Optional[int] = None) -> None:
+        self._client.set(self.prefix + key, value, ex=ttl or None)
+
+    def delete(self, key: str) -> None:
+        self._client.delete(self.prefix + key)
+
+    def clear(self) -> None:
+        for key in self._client.scan_iter(f"{self.prefix}*"):
+            self._client.delete(key)
+
+
+class LLMCache:
+    """
+    Cache raw LLM response text for repeatable calls.
+
+    Keys are derived from the model, messages, and sampling parameters.
+    High-temperature calls are never cached.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        ttl: Optional[int] = None,
+        enabled: bool = True,
+    ) -> None:
+        self.backend = backend if backend is not None else InMemoryLRUBackend(settings.LLM_CACHE_MAX_ENTRIES)
+        self.ttl = settings.LLM_CACHE_TTL_SECONDS if ttl is None else ttl
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+
+    def make_key(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: Optional[int] = None,
+    ) -> Optional[str]:
+        """Return a cache key, or None when the call should not be cached."""
+        if not self.enabled or temperature > MAX_CACHEABLE_TEMPERATURE:
+            return None
+
+        payload = serialization.dumps(
+            {
+                "model": model,
+                "messages": messages,
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: Optional[str]) -> Optional[str]:
+        """Return cached response text for a key, counting hits and misses."""
+        if key is None:
+            return None
+
+        try:
+            value = self.backend.get(key)
+        except Exception as exc:
+            logger.warning("LLM cache read failed: %s", exc)
+            value = None
+
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key: Optional[str], value: str, ttl: Optional[int] = None) -> None:
+        """Store response text for a key."""
+        if key is None:
+            return
+
+        try:
+            self.backend.set(key, value, ttl=self.ttl if ttl is None else ttl)
+        except Exception as exc:
+            logger.warning("LLM cache write failed: %s", exc)
+
+    def delete(self, key: Optional[str]) -> None:
+        """Remove the response stored for a key, if any."""
+        if key is None:
+            return
+
+        try:
+            self.backend.delete(key)
+        except Exception as exc:
+            logger.warning("LLM cache delete failed: %s", exc)
+
+    def clear(self) -> None:
+        """Remove all cached entries and reset counters."""
+        self.backend.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters for logging."""
+        return {"hits": self.hits, "misses": self.misses}
+
+
+def _build_default_cache() -> LLMCache:
+    """Build the process-wide cache from settings."""
+    backend: Optional[CacheBackend] = None
+    if settings.LLM_CACHE_REDIS_URL:
+        try:
+            backend = RedisBackend(settings.LLM_CACHE_REDIS_URL)
+        except Exception as exc:
+            logger.warning("Redis LLM cache unavailable, using in-memory cache: %s", exc)
+
+    return LLMCache(backend=backend, enabled=settings.LLM_CACHE_ENABLED)
+
+
+# Global LLM response cache
+llm_cache = _build_default_cache()
@@ -1,8 +1,9 @@
 """LLM client abstraction for calling language models."""
 
-from typing import Any, Dict, Optional
+from threading import Lock
+from typing import Any, Dict, Iterator, Optional, Tuple
 from abc import ABC, abstractmethod
-import json
+import asyncio
 import re
 
 try:
@@ -15,16 +16,60 @@ try:
 except ImportError:
     genai = None
 
+from app.core import serialization
 from app.core.config import settings
 from app.core.logging import logger
 
 
+# Characters that affect bracket matching; everything else is skipped in C.
+_JSON_STRUCTURAL_PATTERN = re.compile(r'["\\{}\[\]]')
+
+
+def _next_json_start(text: str, pos: int) -> int:
+    """Return the index of the next '{' or '[' at or after pos, or -1."""
+    starts = [idx for idx in (text.find("{", pos), text.find("[", pos)) if idx != -1]
+    return min(starts) if starts else -1
+
+
+def _find_json_end(text: str, start_idx: int) -> int:
+    """
+    Return the index just past the bracket that closes text[start_idx].
+
+    Scans once, tracking nesting and string literals (with escapes) so
+    brackets inside strings are ignored. Returns -1 if the block never closes.
+    The regex engine skips ordinary characters, so the Python loop only runs
+    for quotes, backslashes, and brackets.
+    """
+    depth = 0
+    in_string = False
+    resume_idx = start_idx
+    for match in _JSON_STRUCTURAL_PATTERN.finditer(text, start_idx):
+        idx = match.start()
+        if idx < resume_idx:
+            continue  # escaped character
+        char = match.group()
+        if in_string:
+            if char == "\\":
+                resume_idx = idx + 2
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in "{[":
+            depth += 1
+        elif char in "}]":
+            depth -= 1
+            if depth == 0:
+                return idx + 1
+    return -1
+
+
 def _parse_json_flexible(text: str) -> Dict[str, Any]:
     """Parse JSON from LLM output using strict, extracted, and repaired fallbacks."""
     # 1) Strict parse first.
     try:
-        return json.loads(text)
-    except json.JSONDecodeError:
+        return serialization.loads(text)
+    except serialization.JSONDecodeError:
         pass
 
     # 2) Strip markdown fences if present.
@@ -32,27 +77,38 @@ def _parse_json_flexible(text: str) -> Dict[str, Any]:
     if fenced:
         candidate = fenced.group(1)
         try:
-            return json.loads(candidate)
-        except json.JSONDecodeError:
+            return serialization.loads(candidate)
+        except serialization.JSONDecodeError:
             pass
 
-    # 3) Extract first object/array-like block and try progressively shorter slices.
-    for start_char in ["{", "["]:
-        start_idx = text.find(start_char)
-        if start_idx == -1:
-            continue
-        for end_idx in range(len(text), start_idx, -1):
-            chunk = text[start_idx:end_idx]
+    # 3) Extract the first balanced object block, else the first array block.
+    first_array = None
+    start_idx = _next_json_start(text, 0)
+    while start_idx != -1:
+        end_idx = _find_json_end(text, start_idx)
+        if end_idx != -1:
             try:
-                return json.loads(chunk)
-            except json.JSONDecodeError:
+                parsed = serialization.loads(text[start_idx:end_idx])
+            except serialization.JSONDecodeError:
+                pass
+            else:
+                if isinstance(parsed, dict):
+                    return parsed
+                if first_array is None:
+                    first_array = parsed
+                # Objects inside this array are its items, not a separate answer.
+                start_idx = _next_json_start(text, end_idx)
                 continue
+        # Unclosed or invalid: try the next opener.
+        start_idx = _next_json_start(text, start_idx + 1)
+    if first_array is not None:
+        return first_array
 
     # 4) Repair malformed JSON as last resort.
     if repair_json is not None:
         try:
             repaired = repair_json(text)
-            return json.loads(repaired)
+            return serialization.loads(repaired)
         except Exception:
             pass
 
@@ -61,10 +117,18 @@ def _parse_json_flexible(text: str) -> Dict[str, Any]:
 
 class LLMResponse:
     """Structured LLM response."""
+
+    __slots__ = ("content", "usage", "cached")
     
-    def __init__(self, content: str, usage: Optional[Dict[str, int]] = None):
+    def __init__(
+        self,
+        content: str,
+        usage: Optional[Dict[str, int]] = None,
+        cached: bool = False,
+    ):
         self.content = content
         self.usage = usage or {}
+        self.cached = cached  # True when served from the response cache
     
     def __str__(self) -> str:
         return self.content
@@ -72,6 +136,9 @@ class LLMResponse:
 
 class BaseLLMClient(ABC):
     """Abstract base for LLM clients."""
+
+    # Subclasses without __slots__ still get an instance __dict__.
+    __slots__ = ("_batcher",)
     
     @abstractmethod
     def call(
@@ -82,11 +149,50 @@ class BaseLLMClient(ABC):
     ) -> LLMResponse:
         """Call the LLM with a list of messages."""
         pass
+
+    async def acall(
+        self,
+        messages: list[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+    ) -> LLMResponse:
+        """Async call. Defaults to running call() in a worker thread."""
+        return await asyncio.to_thread(
+            self.call, messages, temperature=temperature, max_tokens=max_tokens
+        )
+
+    async def acall_batched(
+        self,
+        messages: list[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+    ) -> LLMResponse:
+        """acall through a per-event-loop MicroBatcher that coalesces concurrent calls."""
+        from app.llm.batcher import MicroBatcher
+
+        loop = asyncio.get_running_loop()
+        bound = getattr(self, "_batcher", None)
+        if bound is None or bound[0] is not loop:
+            bound = (loop, MicroBatcher(
+                self,
+                window_ms=settings.LLM_BATCH_WINDOW_MS,
+                max_batch=settings.LLM_BATCH_MAX,
+            ))
+            self._batcher = bound
+        return await bound[1].submit(messages, temperature=temperature, max_tokens=max_tokens)
+
+    def stream(
+        self,
+        messages: list[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+    ) -> Iterator[str]:
+        """Yield response text chunks. Defaults to one chunk from call()."""
+        yield self.call(messages, temperature=temperature, max_tokens=max_tokens).content
     
-    @abstractmethod
     def parse_json(self, text: str) -> Dict[str, Any]:
         """Attempt to parse JSON from LLM response."""
-        pass
+        return _parse_json_flexible(text)
 
 
 class GeminiClient(BaseLLMClient):
@@ -104,7 +210,7 @@ class GeminiClient(BaseLLMClient):
         
         genai.configure(api_key=self.api_key)
         self.client = genai.GenerativeModel(self.model)
-        logger.info(f"Initialized Gemini client with model: {self.model}")
+        logger.info("Initialized Gemini client with model: %s", self.model)
     
     def call(
         self,
@@ -114,43 +220,7 @@ class GeminiClient(BaseLLMClient):
     ) -> LLMResponse:
         """Call Gemini API."""
         try:
-            # Convert chat-style messages to Gemini format.
-            # Gemini expects roles to be "user" or "model"; it does not accept "system".
-            # We fold system prompts into the first user message as instructions.
-            gemini_messages = []
-            system_instructions: list[str] = []
-
-            for msg in messages:
-                role = (msg.get("role") or "user").lower()
-                content = str(msg.get("content", ""))
-                if not content.strip():
-                    continue
-
-                if role == "system":
-                    system_instructions.append(content.strip())
-                    continue
-
-                gemini_role = "model" if role == "assistant" else "user"
-                gemini_messages.append({
-                    "role": gemini_role,
-                    "parts": [{"text": content}],
-                })
-
-            if system_instructions:
-                instruction_block = "\n\n".join(system_instructions)
-                if gemini_messages and gemini_messages[0]["role"] == "user":
-                    first_text = gemini_messages[0]["parts"][0]["text"]
-                    gemini_messages[0]["parts"][0]["text"] = (
-                        f"Instructions:\n{instruction_block}\n\nUser request:\n{first_text}"
-                    )
-                else:
-                    gemini_messages.insert(0, {
-                        "role": "user",
-                        "parts": [{"text": f"Instructions:\n{instruction_block}"}],
-                    })
-
-            if not gemini_messages:
-                raise ValueError("No valid messages to send to Gemini")
+            gemini_messages = self._to_gemini_messages(messages)
             
             response = self.client.generate_content(
                 contents=gemini_messages,
@@ -160,26 +230,125 @@ class GeminiClient(BaseLLMClient):
                 }
             )
             
-            content = response.text
-            
-            # Attempt to extract token usage if available
-            usage = {}
-            if hasattr(response, 'usage_metadata'):
-                usage = {
-                    "input_tokens": getattr(response.usage_metadata, 'prompt_tokens', 0),
-                    "output_tokens": getattr(response.usage_metadata, 'candidates_tokens', 0),
-                }
-            
-            logger.debug(f"Gemini call successful. Tokens: {usage}")
-            return LLMResponse(content=content, usage=usage)
+            return self._to_llm_response(response)
         
         except Exception as e:
-            logger.error(f"Gemini API call failed: {str(e)}")
+            logger.error("Gemini API call failed: %s", e)
             raise
+
+    async def acall(
+        self,
+        messages: list[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+    ) -> LLMResponse:
+        """Call Gemini API without blocking the event loop."""
+        try:
+            response = await self.client.generate_content_async(
+                contents=self._to_gemini_messages(messages),
+                generation_config={
+                    "temperature": temperature,
+                    "max_output_tokens": max_tokens or 2000,
+                }
+            )
+            return self._to_llm_response(response)
+
+        except Exception as e:
+            logger.error("Gemini async API call failed: %s", e)
+            raise
+
+    def _to_llm_response(self, response: Any) -> LLMResponse:
+        """Wrap a Gemini response, including token usage when reported."""
+        content = response.text
+        
+        # Attempt to extract token usage if available
+        usage = {}
+        if hasattr(response, 'usage_metadata'):
+            usage = {
+                "input_tokens": getattr(response.usage_metadata, 'prompt_tokens', 0),
+                "output_tokens": getattr(response.usage_metadata, 'candidates_tokens', 0),
+            }
+        
+        logger.debug("Gemini call successful. Tokens: %s", usage)
+        return LLMResponse(content=content, usage=usage)
     
-    def parse_json(self, text: str) -> Dict[str, Any]:
-        """Extract JSON from text."""
-        return _parse_json_flexible(text)
+    def stream(
+        self,
+        messages: list[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+    ) -> Iterator[str]:
+        """Stream Gemini response text as it is generated."""
+        gemini_messages = self._to_gemini_messages(messages)
+        try:
+            response = self.client.generate_content(
+                contents=gemini_messages,
+                generation_config={
+                    "temperature": temperature,
+                    "max_output_tokens": max_tokens or 2000,
+                },
+                stream=True,
+            )
+            for chunk in response:
+                try:
+                    text = chunk.text
+                except ValueError:
+                    # Chunks without text parts (e.g. safety metadata) carry no content.
+                    continue
+                if text:
+                    yield text
+        except Exception as e:
+            logger.error("Gemini streaming call failed: %s", e)
+            raise
+
+    def _to_gemini_messages(self, messages: list[Dict[str, str]]) -> list[Dict[str, Any]]:
+        """Convert chat-style messages to Gemini format.
+
+        Gemini expects roles to be "user" or "model"; it does not accept "system".
+        We fold system prompts into the first user message as instructions.
+        """
+        gemini_messages = []
+        system_instructions: list[str] = []
+
+        for msg in messages:
+            role = (msg.get("role") or "user").lower()
+            content = str(msg.get("content", ""))
+            if not content.strip():
+                continue
+
+            if role == "system":
+                system_instructions.append(content.strip())
+                continue
+
+            gemini_role = "model" if role == "assistant" else "user"
+            gemini_messages.append({
+                "role": gemini_role,
+                "parts": [{"text": content}],
+            })
+
+        if system_instructions:
+            instruction_block = "\n\n".join(system_instructions)
+            if gemini_messages and gemini_messages[0]["role"] == "user":
+                first_text = gemini_messages[0]["parts"][0]["text"]
+                gemini_messages[0]["parts"][0]["text"] = (
+                    f"Instructions:\n{instruction_block}\n\nUser request:\n{first_text}"
+                )
+            else:
+                gemini_messages.insert(0, {
+                    "role": "user",
+                    "parts": [{"text": f"Instructions:\n{instruction_block}"}],
+                })
+
+        if not gemini_messages:
+            raise ValueError("No valid messages to send to Gemini")
+
+        return gemini_messages
+
+
+# Clients are shared per (api_key, model) so the planner, validator, and
+# reasoning tool reuse one configured model and its transport connections.
+_clients: Dict[Tuple[Optional[str], str], BaseLLMClient] = {}
+_clients_lock = Lock()
 
 
 def get_llm_client() -> BaseLLMClient:
@@ -189,4 +358,12 @@ def get_llm_client() -> BaseLLMClient:
     if provider != "gemini":
         raise ValueError(f"Gemini-only mode enabled. Unsupported LLM_PROVIDER: {provider}")
 
-    return GeminiClient()
+    key = (settings.GEMINI_API_KEY, settings.GEMINI_MODEL)
+    client = _clients.get(key)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(key)
+            if client is None:
+                client = GeminiClient()
+                _clients[key] = client
+    return client
@@ -1,19 +1,39 @@
 """Main entry point for the FastAPI application."""
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
-from app.api.routes import router
+from app.api.routes import FastJSONResponse, router
+from app.agents.runner import get_agent_runner
 from app.tools import initialize_tools
 from app.core.logging import logger
 from app.core.config import settings
 from app.core.security import APISecurityMiddleware
 
-# Initialize tools on startup
-initialize_tools()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Build tools and the shared runner at worker startup, not on the first request."""
+    logger.info("Agentic AI System starting up...")
+    initialize_tools()
+    try:
+        app.state.runner = get_agent_runner()
+    except ValueError as e:
+        # Keep serving health checks; /api/execute reports the configuration error.
+        logger.warning("Agent runner not initialized at startup: %s", e)
+    else:
+        if settings.LLM_WARMUP_ENABLED:
+            await app.state.runner.warmup()
+    yield
+    logger.info("Agentic AI System shutting down...")
+
 
 app = FastAPI(
     title="Agentic AI System",
     description="Production-style agentic AI system with planning and execution",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
 # Add optional API auth/rate-limiting middleware only when enabled.
@@ -40,15 +60,3 @@ def root():
         "docs": "/docs",
         "status": "running"
     }
-
-
-@app.on_event("startup")
-async def startup_event():
-    """Called on application startup."""
-    logger.info("Agentic AI System starting up...")
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Called on application shutdown."""
-    logger.info("Agentic AI System shutting down...")
\ No newline at end of file
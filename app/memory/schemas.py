@@ -1,12 +1,28 @@
 """Memory schemas for execution tracking."""
 
-from typing import Any, Dict, List, Optional
-from datetime import datetime
-from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime, timedelta
+import time
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _ns_to_datetime(timestamp_ns: int) -> datetime:
+    """Convert epoch nanoseconds to a naive UTC datetime (microsecond precision)."""
+    return _EPOCH + timedelta(microseconds=timestamp_ns // 1000)
 
 
 class ExecutionStep(BaseModel):
-    """Record of a single executed step."""
+    """
+    Record of a single executed step.
+
+    The executor builds these from already-validated plan steps and tool
+    outputs via model_construct, so validation only runs for external input.
+    """
+    # Schema and validator are built on first validation instead of at import.
+    model_config = ConfigDict(defer_build=True)
+
     step_number: int
     description: str
     tool_name: str
@@ -14,7 +30,12 @@ class ExecutionStep(BaseModel):
     output: Any
     success: bool
     error: Optional[str] = None
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    # Epoch nanoseconds; converted to datetime only when read.
+    timestamp_ns: int = Field(default_factory=time.time_ns)
+
+    @property
+    def timestamp(self) -> datetime:
+        return _ns_to_datetime(self.timestamp_ns)
 
 
 class ExecutionContext(BaseModel):
@@ -29,14 +50,32 @@ class ExecutionContext(BaseModel):
     final_result: Optional[Any] = None  # Will be FinalResult object at runtime; Any to avoid circular imports
     execution_summary: Optional[Dict[str, Any]] = None
     status: str = "running"  # running, completed, failed
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    completed_at: Optional[datetime] = None
+    # Epoch nanoseconds; see the created_at/completed_at properties.
+    created_at_ns: int = Field(default_factory=time.time_ns)
+    completed_at_ns: Optional[int] = None
     error: Optional[str] = None
     
-    model_config = {"arbitrary_types_allowed": True}
+    # Assignments are not revalidated: the executor mutates this context once
+    # per step, and add_step/set_output must stay O(1) in-place updates.
+    model_config = ConfigDict(arbitrary_types_allowed=True, validate_assignment=False, defer_build=True)
+
+    # Successful tool outputs keyed by (tool_name, canonical input) for this run
+    _tool_results: Dict[Tuple[str, str], Any] = PrivateAttr(default_factory=dict)
     
+    @property
+    def created_at(self) -> datetime:
+        """UTC start time of the run."""
+        return _ns_to_datetime(self.created_at_ns)
+
+    @property
+    def completed_at(self) -> Optional[datetime]:
+        """UTC time the run completed or failed, if it has finished."""
+        if self.completed_at_ns is None:
+            return None
+        return _ns_to_datetime(self.completed_at_ns)
+
     def add_step(self, step: ExecutionStep) -> None:
-        """Add a step to the execution record."""
+        """Append a step to the execution record in place."""
         self.executed_steps.append(step)
     
     def set_output(self, step_number: int, output: Any, key: Optional[str] = None) -> None:
@@ -46,14 +85,22 @@ class ExecutionContext(BaseModel):
         else:
             self.intermediate_outputs[f"step_{step_number}"] = output
     
+    def get_tool_result(self, signature: Tuple[str, str]) -> Optional[Any]:
+        """Return a tool output recorded earlier in this run, if any."""
+        return self._tool_results.get(signature)
+
+    def store_tool_result(self, signature: Tuple[str, str], output: Any) -> None:
+        """Remember a successful tool output for reuse by duplicate steps."""
+        self._tool_results[signature] = output
+    
     def complete(self, final_result: Any) -> None:
         """Mark execution as completed."""
         self.status = "completed"
         self.final_result = final_result
-        self.completed_at = datetime.utcnow()
+        self.completed_at_ns = time.time_ns()
     
     def fail(self, error: str) -> None:
         """Mark execution as failed."""
         self.status = "failed"
         self.error = error
-        self.completed_at = datetime.utcnow()
+        self.completed_at_ns = time.time_ns()
@@ -1,9 +1,12 @@
 """Memory storage - in-memory store for Phase 1."""
 
-from typing import Dict, Optional
+from collections import OrderedDict
+from itertools import islice
+from typing import Any, Dict, Optional
 import uuid
 
 from app.memory.schemas import ExecutionContext
+from app.core.config import settings
 from app.core.logging import logger
 
 
@@ -19,22 +22,26 @@ class MemoryStore:
     The interface stays the same; only implementation changes.
     """
     
-    def __init__(self):
-        self._contexts: Dict[str, ExecutionContext] = {}
+    def __init__(self, max_contexts: Optional[int] = None) -> None:
+        # Ordered oldest to most recently saved; the oldest is evicted past max_contexts.
+        self._contexts: "OrderedDict[str, ExecutionContext]" = OrderedDict()
+        self.max_contexts = max(1, max_contexts or settings.MEMORY_MAX_CONTEXTS)
     
     def create_execution_context(
         self,
         goal: str,
-        user_context: Optional[Dict] = None,
+        user_context: Optional[Dict[str, Any]] = None,
     ) -> ExecutionContext:
         """Create a new execution context."""
+        # execution_id is returned by the API and used to fetch history, so it
+        # stays a dashed uuid4 from os.urandom rather than a cheaper PRNG id.
         context = ExecutionContext(
             execution_id=str(uuid.uuid4()),
             goal=goal,
             user_context=user_context or {},
         )
-        self._contexts[context.execution_id] = context
-        logger.debug(f"Created execution context: {context.execution_id}")
+        self._put(context)
+        logger.debug("Created execution context: %s", context.execution_id)
         return context
     
     def get_context(self, execution_id: str) -> Optional[ExecutionContext]:
@@ -43,13 +50,18 @@ class MemoryStore:
     
     def save_context(self, context: ExecutionContext) -> None:
         """Save/update an execution context."""
-        self._contexts[context.execution_id] = context
-        logger.debug(f"Saved execution context: {context.execution_id}")
+        self._put(context)
+        logger.debug("Saved execution context: %s", context.execution_id)
     
     def list_contexts(self, limit: int = 10) -> list[ExecutionContext]:
-        """List recent execution contexts."""
-        # Return in reverse order (most recent first)
-        return list(self._contexts.values())[-limit:][::-1]
+        """List recent execution contexts, most recent first."""
+        return list(islice(reversed(self._contexts.values()), max(limit, 0)))
+
+    def _put(self, context: ExecutionContext) -> None:
+        self._contexts[context.execution_id] = context
+        self._contexts.move_to_end(context.execution_id)
+        while len(self._contexts) > self.max_contexts:
+            self._contexts.popitem(last=False)
     
     def clear(self) -> None:
         """Clear all contexts (for testing)."""
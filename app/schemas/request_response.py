@@ -51,6 +51,19 @@ class StepResult(BaseModel):
     error: Optional[str] = None
 
 
+def build_step_result(step: Any) -> StepResult:
+    """Build a StepResult from a recorded memory step without revalidating it."""
+    return StepResult.model_construct(
+        step_number=step.step_number,
+        description=step.description,
+        tool_name=step.tool_name,
+        success=step.success,
+        input=step.input_data,
+        output=step.output,
+        error=step.error,
+    )
+
+
 class FinalResult(BaseModel):
     """Strictly-typed final output from execution.
     
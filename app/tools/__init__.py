@@ -15,27 +15,15 @@ __all__ = [
 ]
 
 
-_initialized = False
+# Built-in tools are registered once, when this package is first imported.
+for _tool in (HTTPTool(), MemoryTool(), ReasoningTool()):
+    try:
+        tool_registry.register(_tool)
+    except ValueError:
+        pass  # Already registered (e.g. by a test or an earlier import path)
+del _tool
 
 
 def initialize_tools() -> ToolRegistry:
-    """Initialize and register all available tools."""
-    global _initialized
-    
-    if _initialized:
-        return tool_registry
-    
-    # Register HTTP tool (if not already registered)
-    if "http" not in tool_registry:
-        tool_registry.register(HTTPTool())
-    
-    # Register Memory tool (if not already registered)
-    if "memory" not in tool_registry:
-        tool_registry.register(MemoryTool())
-    
-    # Register Reasoning tool (if not already registered)
-    if "reasoning" not in tool_registry:
-        tool_registry.register(ReasoningTool())
-    
-    _initialized = True
+    """Return the tool registry; built-in tools are registered at import."""
     return tool_registry
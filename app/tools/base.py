@@ -1,8 +1,10 @@
 """Base tool interface for agentic system."""
 
-from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
-from pydantic import BaseModel
+from functools import cached_property, lru_cache
+import asyncio
+import sys
+from typing import Any, Dict, Optional, Tuple
+from pydantic import BaseModel, TypeAdapter
 
 
 class ToolInput(BaseModel):
@@ -17,52 +19,51 @@ class ToolOutput(BaseModel):
     error: Optional[str] = None
 
 
-class BaseTool(ABC):
+class BaseTool:
     """
-    Abstract base class for all tools.
+    Base class for all tools.
     
     Tools are modular, reusable components that agents can invoke to:
     - Call external APIs
     - Execute code
     - Store/retrieve data
     - Perform computations
+
+    Subclasses set name and description as class attributes and implement
+    execute(). Tools are plain classes with empty __slots__ so instances
+    carry no per-instance __dict__ unless a subclass needs state.
     """
-    
-    @property
-    @abstractmethod
-    def name(self) -> str:
-        """Name of the tool (used by agents to call it)."""
-        pass
-    
-    @property
-    @abstractmethod
-    def description(self) -> str:
-        """Clear description of what the tool does and when to use it."""
-        pass
-    
-    @property
-    def input_schema(self) -> type[BaseModel]:
-        """
-        Pydantic model defining the input schema for this tool.
-        Agents will use this to structure input before calling execute().
-        """
-        return ToolInput
 
-    @property
-    def required_fields(self) -> list[str]:
-        """Return minimal required fields for this tool's input."""
-        required: list[str] = []
-        schema = self.input_schema
-        if hasattr(schema, "model_fields"):
-            for field_name, field_info in schema.model_fields.items():
-                is_required = False
-                if hasattr(field_info, "is_required"):
-                    is_required = field_info.is_required()
-                if is_required:
-                    required.append(field_name)
-        return required
+    __slots__ = ()
+
+    # Name of the tool (used by agents to call it).
+    name: str
+
+    # Clear description of what the tool does and when to use it.
+    description: str
+
+    # Whether identical inputs yield the same output within a single run, so
+    # the executor may reuse an earlier result for a duplicate step.
+    is_deterministic: bool = False
+
+    # Pydantic model defining the input schema for this tool. Agents use it
+    # to structure input before calling execute().
+    input_schema: type[BaseModel] = ToolInput
+
+    # Minimal required input fields. Derived from input_schema once per class
+    # unless a subclass sets it explicitly.
+    required_fields: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if "required_fields" in cls.__dict__:
+            return
+        if isinstance(cls.input_schema, type):
+            cls.required_fields = _schema_required_fields(cls.input_schema)
+        else:
+            # input_schema is still a property; resolve it per instance.
+            cls.required_fields = property(lambda self: _schema_required_fields(self.input_schema))
     
-    @abstractmethod
     def execute(self, **kwargs) -> ToolOutput:
         """
         Execute the tool with given arguments.
@@ -70,27 +71,93 @@ class BaseTool(ABC):
         Args match the fields in input_schema.
         Should always return ToolOutput with success flag.
         """
-        pass
+        raise NotImplementedError(f"{type(self).__name__} must implement execute()")
+
+    async def aexecute(self, **kwargs) -> ToolOutput:
+        """Async variant of execute(). The default runs execute() in a worker thread."""
+        return await asyncio.to_thread(self.execute, **kwargs)
+
+    @property
+    def has_native_async(self) -> bool:
+        """True when the tool overrides aexecute with non-blocking I/O."""
+        return type(self).aexecute is not BaseTool.aexecute
     
+    def can_reuse_result(self, input_data: Dict[str, Any]) -> bool:
+        """Return True when a prior result for the same input may be reused."""
+        return self.is_deterministic
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(name={self.name})"
 
 
+@lru_cache(maxsize=None)
+def _schema_required_fields(schema: Any) -> Tuple[str, ...]:
+    """Return the required field names of an input schema, computed once per schema."""
+    required: list[str] = []
+    if hasattr(schema, "model_fields"):
+        for field_name, field_info in schema.model_fields.items():
+            is_required = False
+            if hasattr(field_info, "is_required"):
+                is_required = field_info.is_required()
+            if is_required:
+                required.append(field_name)
+    return tuple(required)
+
+
+@lru_cache(maxsize=None)
+def input_json_schema(schema: Any) -> Dict[str, Any]:
+    """
+    Return the JSON schema of a tool input schema, generated once per schema.
+
+    The cached dict is shared between callers and must not be mutated.
+    """
+    return TypeAdapter(schema).json_schema()
+
+
+def validate_tool_input(tool: BaseTool, input_data: Dict[str, Any]) -> Any:
+    """
+    Validate input data against a tool's input schema.
+
+    Pydantic models are validated through their compiled core validator,
+    skipping the model_validate classmethod wrapper on the hot path.
+    """
+    schema = tool.input_schema
+    validator = getattr(schema, "__pydantic_validator__", None) if isinstance(schema, type) else None
+    if validator is None:
+        return schema.model_validate(input_data)
+    return validator.validate_python(input_data)
+
+
 class ToolRegistry:
     """Registry to manage available tools for the agentic system."""
     
-    def __init__(self):
+    def __init__(self) -> None:
         self._tools: Dict[str, BaseTool] = {}
+        # Bumped on every mutation so callers can invalidate derived caches.
+        self.version = 0
     
     def register(self, tool: BaseTool) -> None:
         """Register a tool."""
         if tool.name in self._tools:
             raise ValueError(f"Tool '{tool.name}' already registered")
-        self._tools[tool.name] = tool
+        # Interned keys let lookups with literal tool names match by identity.
+        self._tools[sys.intern(tool.name)] = tool
+        self.version += 1
+        self.__dict__.pop("snapshot", None)
     
     def get(self, name: str) -> Optional[BaseTool]:
         """Get a tool by name."""
         return self._tools.get(name)
+
+    @cached_property
+    def snapshot(self) -> Tuple[Tuple[str, BaseTool], ...]:
+        """(name, tool) pairs in registration order; rebuilt after register()."""
+        return tuple(self._tools.items())
+
+    @property
+    def tool_count(self) -> int:
+        """Number of registered tools."""
+        return len(self._tools)
     
     def list_tools(self) -> Dict[str, str]:
         """Return dict of {tool_name: description}."""
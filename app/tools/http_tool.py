@@ -1,13 +1,30 @@
 """HTTP/API tool for making HTTP requests."""
 
-from typing import Any, Dict, Optional
+from threading import Lock
+from typing import Annotated, Any, AsyncGenerator, Dict, Optional, Tuple, Union
+from weakref import WeakKeyDictionary
+import asyncio
+import atexit
 import httpx
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PlainValidator
 
-from app.tools.base import BaseTool, ToolOutput
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+except ImportError:
+    h2 = None
+
+from app.core import serialization
+from app.tools.base import BaseTool, ToolOutput, validate_tool_input
 from app.core.logging import logger
 
 
+def _passthrough_body(value: Any) -> Optional[Dict[str, Any]]:
+    """Accept a dict body by reference instead of rebuilding it key by key."""
+    if value is None or isinstance(value, dict):
+        return value
+    raise ValueError("body must be a JSON object")
+
+
 class HTTPToolInput(BaseModel):
     """Input schema for HTTP tool."""
     method: str = Field(
@@ -19,7 +36,12 @@ class HTTPToolInput(BaseModel):
         default=None,
         description="Optional HTTP headers"
     )
-    body: Optional[Dict[str, Any]] = Field(
+    # Request bodies can be large and are sent as-is, so only the top-level
+    # type is checked. The schema still advertises an object-or-null body.
+    body: Annotated[
+        Optional[Dict[str, Any]],
+        PlainValidator(_passthrough_body, json_schema_input_type=Optional[Dict[str, Any]]),
+    ] = Field(
         default=None,
         description="Optional request body (for POST, PUT, etc.)"
     )
@@ -29,6 +51,62 @@ class HTTPToolInput(BaseModel):
     )
 
 
+# Connections are pooled across calls instead of opening a client per request.
+# Timeouts are passed per request.
+_DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+_POOL_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+
+_client: Optional[httpx.Client] = None
+_client_lock = Lock()
+# Async connections belong to the loop that opened them, so each loop gets its own client.
+_async_clients: "WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = WeakKeyDictionary()
+_async_client_closers: "WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncGenerator[None, None]]" = (
+    WeakKeyDictionary()
+)
+
+
+def _get_client() -> httpx.Client:
+    """Return the shared HTTP client, creating it on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = httpx.Client(http2=h2 is not None, limits=_POOL_LIMITS)
+                atexit.register(_client.close)
+    return _client
+
+
+async def _close_on_loop_shutdown(client: httpx.AsyncClient) -> AsyncGenerator[None, None]:
+    """Close a loop's client when the loop shuts down its async generators."""
+    try:
+        yield
+    finally:
+        # Looked up here rather than captured, so the closer never keeps its loop alive.
+        loop = asyncio.get_running_loop()
+        with _client_lock:
+            if _async_clients.get(loop) is client:
+                del _async_clients[loop]
+                _async_client_closers.pop(loop, None)
+        await client.aclose()
+
+
+async def _get_async_client() -> httpx.AsyncClient:
+    """Return the async HTTP client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _client_lock:
+        client = _async_clients.get(loop)
+        if client is not None:
+            return client
+        client = httpx.AsyncClient(http2=h2 is not None, limits=_POOL_LIMITS)
+        closer = _close_on_loop_shutdown(client)
+        _async_clients[loop] = client
+        _async_client_closers[loop] = closer
+    # Starting the generator registers it with the loop, so asyncio.run() and
+    # other loop shutdowns (shutdown_asyncgens) close the client.
+    await closer.asend(None)
+    return client
+
+
 class HTTPTool(BaseTool):
     """
     Tool for making HTTP requests to external APIs.
@@ -39,99 +117,115 @@ class HTTPTool(BaseTool):
     - Call webhooks
     - POST/PUT/DELETE to endpoints
     """
-    
-    @property
-    def name(self) -> str:
-        return "http"
-    
-    @property
-    def description(self) -> str:
-        return "Make HTTP requests to external APIs and URLs"
-    
-    @property
-    def input_schema(self) -> type[BaseModel]:
-        return HTTPToolInput
 
-    @property
-    def required_fields(self) -> list[str]:
-        return ["url"]
+    __slots__ = ()
+
+    name = "http"
+    description = "Make HTTP requests to external APIs and URLs"
+    input_schema = HTTPToolInput
+    required_fields = ("url",)
+
+    def can_reuse_result(self, input_data: Dict[str, Any]) -> bool:
+        """Only safe, read-only requests may be served from an earlier result."""
+        method = str(input_data.get("method") or "GET").upper()
+        return method in ("GET", "HEAD")
     
     def execute(self, **kwargs) -> ToolOutput:
         """Execute HTTP request with validation."""
         try:
-            # Clean up input data from LLM
-            # The LLM may generate invalid types, so we normalize them
-            if kwargs.get("body") == "" or kwargs.get("body") == {}:
-                kwargs["body"] = None
-            if kwargs.get("headers") == {}:
-                kwargs["headers"] = None
-            if isinstance(kwargs.get("timeout"), str):
-                try:
-                    kwargs["timeout"] = int(kwargs["timeout"])
-                except (ValueError, TypeError):
-                    kwargs["timeout"] = None
-
-            if kwargs.get("timeout") in (None, 0):
+            prepared = self._prepare_request(kwargs)
+            if isinstance(prepared, ToolOutput):
+                return prepared
+            input_data, request_kwargs = prepared
+            response = _get_client().request(**request_kwargs)
+            return self._build_output(input_data, response)
+        except Exception as e:
+            return self._request_failed(e)
+
+    async def aexecute(self, **kwargs) -> ToolOutput:
+        """Execute HTTP request on the shared async client."""
+        try:
+            prepared = self._prepare_request(kwargs)
+            if isinstance(prepared, ToolOutput):
+                return prepared
+            input_data, request_kwargs = prepared
+            client = await _get_async_client()
+            response = await client.request(**request_kwargs)
+            return self._build_output(input_data, response)
+        except Exception as e:
+            return self._request_failed(e)
+
+    def _prepare_request(self, kwargs: Dict[str, Any]) -> Union[ToolOutput, Tuple[HTTPToolInput, Dict[str, Any]]]:
+        """Normalize and validate input. Returns (input, request kwargs) or a failed ToolOutput."""
+        # Clean up input data from LLM
+        # The LLM may generate invalid types, so we normalize them
+        if kwargs.get("body") == "" or kwargs.get("body") == {}:
+            kwargs["body"] = None
+        if kwargs.get("headers") == {}:
+            kwargs["headers"] = None
+        if isinstance(kwargs.get("timeout"), str):
+            try:
+                kwargs["timeout"] = int(kwargs["timeout"])
+            except (ValueError, TypeError):
                 kwargs["timeout"] = None
-            
-            # Parse input
-            input_data = HTTPToolInput(**kwargs)
-            timeout_seconds = input_data.timeout or 10
-            
-            # Validate URL and check for common API mistakes
-            validation_error = self._validate_url(input_data.url, input_data.method)
-            if validation_error:
-                logger.error(f"URL validation failed: {validation_error}")
-                return ToolOutput(
-                    success=False,
-                    result=None,
-                    error=f"Invalid API request: {validation_error}"
-                )
-            
-            logger.debug(f"HTTP {input_data.method} {input_data.url}")
-            
-            # Prepare headers with default User-Agent
-            headers = input_data.headers or {}
-            if "user-agent" not in {k.lower() for k in headers.keys()}:
-                headers = {
-                    **headers,
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-                }
-            
-            # Make request
-            with httpx.Client(timeout=timeout_seconds) as client:
-                response = client.request(
-                    method=input_data.method,
-                    url=input_data.url,
-                    headers=headers,
-                    json=input_data.body if input_data.method in ["POST", "PUT", "PATCH"] else None,
-                )
-                
-                # Parse response
-                try:
-                    response_data = response.json()
-                except Exception:
-                    response_data = response.text
-                
-                result = {
-                        "url": input_data.url,
-                    "status_code": response.status_code,
-                    "body": response_data,
-                    "headers": dict(response.headers),
-                }
-                
-                if 200 <= response.status_code < 300:
-                    logger.debug(f"HTTP request succeeded: {response.status_code}")
-                    return ToolOutput(success=True, result=result)
-                else:
-                    error_msg = f"HTTP {response.status_code}: {response_data}"
-                    logger.warning(error_msg)
-                    return ToolOutput(success=False, result=result, error=error_msg)
+
+        if kwargs.get("timeout") in (None, 0):
+            kwargs["timeout"] = None
         
-        except Exception as e:
-            error_msg = f"HTTP request failed: {str(e)}"
-            logger.error(error_msg)
-            return ToolOutput(success=False, result=None, error=error_msg)
+        # Parse input
+        input_data = validate_tool_input(self, kwargs)
+        timeout_seconds = input_data.timeout or 10
+        
+        # Validate URL and check for common API mistakes
+        validation_error = self._validate_url(input_data.url, input_data.method)
+        if validation_error:
+            logger.error("URL validation failed: %s", validation_error)
+            return ToolOutput(
+                success=False,
+                result=None,
+                error=f"Invalid API request: {validation_error}"
+            )
+        
+        logger.debug("HTTP %s %s", input_data.method, input_data.url)
+        
+        # Prepare headers with default User-Agent (httpx.Headers is case-insensitive)
+        headers = httpx.Headers(input_data.headers)
+        headers.setdefault("User-Agent", _DEFAULT_USER_AGENT)
+        
+        return input_data, {
+            "method": input_data.method,
+            "url": input_data.url,
+            "headers": headers,
+            "json": input_data.body if input_data.method in ["POST", "PUT", "PATCH"] else None,
+            "timeout": timeout_seconds,
+        }
+
+    def _build_output(self, input_data: HTTPToolInput, response: httpx.Response) -> ToolOutput:
+        # Parse response (orjson-backed and straight from bytes when available)
+        try:
+            response_data = serialization.loads(response.content)
+        except (serialization.JSONDecodeError, UnicodeDecodeError):
+            response_data = response.text
+        
+        result = {
+            "url": input_data.url,
+            "status_code": response.status_code,
+            "body": response_data,
+            "headers": dict(response.headers),
+        }
+        
+        if 200 <= response.status_code < 300:
+            logger.debug("HTTP request succeeded: %s", response.status_code)
+            return ToolOutput(success=True, result=result)
+        else:
+            error_msg = f"HTTP {response.status_code}: {response_data}"
+            logger.warning(error_msg)
+            return ToolOutput(success=False, result=result, error=error_msg)
+
+    def _request_failed(self, error: Exception) -> ToolOutput:
+        error_msg = f"HTTP request failed: {str(error)}"
+        logger.error(error_msg)
+        return ToolOutput(success=False, result=None, error=error_msg)
     
     def _validate_url(self, url: str, method: str) -> Optional[str]:
         """Validate URL and check for common API mistakes.
@@ -1,11 +1,17 @@
 """Memory tool for storing and retrieving execution context."""
 
-from typing import Any, Dict, Optional
-from pydantic import BaseModel, Field
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+import sys
+from pydantic import BaseModel, Field, TypeAdapter
 
-from app.tools.base import BaseTool, ToolOutput
+from app.tools.base import BaseTool, ToolOutput, validate_tool_input
+from app.core.config import settings
 from app.core.logging import logger
 
+_MISSING = object()
+
 
 class MemoryToolInput(BaseModel):
     """Input schema for memory tool."""
@@ -14,6 +20,51 @@ class MemoryToolInput(BaseModel):
     value: Optional[Any] = Field(default=None, description="Value to store (for 'store' action)")
 
 
+_BULK_INPUT_ADAPTER = TypeAdapter(List[MemoryToolInput])
+
+class ShardedStore:
+    """
+    Thread-safe key/value store split into independently locked shards.
+
+    Each shard is an LRU bounded to max_entries / shards keys, so concurrent
+    runs touching different keys rarely contend and leaked keys cannot grow
+    the store without bound.
+    """
+
+    def __init__(self, shards: int = 16, max_entries: int = 16384) -> None:
+        # A power-of-two shard count lets the shard index be a bit mask.
+        shard_count = 1 << max(0, shards - 1).bit_length()
+        self._mask = shard_count - 1
+        self._max_per_shard = max(1, max_entries // shard_count)
+        self._shards: Tuple["OrderedDict[str, Any]", ...] = tuple(OrderedDict() for _ in range(shard_count))
+        self._locks: Tuple[Lock, ...] = tuple(Lock() for _ in range(shard_count))
+
+    def set(self, key: str, value: Any) -> None:
+        idx = hash(key) & self._mask
+        with self._locks[idx]:
+            shard = self._shards[idx]
+            shard[key] = value
+            shard.move_to_end(key)
+            if len(shard) > self._max_per_shard:
+                shard.popitem(last=False)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        idx = hash(key) & self._mask
+        with self._locks[idx]:
+            return self._shards[idx].get(key, default)
+
+    def clear(self) -> None:
+        for lock, shard in zip(self._locks, self._shards):
+            with lock:
+                shard.clear()
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+
 class MemoryTool(BaseTool):
     """
     Tool for storing and retrieving intermediate execution state.
@@ -24,61 +75,82 @@ class MemoryTool(BaseTool):
     - Build context from previous computations
     """
     
+    __slots__ = ()
+
     # Shared in-memory store (persists during execution)
-    _store: Dict[str, Any] = {}
-    
-    @property
-    def name(self) -> str:
-        return "memory"
-    
-    @property
-    def description(self) -> str:
-        return "Store and retrieve intermediate execution state"
-    
-    @property
-    def input_schema(self) -> type[BaseModel]:
-        return MemoryToolInput
+    _store = ShardedStore(max_entries=settings.MEMORY_TOOL_MAX_KEYS)
+
+    name = "memory"
+    description = "Store and retrieve intermediate execution state"
+    input_schema = MemoryToolInput
     
     def execute(self, **kwargs) -> ToolOutput:
         """Execute memory operation."""
         try:
-            input_data = MemoryToolInput(**kwargs)
-            action = input_data.action.lower()
-            
-            if action == "store":
-                self._store[input_data.key] = input_data.value
-                logger.debug(f"Memory: stored '{input_data.key}'")
+            return self._apply(validate_tool_input(self, kwargs))
+        except Exception as e:
+            return self._failed(e)
+
+    def bulk_execute(self, operations: List[Dict[str, Any]]) -> List[ToolOutput]:
+        """
+        Run several memory operations in order with one validation pass.
+
+        The batch is validated as a whole: if any operation is malformed,
+        nothing is applied and every entry reports the validation error.
+        """
+        try:
+            parsed = _BULK_INPUT_ADAPTER.validate_python(operations)
+        except Exception as e:
+            return [self._failed(e) for _ in operations]
+
+        outputs = []
+        for input_data in parsed:
+            try:
+                outputs.append(self._apply(input_data))
+            except Exception as e:
+                outputs.append(self._failed(e))
+        return outputs
+
+    def _apply(self, input_data: MemoryToolInput) -> ToolOutput:
+        """Apply one validated memory operation."""
+        # Interned so the comparisons below (and key lookups) short-circuit on identity.
+        action = sys.intern(input_data.action.lower())
+        
+        if action == "store":
+            self._store.set(sys.intern(input_data.key), input_data.value)
+            logger.debug("Memory: stored '%s'", input_data.key)
+            return ToolOutput(
+                success=True,
+                result={
+                    "message": f"Stored value at key '{input_data.key}'",
+                    "key": input_data.key,
+                    "value": input_data.value
+                }
+            )
+        
+        elif action == "retrieve":
+            value = self._store.get(input_data.key, _MISSING)
+            if value is not _MISSING:
+                logger.debug("Memory: retrieved '%s'", input_data.key)
                 return ToolOutput(
                     success=True,
-                    result={
-                        "message": f"Stored value at key '{input_data.key}'",
-                        "key": input_data.key,
-                        "value": input_data.value
-                    }
+                    result={"key": input_data.key, "value": value}
                 )
-            
-            elif action == "retrieve":
-                if input_data.key in self._store:
-                    value = self._store[input_data.key]
-                    logger.debug(f"Memory: retrieved '{input_data.key}'")
-                    return ToolOutput(
-                        success=True,
-                        result={"key": input_data.key, "value": value}
-                    )
-                else:
-                    error_msg = f"Key '{input_data.key}' not found in memory"
-                    logger.warning(error_msg)
-                    return ToolOutput(success=False, result=None, error=error_msg)
-            
             else:
-                error_msg = f"Unknown action: {action}. Use 'store' or 'retrieve'."
+                error_msg = f"Key '{input_data.key}' not found in memory"
                 logger.warning(error_msg)
                 return ToolOutput(success=False, result=None, error=error_msg)
         
-        except Exception as e:
-            error_msg = f"Memory operation failed: {str(e)}"
-            logger.error(error_msg)
+        else:
+            error_msg = f"Unknown action: {action}. Use 'store' or 'retrieve'."
+            logger.warning(error_msg)
             return ToolOutput(success=False, result=None, error=error_msg)
+
+    @staticmethod
+    def _failed(error: Exception) -> ToolOutput:
+        error_msg = f"Memory operation failed: {str(error)}"
+        logger.error(error_msg)
+        return ToolOutput(success=False, result=None, error=error_msg)
     
     @classmethod
     def clear(cls) -> None:
@@ -2,13 +2,26 @@
 from pydantic import BaseModel, Field
 import re
 
-from app.tools.base import BaseTool, ToolOutput
-from app.llm.client import get_llm_client
+from app.tools.base import BaseTool, ToolOutput, validate_tool_input
+from app.llm.client import BaseLLMClient, get_llm_client
 from app.core.config import settings
 from app.core.logging import logger
 
 
-from typing import Union
+from typing import Optional, Union
+
+# Shared by every call; LLM clients only read messages.
+_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": (
+        "You are an agentic execution system. Provide a concise, accurate answer. "
+        "If context contains actual data (numbers, values, metrics), extract and use them directly in your answer. "
+        "Do NOT say 'the value stored at key X' or 'I would need to retrieve'. Instead, provide the actual value from context when available. "
+        "When no useful context is provided, answer from general knowledge. "
+        "Never output unresolved template variables, placeholders, or variable-style tokens such as $bitcoin_price or {variable}."
+    ),
+}
+
 
 class ReasoningToolInput(BaseModel):
     """Input schema for reasoning tool."""
@@ -29,27 +42,35 @@ class ReasoningTool(BaseTool):
     - A tool-based execution path is not applicable
     """
 
-    def __init__(self):
-        self.llm = get_llm_client()
+    __slots__ = ("_llm",)
 
-    @property
-    def name(self) -> str:
-        return "reasoning"
+    # Answers are generated at a fixed low temperature.
+    is_deterministic = True
 
-    @property
-    def description(self) -> str:
-        return "Reasoning-only answers when no external tools are required"
+    name = "reasoning"
+    description = "Reasoning-only answers when no external tools are required"
+    input_schema = ReasoningToolInput
+
+    def __init__(self, llm_client: Optional[BaseLLMClient] = None):
+        self._llm = llm_client
 
     @property
-    def input_schema(self) -> type[BaseModel]:
-        return ReasoningToolInput
+    def llm(self) -> BaseLLMClient:
+        """LLM client, resolved on first use so the tool can be registered at import."""
+        if self._llm is None:
+            self._llm = get_llm_client()
+        return self._llm
+
+    @llm.setter
+    def llm(self, client: BaseLLMClient) -> None:
+        self._llm = client
 
     def execute(self, **kwargs) -> ToolOutput:
         """Answer a question using the LLM."""
         try:
-            input_data = ReasoningToolInput(**kwargs)
+            input_data = validate_tool_input(self, kwargs)
 
-            logger.debug(f"Answering question: {input_data.question}")
+            logger.debug("Answering question: %s", input_data.question)
 
             model_identity = self._build_model_identity_answer(input_data.question)
             if model_identity:
@@ -62,24 +83,14 @@ class ReasoningTool(BaseTool):
                     },
                 )
 
-            system_message = (
-                "You are an agentic execution system. Provide a concise, accurate answer. "
-                "If context contains actual data (numbers, values, metrics), extract and use them directly in your answer. "
-                "Do NOT say 'the value stored at key X' or 'I would need to retrieve'. Instead, provide the actual value from context when available. "
-                "When no useful context is provided, answer from general knowledge. "
-                "Never output unresolved template variables, placeholders, or variable-style tokens such as $bitcoin_price or {variable}."
-            )
-
-            user_prompt = f"Question: {input_data.question}"
-
             if input_data.context:
-                formatted_context = self._format_context(input_data.context)
-                user_prompt += f"\n\n{formatted_context}"
+                user_prompt = "".join((
+                    "Question: ", input_data.question, "\n\n", self._format_context(input_data.context),
+                ))
+            else:
+                user_prompt = "Question: " + input_data.question
 
-            messages = [
-                {"role": "system", "content": system_message},
-                {"role": "user", "content": user_prompt},
-            ]
+            messages = [_SYSTEM_MESSAGE, {"role": "user", "content": user_prompt}]
 
             response = self.llm.call(
                 messages,
@@ -9,7 +9,7 @@ Demonstrates a real business workflow:
 """
 
 from typing import Any, Dict, Optional
-from app.agents.runner import AgentRunner
+from app.agents.runner import get_agent_runner
 from app.core.logging import logger
 from app.tools import initialize_tools
 
@@ -70,7 +70,7 @@ def run_support_ticket_triage(ticket_id: str, customer_id: str, issue_descriptio
     try:
         # Ensure tools are registered even when workflow is called directly.
         initialize_tools()
-        runner = AgentRunner()
+        runner = get_agent_runner()
         
         # Create a detailed goal for the planner
         goal = f"""Support Ticket Triage for {ticket_id}:
@@ -122,7 +122,7 @@ Respond with structured analysis and a draft response."""
         }
     
     except Exception as e:
-        logger.error(f"Support ticket triage failed: {str(e)}")
+        logger.error("Support ticket triage failed: %s", e)
         return {
             "ticket_id": ticket_id,
             "customer_id": customer_id,
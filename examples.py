@@ -7,19 +7,22 @@ a goal using the available tools.
 Note: Requires GEMINI_API_KEY environment variable.
 """
 
+import asyncio
+import os
 import sys
-import json
-from pathlib import Path
+import traceback
 
 # Add workspace to path
-sys.path.insert(0, str(Path(__file__).parent))
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.insert(0, _HERE)
+
+from app.core.console import format_json, print_banner, print_header
 
 
 def example_1_tool_registry():
     """Example 1: Explore available tools."""
-    print("\n" + "="*70)
-    print("EXAMPLE 1: Tool Registry")
-    print("="*70)
+    print_header("EXAMPLE 1: Tool Registry")
     
     from app.tools import initialize_tools
     
@@ -34,9 +37,7 @@ def example_1_tool_registry():
 
 def example_2_memory_operations():
     """Example 2: Store and retrieve from memory."""
-    print("\n" + "="*70)
-    print("EXAMPLE 2: Memory Tool Operations")
-    print("="*70)
+    print_header("EXAMPLE 2: Memory Tool Operations")
     
     from app.tools import initialize_tools
     
@@ -58,14 +59,12 @@ def example_2_memory_operations():
         action="retrieve",
         key="user_data"
     )
-    print(f"   Retrieved: {json.dumps(result.result, indent=2)}")
+    print(f"   Retrieved: {format_json(result.result)}")
 
 
 def example_3_execution_context():
     """Example 3: Create and track execution context."""
-    print("\n" + "="*70)
-    print("EXAMPLE 3: Execution Context Management")
-    print("="*70)
+    print_header("EXAMPLE 3: Execution Context Management")
     
     from app.memory.vector_store import memory_store
     from app.memory.schemas import ExecutionStep
@@ -107,43 +106,39 @@ def example_3_execution_context():
 
 def example_4_tool_input_schemas():
     """Example 4: Understand tool input schemas."""
-    print("\n" + "="*70)
-    print("EXAMPLE 4: Tool Input Schemas (for AI Planning)")
-    print("="*70)
+    print_header("EXAMPLE 4: Tool Input Schemas (for AI Planning)")
     
     from app.tools import initialize_tools
-    from pydantic import TypeAdapter
+    from app.tools.base import input_json_schema
     
     registry = initialize_tools()
     
     print("\nTool Input Specifications (what LLM can plan):\n")
     
-    for tool_name, tool in registry._tools.items():
-        schema = tool.input_schema
+    for tool_name, tool in registry.snapshot:
         print(f"Tool: {tool_name}")
         print(f"Description: {tool.description}")
         print(f"Input Schema:")
         
         # Print field information
-        adapter = TypeAdapter(schema)
-        json_schema = adapter.json_schema()
+        json_schema = input_json_schema(tool.input_schema)
         
+        lines = []
         if "properties" in json_schema:
+            required_fields = json_schema.get("required", [])
             for field_name, field_info in json_schema["properties"].items():
-                required = field_name in json_schema.get("required", [])
-                print(f"  - {field_name}: {field_info.get('type', 'object')}", end="")
-                if required:
-                    print(" (REQUIRED)")
+                if field_name in required_fields:
+                    label = " (REQUIRED)"
                 else:
-                    print(f" (optional, default: {field_info.get('default', 'N/A')})")
-        print()
+                    label = f" (optional, default: {field_info.get('default', 'N/A')})"
+                lines.append(f"  - {field_name}: {field_info.get('type', 'object')}{label}")
+        lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def example_5_planning_process():
     """Example 5: Show how planning works (requires API key)."""
-    print("\n" + "="*70)
-    print("EXAMPLE 5: Planning Process (Breakdown Goal → Steps)")
-    print("="*70)
+    print_header("EXAMPLE 5: Planning Process (Breakdown Goal → Steps)")
     
     try:
         from app.agents.planner import PlannerAgent
@@ -183,16 +178,24 @@ def example_5_planning_process():
 
 def example_6_execution_flow():
     """Example 6: Show complete execution flow (requires API key)."""
-    print("\n" + "="*70)
-    print("EXAMPLE 6: End-to-End Execution Flow")
-    print("="*70)
+    asyncio.run(example_6_execution_flow_async())
+
+
+async def example_6_execution_flow_async():
+    """
+    Async body of example 6.
+
+    run_async() awaits the planner and lets the executor gather steps that
+    do not depend on each other, with HTTP calls made on the event loop.
+    """
+    print_header("EXAMPLE 6: End-to-End Execution Flow")
     
     try:
-        from app.agents.runner import AgentRunner
+        from app.agents.runner import get_agent_runner
         from app.tools.memory_tool import MemoryTool
         
         print("\nInitializing Agent Runner...")
-        runner = AgentRunner()
+        runner = get_agent_runner()
         
         # Clear memory to start fresh
         MemoryTool.clear()
@@ -209,7 +212,7 @@ def example_6_execution_flow():
         print("Executing (Plan → Execute)...")
         print("-"*70)
         
-        execution_context = runner.run(goal, context)
+        execution_context = await runner.run_async(goal, context)
         
         print(f"\n✓ Execution Complete!")
         print(f"  ID: {execution_context.execution_id}")
@@ -219,7 +222,7 @@ def example_6_execution_flow():
         if execution_context.error:
             print(f"  Error: {execution_context.error}")
         else:
-            print(f"  Final Result: {json.dumps(execution_context.final_result, indent=4)}")
+            print(f"  Final Result: {format_json(execution_context.final_result)}")
     
     except ValueError as e:
         if "API_KEY" in str(e):
@@ -231,17 +234,16 @@ def example_6_execution_flow():
             raise
     except Exception as e:
         print(f"\n✗ Error during execution: {e}")
-        import traceback
         traceback.print_exc()
 
 
 if __name__ == "__main__":
-    print("\n")
-    print("╔" + "="*68 + "╗")
-    print("║" + " "*68 + "║")
-    print("║" + "  AGENTIC AI SYSTEM - EXAMPLES".center(68) + "║")
-    print("║" + " "*68 + "║")
-    print("╚" + "="*68 + "╝")
+    # Coalesce writes into full buffers when piped (e.g. `python examples.py | tee out.log`).
+    # PYTHONUNBUFFERED is an explicit request for immediate output and is honoured.
+    if not sys.stdout.isatty() and not os.getenv("PYTHONUNBUFFERED"):
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
+
+    print_banner("  AGENTIC AI SYSTEM - EXAMPLES")
     
     # Run examples
     example_1_tool_registry()
@@ -251,9 +253,7 @@ if __name__ == "__main__":
     example_5_planning_process()
     example_6_execution_flow()
     
-    print("\n" + "="*70)
-    print("✓ Examples Complete!")
-    print("="*70)
+    print_header("✓ Examples Complete!")
     print("\nNext Steps:")
     print("  1. Set your LLM API key: export LLM_PROVIDER=gemini && export GEMINI_API_KEY=...")
     print("  2. Start the server: uvicorn app.main:app --reload")
@@ -2,10 +2,13 @@
 
 import sys
 import os
-from pathlib import Path
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 
 # Add the workspace to Path
-sys.path.insert(0, str(Path(__file__).parent))
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.insert(0, _HERE)
 
 def test_imports():
     """Test that all modules can be imported."""
@@ -31,7 +34,7 @@ def test_imports():
         # Tools imports
         from app.tools import initialize_tools, tool_registry
         tools = initialize_tools()
-        print(f"✓ Tools initialized ({len(tools._tools)} tools registered)")
+        print(f"✓ Tools initialized ({tools.tool_count} tools registered)")
         print(f"  Available tools: {list(tools.list_tools().keys())}")
         
         # Agent imports
@@ -48,7 +51,6 @@ def test_imports():
     
     except Exception as e:
         print(f"✗ Import failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -60,6 +62,8 @@ def test_tool_registry():
         from app.tools import initialize_tools
         
         registry = initialize_tools()
+        assert initialize_tools() is registry
+        print("✓ Tool registry is shared across calls")
         
         # Test HTTP tool
         http_tool = registry.get("http")
@@ -75,7 +79,6 @@ def test_tool_registry():
     
     except Exception as e:
         print(f"✗ Tool registry test failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -102,7 +105,6 @@ def test_memory_system():
     
     except Exception as e:
         print(f"✗ Memory system test failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -115,26 +117,19 @@ def test_tool_execution():
         
         registry = initialize_tools()
         
-        # Test memory tool store
+        # Store and retrieve in one batch
         memory_tool = registry.get("memory")
-        result = memory_tool.execute(
-            action="store",
-            key="test_key",
-            value={"test": "data"}
-        )
+        stored, result = memory_tool.bulk_execute([
+            {"action": "store", "key": "test_key", "value": {"test": "data"}},
+            {"action": "retrieve", "key": "test_key"},
+        ])
         
-        if result.success:
+        if stored.success:
             print(f"✓ Memory tool store succeeded")
         else:
-            print(f"✗ Memory tool store failed: {result.error}")
+            print(f"✗ Memory tool store failed: {stored.error}")
             return False
         
-        # Test memory tool retrieve
-        result = memory_tool.execute(
-            action="retrieve",
-            key="test_key"
-        )
-        
         if result.success and result.result["value"]["test"] == "data":
             print(f"✓ Memory tool retrieve succeeded")
         else:
@@ -145,7 +140,6 @@ def test_tool_execution():
     
     except Exception as e:
         print(f"✗ Tool execution test failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -155,11 +149,13 @@ if __name__ == "__main__":
     print("AGENTIC AI SYSTEM - ARCHITECTURE TEST")
     print("=" * 60)
     
-    all_passed = True
-    all_passed &= test_imports()
-    all_passed &= test_tool_registry()
-    all_passed &= test_memory_system()
-    all_passed &= test_tool_execution()
+    # Imports run first (the import lock would serialize them anyway); the
+    # remaining checks are independent and run concurrently. Their output
+    # lines may interleave.
+    all_passed = test_imports()
+    checks = [test_tool_registry, test_memory_system, test_tool_execution]
+    with ThreadPoolExecutor(max_workers=len(checks)) as pool:
+        all_passed &= all(pool.map(lambda check: check(), checks))
     
     print("\n" + "=" * 60)
     if all_passed:
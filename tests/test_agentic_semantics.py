@@ -13,6 +13,7 @@ from app.agents.planner import PlannerAgent
 from app.agents.executor import ExecutorAgent
 from app.schemas.request_response import ExecutionStep, FinalResult
 from app.memory.schemas import ExecutionContext, ExecutionStep as MemoryExecutionStep
+from app.tools import initialize_tools
 
 
 class TestAgenticIntentEnforcement:
@@ -185,6 +186,36 @@ class TestAgenticHardFailures:
         assert execution_context.final_result.confidence == 0.75
 
 
+class TestPlanInvalidationAfterFailures:
+    """Cached plans are forgotten only when a step finally fails."""
+
+    def _finish(self, attempts, status="completed"):
+        runner = AgentRunner()
+        execution_context = ExecutionContext(execution_id="test_forget", goal="Fetch news", user_context={})
+        for success in attempts:
+            execution_context.add_step(MemoryExecutionStep(
+                step_number=1,
+                description="Fetch news",
+                tool_name="http",
+                input_data={"url": "https://example.com/news"},
+                output={"ok": True} if success else None,
+                success=success,
+                error=None if success else "HTTP 503",
+            ))
+        execution_context.status = status
+        with patch.object(runner.planner, "forget_plan") as forget_plan, \
+                patch.object(runner.memory_store, "save_context"), \
+                patch.object(runner, "_save_execution_to_history"):
+            runner._finish_run(execution_context, "Fetch news", {}, 0.0, None)
+        return forget_plan
+
+    def test_retried_transient_failure_keeps_plan(self):
+        assert not self._finish([False, True]).called
+
+    def test_step_failing_after_all_retries_forgets_plan(self):
+        assert self._finish([False, False, False], status="failed").called
+
+
 class TestAgenticNoFallbackBehavior:
     """
     Test that the system does NOT generate fallback explanations.
@@ -311,6 +342,67 @@ class TestAgenticEndToEnd:
         # Should be classified as tool_required
         assert intent == "tool_required"
 
+    @pytest.mark.parametrize("goal, intent", [
+        ("Fetching user data from the endpoint", "tool_required"),
+        ("Summarize the fetched results", "mixed"),
+        ("Explained simply: what are APIs", "mixed"),
+        ("Generate a short poem about autumn", "reasoning_only"),
+    ])
+    def test_inflected_keywords_keep_their_intent(self, goal, intent):
+        """Keywords match in inflected forms, but only at the start of a word."""
+        assert PlannerAgent(llm_client=Mock()).classify_intent(goal) == intent
+
+    def test_reasoning_only_goal_skips_llm_planning(self):
+        """Reasoning-only goals compile to one reasoning step without an LLM call."""
+        llm_client = Mock()
+        planner = PlannerAgent(llm_client=llm_client)
+
+        steps = planner.plan("Explain recursion", {"audience": "beginners", "_tenant_id": "t1"})
+
+        llm_client.call.assert_not_called()
+        assert len(steps) == 1
+        assert steps[0].tool_name == "reasoning"
+        assert steps[0].input_data == {
+            "question": "Explain recursion",
+            "context": {"audience": "beginners"},
+        }
+
+    @pytest.mark.parametrize("goal", [
+        "What is bitcoin?",
+        "Explain how BTC mining works",
+        "Explain the github repo facebook/react",
+    ])
+    def test_reasoning_only_goal_ignores_live_data_heuristics(self, goal):
+        """Live-data heuristic plans are not reused for reasoning-only goals."""
+        llm_client = Mock()
+        planner = PlannerAgent(llm_client=llm_client)
+
+        steps = planner.plan(goal)
+
+        llm_client.call.assert_not_called()
+        assert [s.tool_name for s in steps] == ["reasoning"]
+        assert steps[0].input_data["question"] == goal
+
+    @pytest.mark.parametrize("goal", ["What have I saved?", "Explain by recalling my notes"])
+    def test_inflected_stateful_goal_needs_llm_planning(self, goal):
+        """Goals about stored state are left for the LLM to plan memory steps."""
+        planner = PlannerAgent(llm_client=Mock())
+
+        assert planner.classify_intent(goal) == "reasoning_only"
+        assert planner._plan_without_llm(goal, {}, "reasoning_only") is None
+
+    def test_goal_with_single_url_skips_llm_planning(self):
+        """A goal naming one URL to read compiles to a GET plus a summary step."""
+        initialize_tools()
+        llm_client = Mock()
+        planner = PlannerAgent(llm_client=llm_client)
+
+        steps = planner.plan("Fetch https://example.com/status.json and summarize it.")
+
+        llm_client.call.assert_not_called()
+        assert [s.tool_name for s in steps] == ["http", "reasoning"]
+        assert steps[0].input_data == {"method": "GET", "url": "https://example.com/status.json"}
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
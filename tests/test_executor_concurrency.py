@@ -0,0 +1,232 @@
+"""Test concurrent execution of independent plan steps."""
+import asyncio
+import threading
+import time
+from unittest.mock import Mock, patch
+
+from app.agents.executor import ExecutorAgent
+from app.memory.schemas import ExecutionContext
+from app.schemas.request_response import ExecutionStep
+from app.tools.base import BaseTool, ToolOutput
+
+
+def _http_step(step_number, url, method="GET"):
+    return ExecutionStep(
+        step_number=step_number,
+        description=f"Fetch {url}",
+        tool_name="http",
+        input_data={"method": method, "url": url},
+    )
+
+
+class TestExecutorWaves:
+    """Independent HTTP fetches are grouped into waves and run concurrently."""
+
+    def setup_method(self):
+        self.executor = ExecutorAgent()
+
+    def test_build_waves_uses_reasoning_and_placeholders_as_barriers(self):
+        steps = [
+            _http_step(1, "https://example.com/a"),
+            _http_step(2, "https://example.com/b"),
+            ExecutionStep(step_number=3, description="Summarize", tool_name="reasoning",
+                          input_data={"question": "Summarize"}),
+            _http_step(4, "https://example.com/{http}"),
+            _http_step(5, "https://example.com/c", method="POST"),
+        ]
+
+        waves = self.executor.build_waves(steps)
+
+        assert [[s.step_number for s in wave] for wave in waves] == [[1, 2], [3], [4], [5]]
+        assert self.executor.has_parallel_steps(steps)
+        assert not self.executor.has_parallel_steps(steps[2:])
+
+    def test_concurrency_limit_of_one_runs_sequentially(self):
+        steps = [_http_step(1, "https://example.com/a"), _http_step(2, "https://example.com/b")]
+
+        with patch.object(ExecutorAgent, "MAX_PARALLEL_STEPS", 1):
+            assert not self.executor.has_parallel_steps(steps)
+
+    def test_independent_fetches_run_concurrently_and_record_in_order(self):
+        steps = [_http_step(i, f"https://example.com/{i}") for i in (1, 2, 3)]
+        barrier = threading.Barrier(3, timeout=2)
+
+        def fetch(**kwargs):
+            # Every call must be in flight at once for the barrier to release.
+            barrier.wait()
+            return ToolOutput(success=True, result={"url": kwargs["url"]})
+
+        mock_http_tool = Mock()
+        mock_http_tool.execute.side_effect = fetch
+        context = ExecutionContext(execution_id="test-waves", goal="Fetch pages")
+
+        with patch.object(self.executor.tool_registry, "get", return_value=mock_http_tool):
+            start = time.monotonic()
+            result = self.executor.execute(steps, context)
+            elapsed = time.monotonic() - start
+
+        assert result.status == "completed"
+        assert elapsed < 2
+        assert [s.step_number for s in result.executed_steps] == [1, 2, 3]
+        assert result.final_result == {"url": "https://example.com/3"}
+
+    def test_failed_fetch_in_wave_stops_execution(self):
+        steps = [_http_step(1, "https://example.com/ok"), _http_step(2, "https://example.com/bad")]
+
+        def fetch(**kwargs):
+            if kwargs["url"].endswith("bad"):
+                return ToolOutput(success=False, result=None, error="HTTP 500")
+            return ToolOutput(success=True, result={"ok": True})
+
+        mock_http_tool = Mock()
+        mock_http_tool.execute.side_effect = fetch
+        context = ExecutionContext(execution_id="test-wave-failure", goal="Fetch pages")
+
+        with patch.object(self.executor.tool_registry, "get", return_value=mock_http_tool):
+            result = self.executor.execute(steps, context)
+
+        assert result.status == "failed"
+        assert "HTTP 500" in result.error
+
+    def test_async_execution_awaits_native_aexecute(self):
+        steps = [_http_step(i, f"https://example.com/{i}") for i in (1, 2)]
+        tool = AsyncFetchTool()
+        context = ExecutionContext(execution_id="test-aexecute", goal="Fetch pages")
+
+        with patch.object(self.executor.tool_registry, "get", return_value=tool):
+            result = asyncio.run(self.executor.execute_async(steps, context))
+
+        assert result.status == "completed"
+        assert tool.threads == {threading.main_thread().name}
+        assert [s.output["url"] for s in result.executed_steps] == [
+            "https://example.com/1", "https://example.com/2",
+        ]
+
+
+class AsyncFetchTool(BaseTool):
+    """HTTP stand-in with a native aexecute that records the running thread."""
+
+    def __init__(self):
+        self.threads = set()
+
+    @property
+    def name(self) -> str:
+        return "http"
+
+    @property
+    def description(self) -> str:
+        return "Fetches without blocking"
+
+    def execute(self, **kwargs) -> ToolOutput:
+        raise AssertionError("async execution should use aexecute")
+
+    async def aexecute(self, **kwargs) -> ToolOutput:
+        self.threads.add(threading.current_thread().name)
+        await asyncio.sleep(0)
+        return ToolOutput(success=True, result={"url": kwargs["url"]})
+
+
+class TestRetryBackoff:
+    """Transient failures back off with jitter before retrying; others retry at once."""
+
+    def setup_method(self):
+        self.executor = ExecutorAgent()
+        self.steps = [
+            ExecutionStep(step_number=1, description="Answer", tool_name="reasoning",
+                          input_data={"question": "What is an API?"}),
+        ]
+
+    def _run_with_first_error(self, error):
+        mock_tool = Mock()
+        mock_tool.execute.side_effect = [
+            ToolOutput(success=False, result=None, error=error),
+            ToolOutput(success=True, result={"answer": "An interface"}),
+        ]
+        context = ExecutionContext(execution_id="test-backoff", goal="Explain APIs")
+        with patch.object(self.executor.tool_registry, "get", return_value=mock_tool), \
+                patch("app.agents.executor.time.sleep") as mock_sleep:
+            result = self.executor.execute(self.steps, context)
+        return result, mock_sleep
+
+    def test_rate_limited_attempt_sleeps_before_retry(self):
+        result, mock_sleep = self._run_with_first_error("Reasoning failed: 429 Resource exhausted")
+
+        assert result.status == "completed"
+        mock_sleep.assert_called_once()
+        assert 0 <= mock_sleep.call_args[0][0] <= 0.5
+
+    def test_non_retryable_failure_does_not_sleep(self):
+        result, mock_sleep = self._run_with_first_error("Failed to generate answer")
+
+        assert result.status == "completed"
+        mock_sleep.assert_not_called()
+
+    def test_async_backoff_waits_on_the_event_loop(self):
+        mock_tool = Mock()
+        mock_tool.execute.side_effect = [
+            ToolOutput(success=False, result=None, error="Reasoning failed: 429 Resource exhausted"),
+            ToolOutput(success=True, result={"answer": "An interface"}),
+        ]
+        context = ExecutionContext(execution_id="test-async-backoff", goal="Explain APIs")
+        with patch.object(self.executor.tool_registry, "get", return_value=mock_tool), \
+                patch("app.agents.executor.time.sleep") as mock_sleep, \
+                patch("app.agents.executor.asyncio.sleep") as mock_async_sleep:
+            result = asyncio.run(self.executor.execute_async(self.steps, context))
+
+        assert result.status == "completed"
+        mock_sleep.assert_not_called()
+        mock_async_sleep.assert_awaited_once()
+
+
+class CountingTool(BaseTool):
+    """Deterministic tool that counts how often it actually runs."""
+
+    is_deterministic = True
+
+    def __init__(self):
+        self.calls = 0
+
+    @property
+    def name(self) -> str:
+        return "lookup"
+
+    @property
+    def description(self) -> str:
+        return "Counts executions"
+
+    def execute(self, **kwargs) -> ToolOutput:
+        self.calls += 1
+        return ToolOutput(success=True, result={"answer": f"answer {self.calls}"})
+
+
+class TestDuplicateSteps:
+    """Identical deterministic steps in one run reuse the first result."""
+
+    def _step(self, step_number, question):
+        return ExecutionStep(step_number=step_number, description="Look up", tool_name="lookup",
+                             input_data={"query": question})
+
+    def test_duplicate_step_reuses_result_within_run(self):
+        executor = ExecutorAgent()
+        tool = CountingTool()
+        steps = [self._step(1, "What is an API?"), self._step(2, "What is an API?"), self._step(3, "What is REST?")]
+
+        with patch.object(executor.tool_registry, "get", return_value=tool):
+            result = executor.execute(steps, ExecutionContext(execution_id="test-dedup", goal="APIs"))
+            executor.execute(steps[:1], ExecutionContext(execution_id="test-dedup-2", goal="APIs"))
+
+        assert result.status == "completed"
+        assert [s.output["answer"] for s in result.executed_steps] == ["answer 1", "answer 1", "answer 2"]
+        # A new run starts with an empty result cache.
+        assert tool.calls == 3
+
+    def test_non_deterministic_tool_is_not_reused(self):
+        executor = ExecutorAgent()
+        tool = CountingTool()
+        tool.is_deterministic = False
+        steps = [self._step(1, "Roll a die"), self._step(2, "Roll a die")]
+
+        with patch.object(executor.tool_registry, "get", return_value=tool):
+            executor.execute(steps, ExecutionContext(execution_id="test-no-dedup", goal="Dice"))
+
+        assert tool.calls == 2
@@ -0,0 +1,53 @@
+"""Tests for the HTTP tool's input schema and shared clients."""
+import asyncio
+
+import httpx
+
+from app.tools import http_tool
+from app.tools.base import input_json_schema
+from app.tools.http_tool import HTTPTool, HTTPToolInput
+
+
+class TestHTTPToolInput:
+    """Bodies are validated by top-level type only but keep a typed schema."""
+
+    def test_body_schema_is_object_or_null(self):
+        body = input_json_schema(HTTPToolInput)["properties"]["body"]
+
+        assert body["anyOf"] == [
+            {"additionalProperties": True, "type": "object"},
+            {"type": "null"},
+        ]
+
+    def test_dict_body_is_passed_through_by_reference(self):
+        body = {"items": [1, 2, 3]}
+
+        assert HTTPToolInput(url="https://example.com", body=body).body is body
+
+    def test_large_integer_ids_in_responses_stay_exact(self):
+        input_data = HTTPToolInput(url="https://example.com/items")
+        response = httpx.Response(200, content=b'{"id": 123456789012345678901234567890}')
+
+        output = HTTPTool()._build_output(input_data, response)
+
+        assert output.result["body"] == {"id": 123456789012345678901234567890}
+
+
+class TestAsyncClients:
+    """Each event loop gets its own async client, closed when the loop shuts down."""
+
+    def test_client_is_shared_within_a_loop(self):
+        async def fetch_clients():
+            return await asyncio.gather(*[http_tool._get_async_client() for _ in range(4)])
+
+        clients = asyncio.run(fetch_clients())
+
+        assert len({id(client) for client in clients}) == 1
+
+    def test_client_is_closed_when_its_loop_finishes(self):
+        first = asyncio.run(http_tool._get_async_client())
+        second = asyncio.run(http_tool._get_async_client())
+
+        assert first is not second
+        assert first.is_closed and second.is_closed
+        assert first not in http_tool._async_clients.values()
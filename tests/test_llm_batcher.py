@@ -0,0 +1,75 @@
+"""Tests for coalescing concurrent LLM calls."""
+import asyncio
+
+from app.llm.batcher import MicroBatcher
+from app.llm.client import BaseLLMClient, LLMResponse
+
+
+class AsyncCountingClient(BaseLLMClient):
+    """LLM stub whose async calls yield to the loop before answering."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def call(self, messages, temperature=0.7, max_tokens=None):
+        raise AssertionError("batched calls should use acall")
+
+    async def acall(self, messages, temperature=0.7, max_tokens=None):
+        self.calls += 1
+        await asyncio.sleep(0)
+        return LLMResponse(content=messages[-1]["content"].upper())
+
+
+def _messages(text):
+    return [{"role": "user", "content": text}]
+
+
+class TestMicroBatcher:
+    """Calls within one window are dispatched together."""
+
+    def test_identical_calls_share_one_request(self):
+        client = AsyncCountingClient()
+
+        async def run():
+            batcher = MicroBatcher(client, window_ms=5)
+            return await asyncio.gather(*[batcher.submit(_messages("plan")) for _ in range(3)])
+
+        responses = asyncio.run(run())
+
+        assert client.calls == 1
+        assert [r.content for r in responses] == ["PLAN", "PLAN", "PLAN"]
+
+    def test_distinct_calls_each_get_their_own_response(self):
+        client = AsyncCountingClient()
+
+        async def run():
+            batcher = MicroBatcher(client, window_ms=5, max_batch=2)
+            return await asyncio.gather(*[batcher.submit(_messages(t)) for t in ("a", "b", "c")])
+
+        responses = asyncio.run(run())
+
+        assert client.calls == 3
+        assert [r.content for r in responses] == ["A", "B", "C"]
+
+    def test_acall_batched_rebinds_to_new_event_loop(self):
+        client = AsyncCountingClient()
+
+        first = asyncio.run(client.acall_batched(_messages("x")))
+        second = asyncio.run(client.acall_batched(_messages("y")))
+
+        assert (first.content, second.content) == ("X", "Y")
+        assert client.calls == 2
+
+    def test_dispatch_tasks_are_held_until_done(self):
+        client = AsyncCountingClient()
+
+        async def run():
+            batcher = MicroBatcher(client, window_ms=5, max_batch=1)
+            pending = asyncio.ensure_future(batcher.submit(_messages("a")))
+            await asyncio.sleep(0)
+            in_flight = len(batcher._dispatch_tasks)
+            await pending
+            await asyncio.sleep(0)
+            return in_flight, len(batcher._dispatch_tasks)
+
+        assert asyncio.run(run()) == (1, 0)
@@ -0,0 +1,173 @@
+"""Tests for the deterministic LLM response cache."""
+
+import asyncio
+import json
+import threading
+from unittest.mock import patch
+
+from app.agents.planner import PlannerAgent
+from app.llm.cache import InMemoryLRUBackend, LLMCache
+from app.llm.client import BaseLLMClient, LLMResponse, _parse_json_flexible
+
+
+class CountingLLMClient(BaseLLMClient):
+    """LLM stub that returns a fixed plan and counts calls."""
+
+    model = "test-model"
+
+    def __init__(self, content: str):
+        self.content = content
+        self.calls = 0
+        self.messages = []
+
+    def call(self, messages, temperature=0.7, max_tokens=None):
+        self.calls += 1
+        self.messages.append(messages)
+        return LLMResponse(content=self.content)
+
+    def parse_json(self, text):
+        return _parse_json_flexible(text)
+
+
+PLAN_TEXT = json.dumps([
+    {
+        "step_number": 1,
+        "description": "Fetch headlines",
+        "tool_name": "http",
+        "input_data": {"url": "https://example.com/news", "method": "GET"},
+    }
+])
+
+
+class TestLLMCache:
+    """Cache key, eviction, and expiry behavior."""
+
+    def test_high_temperature_is_not_cached(self):
+        cache = LLMCache(backend=InMemoryLRUBackend(8), ttl=60)
+        messages = [{"role": "user", "content": "hi"}]
+
+        assert cache.make_key("m", messages, 0.9) is None
+        assert cache.make_key("m", messages, 0.3) == cache.make_key("m", messages, 0.3)
+        assert cache.make_key("m", messages, 0.3) != cache.make_key("other", messages, 0.3)
+
+    def test_lru_evicts_oldest_entry(self):
+        backend = InMemoryLRUBackend(max_entries=2)
+        backend.set("a", "1")
+        backend.set("b", "2")
+        backend.get("a")
+        backend.set("c", "3")
+
+        assert backend.get("b") is None
+        assert backend.get("a") == "1"
+        assert backend.get("c") == "3"
+
+    def test_expired_entries_are_dropped(self):
+        backend = InMemoryLRUBackend(max_entries=4)
+        with patch("app.llm.cache.time.monotonic", return_value=100.0):
+            backend.set("a", "1", ttl=10)
+        with patch("app.llm.cache.time.monotonic", return_value=111.0):
+            assert backend.get("a") is None
+
+    def test_hit_and_miss_counters(self):
+        cache = LLMCache(backend=InMemoryLRUBackend(8), ttl=60)
+        cache.get("missing")
+        cache.set("present", "value")
+        assert cache.get("present") == "value"
+        assert cache.stats() == {"hits": 1, "misses": 1}
+
+
+class TestPlannerCaching:
+    """Planner skips the LLM call for repeated deterministic prompts."""
+
+    def test_repeated_goal_uses_cached_response(self):
+        client = CountingLLMClient(PLAN_TEXT)
+        cache = LLMCache(backend=InMemoryLRUBackend(8), ttl=60)
+        goal = "Fetch the latest news headlines"
+
+        first = PlannerAgent(llm_client=client, cache=cache).plan(goal)
+        second = PlannerAgent(llm_client=client, cache=cache).plan(goal)
+
+        assert client.calls == 1
+        assert cache.hits == 1
+        assert [s.tool_name for s in first] == [s.tool_name for s in second]
+
+    def test_async_plan_shares_cached_response(self):
+        client = CountingLLMClient(PLAN_TEXT)
+        cache = LLMCache(backend=InMemoryLRUBackend(8), ttl=60)
+        goal = "Fetch the latest news headlines"
+
+        first = asyncio.run(PlannerAgent(llm_client=client, cache=cache).aplan(goal))
+        second = PlannerAgent(llm_client=client, cache=cache).plan(goal)
+
+        assert client.calls == 1
+        assert [s.tool_name for s in first] == [s.tool_name for s in second]
+
+    def test_async_plan_builds_llm_free_plans_off_the_event_loop(self):
+        client = CountingLLMClient(PLAN_TEXT)
+        cache = LLMCache(backend=InMemoryLRUBackend(8), ttl=60)
+        planner = PlannerAgent(llm_client=client, cache=cache)
+        plan_without_llm = planner._plan_without_llm
+        threads = []
+
+        def record_thread(*args):
+            threads.append(threading.current_thread())
+            return plan_without_llm(*args)
+
+        with patch.object(planner, "_plan_without_llm", side_effect=record_thread):
+            asyncio.run(planner.aplan("What is bitcoin?"))
+
+        assert client.calls == 0
+        assert threads and threads[0] is not threading.main_thread()
+
+    def test_equivalent_goal_reuses_plan_template(self):
+        client = CountingLLMClient(PLAN_TEXT)
+        cache = LLMCache(backend=InMemoryLRUBackend(8), ttl=60)
+        planner = PlannerAgent(llm_client=client, cache=cache)
+
+        planner.plan("Fetch the latest news headlines")
+        steps = planner.plan("Please fetch latest news headlines!")
+
+        assert client.calls == 1
+        assert steps[0].input_data["url"] == "https://example.com/news"
+        assert "Please fetch latest news headlines!" in steps[-1].input_data["question"]
+
+    def test_forget_plan_drops_template_and_cached_response(self):
+        client = CountingLLMClient(PLAN_TEXT)
+        cache = LLMCache(backend=InMemoryLRUBackend(8), ttl=60)
+        planner = PlannerAgent(llm_client=client, cache=cache)
+        goal = "Fetch the latest news headlines"
+
+        planner.plan(goal)
+        planner.forget_plan(goal)
+        planner.plan(goal)
+
+        assert client.calls == 2
+        assert cache.hits == 0
+
+    def test_static_instructions_are_shared_system_prefix(self):
+        client = CountingLLMClient(PLAN_TEXT)
+        planner = PlannerAgent(llm_client=client, cache=LLMCache(enabled=False))
+
+        planner.plan("Fetch the latest news headlines")
+        planner.plan("Fetch the current sports scores")
+
+        (system_a, user_a), (system_b, user_b) = client.messages
+        assert system_a["role"] == "system"
+        assert system_a["content"] == system_b["content"]
+        assert "Available tools" in system_a["content"]
+        assert user_a["content"].startswith("Goal: Fetch the latest news headlines")
+        assert user_b["content"].startswith("Goal: Fetch the current sports scores")
+
+    def test_unparseable_plan_is_not_cached(self):
+        client = CountingLLMClient("not a plan")
+        cache = LLMCache(backend=InMemoryLRUBackend(8), ttl=60)
+        planner = PlannerAgent(llm_client=client, cache=cache)
+
+        for _ in range(2):
+            try:
+                planner.plan("Fetch the latest news headlines")
+            except ValueError:
+                pass
+
+        assert client.calls == 2
+        assert cache.hits == 0
@@ -0,0 +1,62 @@
+"""Tests for the memory tool's shared store."""
+from concurrent.futures import ThreadPoolExecutor
+
+from app.tools.memory_tool import MemoryTool, ShardedStore
+
+
+class TestShardedStore:
+    """Keys are spread over locked shards, each bounded as an LRU."""
+
+    def test_concurrent_stores_are_all_retrievable(self):
+        tool = MemoryTool()
+        tool.clear()
+        keys = [f"key_{i}" for i in range(200)]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda key: tool.execute(action="store", key=key, value=key.upper()), keys))
+
+        outputs = [tool.execute(action="retrieve", key=key) for key in keys]
+        assert all(output.success for output in outputs)
+        assert [output.result["value"] for output in outputs] == [key.upper() for key in keys]
+        assert not tool.execute(action="retrieve", key="missing").success
+        tool.clear()
+
+    def test_shard_evicts_least_recently_stored_key(self):
+        store = ShardedStore(shards=1, max_entries=2)
+        store.set("a", 1)
+        store.set("b", 2)
+        store.set("a", 3)
+        store.set("c", 4)
+
+        assert "b" not in store
+        assert (store.get("a"), store.get("c"), len(store)) == (3, 4, 2)
+
+
+class TestBulkExecute:
+    """A batch of operations is validated once and applied in order."""
+
+    def test_store_then_retrieve_in_one_batch(self):
+        tool = MemoryTool()
+        tool.clear()
+
+        outputs = tool.bulk_execute([
+            {"action": "store", "key": "k", "value": {"test": "data"}},
+            {"action": "retrieve", "key": "k"},
+            {"action": "retrieve", "key": "missing"},
+        ])
+
+        assert [o.success for o in outputs] == [True, True, False]
+        assert outputs[1].result["value"] == {"test": "data"}
+        tool.clear()
+
+    def test_malformed_operation_fails_whole_batch(self):
+        tool = MemoryTool()
+        tool.clear()
+
+        outputs = tool.bulk_execute([
+            {"action": "store", "key": "k", "value": 1},
+            {"action": "store"},
+        ])
+
+        assert [o.success for o in outputs] == [False, False]
+        assert not tool.execute(action="retrieve", key="k").success
@@ -0,0 +1,182 @@
+"""Tests for reusable plan templates."""
+
+import json
+
+import pytest
+
+from app.agents.plan_cache import PlanCache, get_plan_cache
+from app.schemas.request_response import ExecutionStep
+
+
+def _plan(goal, url="https://example.com/news"):
+    return [
+        ExecutionStep(
+            step_number=1,
+            description="Fetch headlines",
+            tool_name="http",
+            input_data={"method": "GET", "url": url},
+        ),
+        ExecutionStep(
+            step_number=2,
+            description="Summarize",
+            tool_name="reasoning",
+            input_data={"question": f"Summarize for: {goal}"},
+        ),
+    ]
+
+
+class TestPlanCache:
+    """Plans are matched on goal keywords and rebound to the new goal."""
+
+    def test_similar_goal_reuses_plan_with_new_goal_text(self):
+        cache = PlanCache(similarity_threshold=0.6)
+        goal = "Fetch latest news headlines today"
+        cache.store(goal, "mixed", {}, _plan(goal))
+
+        steps = cache.lookup("Fetch latest news headlines now", "mixed", {})
+
+        assert steps is not None
+        assert steps[0].input_data["url"] == "https://example.com/news"
+        assert steps[1].input_data["question"] == "Summarize for: Fetch latest news headlines now"
+
+    def test_keyword_used_in_tool_input_blocks_fuzzy_match(self):
+        cache = PlanCache(similarity_threshold=0.5)
+        goal = "Fetch weather forecast paris"
+        cache.store(goal, "tool_required", {}, _plan(goal, url="https://wttr.in/paris"))
+
+        assert cache.lookup("Fetch weather forecast london", "tool_required", {}) is None
+        assert cache.lookup("Fetch weather forecast paris", "mixed", {}) is None
+
+    def test_reordered_keywords_do_not_reuse_plan(self):
+        cache = PlanCache(similarity_threshold=0.6)
+        goal = "Convert usd to eur"
+        cache.store(goal, "tool_required", {}, _plan(goal, url="https://api.frankfurter.app/latest?from=USD&to=EUR"))
+
+        assert cache.lookup("convert eur to usd", "tool_required", {}) is None
+        steps = cache.lookup("Please convert USD to EUR", "tool_required", {})
+        assert steps is not None and "from=USD&to=EUR" in steps[0].input_data["url"]
+
+    @pytest.mark.parametrize("stored, query, url", [
+        ("What is -5 + 3", "What is 5 - 3", "https://api.mathjs.org/v4/?expr=-5%2B3"),
+        ("Get the price of BRK.A", "Get the price of BRK/A", "https://example.com/quote?symbols=BRK.A"),
+        ("Weather at lat 40.7 lon -74.0", "Weather at lat 40.7 lon 74.0", "https://example.com/w?lat=40.7&lon=-74.0"),
+    ])
+    def test_goals_differing_only_in_symbols_do_not_share_a_plan(self, stored, query, url):
+        cache = PlanCache()
+        cache.store(stored, "tool_required", {}, _plan(stored, url=url))
+
+        assert cache.lookup(query, "tool_required", {}) is None
+        assert cache.lookup(stored, "tool_required", {}) is not None
+
+    def test_sign_change_in_reasoning_input_is_not_reused(self):
+        cache = PlanCache()
+        goal = "What is -5 + 3"
+        steps = [ExecutionStep(step_number=1, description="Compute", tool_name="reasoning",
+                               input_data={"question": "Compute -5 + 3"})]
+        cache.store(goal, "reasoning_only", {}, steps)
+
+        assert cache.lookup("What is 5 - 3", "reasoning_only", {}) is None
+        assert cache.lookup("what is -5 + 3?", "reasoning_only", {}) is not None
+
+    def test_same_goal_under_many_contexts_still_matches(self):
+        cache = PlanCache(similarity_threshold=0.6)
+        goal = "Fetch latest news headlines today"
+        users = [f"user{i}" for i in range(12)]
+        for user in users:
+            cache.store(goal, "mixed", {"user": user}, _plan(goal))
+
+        for user in users:
+            assert cache.lookup("Fetch latest news headlines now", "mixed", {"user": user}) is not None
+
+    def test_evicted_rows_are_reused_for_new_templates(self):
+        cache = PlanCache(max_entries=2, similarity_threshold=0.6)
+        goals = ["Fetch latest news headlines", "Fetch latest sports scores", "Fetch latest stock quotes"]
+        for goal in goals:
+            cache.store(goal, "mixed", {}, _plan(goal))
+
+        assert len(cache) == 2
+        assert cache.lookup("Fetch latest news headlines today", "mixed", {}) is None
+        assert cache.lookup("Fetch latest stock quotes now", "mixed", {}) is not None
+
+    def test_invalidate_drops_template(self):
+        cache = PlanCache()
+        goal = "Fetch the latest news headlines"
+        cache.store(goal, "mixed", {}, _plan(goal))
+
+        assert cache.invalidate("Please fetch latest news headlines", "mixed", {})
+        assert cache.lookup(goal, "mixed", {}) is None
+
+    def test_templates_persist_to_disk(self, tmp_path):
+        path = tmp_path / "plans.json"
+        goal = "Fetch the latest news headlines"
+        cache = PlanCache(path=str(path))
+        cache.store(goal, "mixed", {"region": "us"}, _plan(goal))
+        cache.flush()
+
+        steps = PlanCache(path=str(path)).lookup(goal, "mixed", {"region": "us"})
+
+        assert steps is not None and [s.tool_name for s in steps] == ["http", "reasoning"]
+        assert [p.name for p in tmp_path.iterdir()] == ["plans.json"]
+
+    def test_writes_are_deferred_until_flush(self, tmp_path):
+        path = tmp_path / "plans.json"
+        cache = PlanCache(path=str(path), persist_delay=60)
+        for region in ("us", "eu", "in"):
+            goal = f"Fetch the latest news headlines for {region}"
+            cache.store(goal, "mixed", {"region": region}, _plan(goal))
+
+        assert not path.exists()
+        cache.flush()
+        assert len(PlanCache(path=str(path))) == 3
+
+    def test_writers_sharing_a_file_keep_each_others_templates(self, tmp_path):
+        path = tmp_path / "plans.json"
+        first, second = PlanCache(path=str(path)), PlanCache(path=str(path))
+        news, sports = "Fetch the latest news headlines", "Fetch the latest sports scores"
+        first.store(news, "mixed", {}, _plan(news))
+        first.flush()
+        second.store(sports, "mixed", {}, _plan(sports))
+        second.flush()
+
+        reloaded = PlanCache(path=str(path))
+        assert reloaded.lookup(news, "mixed", {}) is not None
+        assert reloaded.lookup(sports, "mixed", {}) is not None
+
+    def test_invalidated_template_is_not_merged_back(self, tmp_path):
+        path = tmp_path / "plans.json"
+        goal = "Fetch the latest news headlines"
+        cache = PlanCache(path=str(path))
+        cache.store(goal, "mixed", {}, _plan(goal))
+        cache.flush()
+
+        assert cache.invalidate(goal, "mixed", {})
+        cache.flush()
+
+        assert len(PlanCache(path=str(path))) == 0
+
+    def test_default_cache_is_shared_per_path(self, tmp_path):
+        path = str(tmp_path / "plans.json")
+
+        assert get_plan_cache(path) is get_plan_cache(path)
+        assert get_plan_cache(None) is not get_plan_cache(None)
+
+    @pytest.mark.parametrize("contents", [
+        '{"not": "a list"}',
+        '[{"intent": "mixed"}, 42, {"intent": "mixed", "context": [["a"]], "keywords": [], "goal": "x", "steps": []}]',
+    ])
+    def test_malformed_cache_file_is_skipped(self, tmp_path, contents):
+        path = tmp_path / "plans.json"
+        path.write_text(contents, encoding="utf-8")
+
+        assert len(PlanCache(path=str(path))) == 0
+
+    def test_malformed_entries_do_not_drop_valid_ones(self, tmp_path):
+        path = tmp_path / "plans.json"
+        goal = "Fetch the latest news headlines"
+        cache = PlanCache(path=str(path))
+        cache.store(goal, "mixed", {"region": "us"}, _plan(goal))
+        cache.flush()
+        entries = json.loads(path.read_text(encoding="utf-8"))
+        path.write_text(json.dumps([{"goal": "broken"}] + entries), encoding="utf-8")
+
+        assert PlanCache(path=str(path)).lookup(goal, "mixed", {"region": "us"}) is not None
@@ -0,0 +1,147 @@
+"""Tests for planner-side tool input validation and repair."""
+
+import json
+
+import pytest
+
+from app.agents.planner import PlannerAgent, _PlanStreamScanner
+from app.llm.cache import InMemoryLRUBackend, LLMCache
+from app.llm.client import BaseLLMClient, LLMResponse, _parse_json_flexible
+from app.schemas.request_response import ExecutionStep
+
+
+class ScriptedLLMClient(BaseLLMClient):
+    """LLM stub that returns queued responses and records prompts."""
+
+    def __init__(self, *responses: str):
+        self.responses = list(responses)
+        self.prompts = []
+
+    def call(self, messages, temperature=0.7, max_tokens=None):
+        self.prompts.append(messages[-1]["content"])
+        return LLMResponse(content=self.responses.pop(0))
+
+    def parse_json(self, text):
+        return _parse_json_flexible(text)
+
+
+def _planner(client):
+    """Planner with its own response cache so tests don't share repairs."""
+    return PlannerAgent(llm_client=client, cache=LLMCache(backend=InMemoryLRUBackend(8), ttl=60))
+
+
+def _reasoning_step(step_number, question):
+    return ExecutionStep(
+        step_number=step_number,
+        description="Internal reasoning",
+        tool_name="reasoning",
+        input_data={"question": question},
+    )
+
+
+class TestBatchRepair:
+    """Broken steps are repaired with one LLM call, not one per step."""
+
+    def test_multiple_invalid_steps_use_single_llm_call(self):
+        client = ScriptedLLMClient(json.dumps({
+            "1": {"question": "What is A?"},
+            "2": {"question": "What is B?"},
+        }))
+        planner = _planner(client)
+        steps = [_reasoning_step(1, 123), _reasoning_step(2, 456)]
+
+        repaired = planner._validate_and_repair_steps("Compare A and B", {}, steps, "mixed")
+
+        assert len(client.prompts) == 1
+        assert "Step 1:" in client.prompts[0] and "Step 2:" in client.prompts[0]
+        assert [s.input_data["question"] for s in repaired] == ["What is A?", "What is B?"]
+
+    def test_batch_misses_fall_back_to_per_step_repair(self):
+        client = ScriptedLLMClient(
+            json.dumps({"1": {"question": "What is A?"}}),
+            json.dumps({"question": "What is B?"}),
+        )
+        planner = _planner(client)
+        steps = [_reasoning_step(1, 123), _reasoning_step(2, 456)]
+
+        repaired = planner._validate_and_repair_steps("Compare A and B", {}, steps, "mixed")
+
+        assert len(client.prompts) == 2
+        assert [s.input_data["question"] for s in repaired] == ["What is A?", "What is B?"]
+
+    def test_identical_repair_is_served_from_cache(self):
+        client = ScriptedLLMClient(json.dumps({"question": "What is A?"}))
+        planner = _planner(client)
+
+        for _ in range(2):
+            repaired = planner._validate_and_repair_steps("Explain A", {}, [_reasoning_step(1, 123)], "mixed")
+
+        assert len(client.prompts) == 1
+        assert repaired[0].input_data["question"] == "What is A?"
+
+    def test_valid_steps_make_no_llm_calls(self):
+        client = ScriptedLLMClient()
+        planner = _planner(client)
+        steps = [_reasoning_step(1, "What is A?"), _reasoning_step(2, "What is B?")]
+
+        planner._validate_and_repair_steps("Compare A and B", {}, steps, "mixed")
+
+        assert client.prompts == []
+
+
+class TestStreamedPlanning:
+    """Streamed plans are scanned step by step and abort on unknown tools."""
+
+    def test_scanner_yields_steps_across_chunk_boundaries(self):
+        text = 'Plan:\n```json\n[{"tool_name": "reasoning", "input_data": {"question": "a } b"}}, {"tool_name": "http"}]\n```'
+        scanner = _PlanStreamScanner()
+        completed = []
+        for index in range(0, len(text), 7):
+            completed.extend(scanner.feed(text[index:index + 7]))
+
+        assert [json.loads(item)["tool_name"] for item in completed] == ["reasoning", "http"]
+
+    def test_unknown_tool_stops_stream_early(self):
+        consumed = []
+
+        class StreamingClient(ScriptedLLMClient):
+            def stream(self, messages, temperature=0.7, max_tokens=None):
+                for chunk in ['[{"tool_name": "teleport", "input_data": {}}', ', {"tool_name": "http"}]']:
+                    consumed.append(chunk)
+                    yield chunk
+
+        planner = PlannerAgent(llm_client=StreamingClient())
+
+        with pytest.raises(ValueError, match="teleport"):
+            planner._stream_plan_text([{"role": "user", "content": "plan"}], 0.3)
+
+        assert len(consumed) == 1
+
+
+class TestParseJsonFlexible:
+    """LLM output is parsed from the first balanced JSON object, else the first array."""
+
+    def test_array_wrapped_in_prose_is_extracted_whole(self):
+        text = 'Here is the plan: [{"tool_name": "reasoning", "input_data": {"question": "a ] b"}}, {"tool_name": "http"}] Hope it helps {'
+
+        parsed = _parse_json_flexible(text)
+
+        assert [step["tool_name"] for step in parsed] == ["reasoning", "http"]
+
+    def test_escaped_quotes_do_not_end_strings(self):
+        text = 'Result: {"answer": "use \\"}\\" to close", "ok": true} trailing ]'
+
+        assert _parse_json_flexible(text) == {"answer": 'use "}" to close', "ok": True}
+
+    def test_unparseable_block_moves_on_to_next_candidate(self):
+        assert _parse_json_flexible('Use {placeholders} like this: {"ok": true}') == {"ok": True}
+
+    def test_object_is_preferred_over_an_earlier_array(self):
+        text = 'Uses tools ["http"] then {"steps": [{"tool_name": "http"}]}'
+
+        assert _parse_json_flexible(text) == {"steps": [{"tool_name": "http"}]}
+
+    def test_unclosed_block_moves_on_to_next_candidate(self):
+        text = 'Note: the {"draft" was cut... final answer {"ok": true}'
+
+        assert _parse_json_flexible(text) == {"ok": True}
@@ -230,6 +230,33 @@ class TestReasoningGrounding:
         formatted = tool._format_context(string_context)
         
         assert formatted == "Context: This is generic context"
+
+    def test_reasoning_prompt_reuses_shared_system_message(self):
+        """The cached system message is sent by reference and left unchanged."""
+        from app.llm.client import LLMResponse
+        from app.tools.reasoning_tool import ReasoningTool, _SYSTEM_MESSAGE
+
+        original = dict(_SYSTEM_MESSAGE)
+        llm = Mock()
+        llm.call.return_value = LLMResponse(content="Recursion is self-reference.")
+        tool = ReasoningTool(llm_client=llm)
+
+        result = tool.execute(question="What is recursion?", context="Audience: beginners")
+
+        messages = llm.call.call_args[0][0]
+        assert result.success
+        assert messages[0] is _SYSTEM_MESSAGE and _SYSTEM_MESSAGE == original
+        assert messages[1]["content"] == "Question: What is recursion?\n\nContext: Audience: beginners"
+
+    def test_llm_client_can_be_assigned(self):
+        """Tests and callers can swap the client on an existing tool."""
+        from app.tools.reasoning_tool import ReasoningTool
+
+        tool = ReasoningTool()
+        client = Mock()
+        tool.llm = client
+
+        assert tool.llm is client
     
     def test_reasoning_grounding_with_memory_tool(self):
         """Test that reasoning can be grounded in memory tool output."""
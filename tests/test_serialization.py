@@ -0,0 +1,21 @@
+"""Tests for the orjson-backed JSON helpers."""
+import pytest
+
+from app.core import serialization
+
+
+class TestLoads:
+    """Parsing matches the stdlib for values orjson cannot represent."""
+
+    @pytest.mark.parametrize("data, expected", [
+        ('{"id": 123456789012345678901234567890}', {"id": 123456789012345678901234567890}),
+        (b'{"id": 123456789012345678901234567890}', {"id": 123456789012345678901234567890}),
+        ("[-9223372036854775809, 18446744073709551616]", [-9223372036854775809, 18446744073709551616]),
+    ])
+    def test_integers_beyond_64_bits_stay_exact(self, data, expected):
+        assert serialization.loads(data) == expected
+
+    def test_regular_documents_round_trip(self):
+        payload = {"id": 42, "price": 1.5, "tags": ["a", "b"], "nested": {"ok": True}}
+
+        assert serialization.loads(serialization.dumps(payload)) == payload